@@ -5,7 +5,14 @@ Configurações do jogo MathShape Quest
 # Configurações da janela
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
-FPS = 60
+FPS = 60  # Limite de FPS; 0 = sem limite (benchmark)
+FPS_BUSY_LOOP = False  # Usa clock.tick_busy_loop: ritmo mais preciso, ao custo de um núcleo ocupado
+SIMULATION_RATE = 60  # Passos fixos de simulação por segundo (independente do FPS)
+MAX_SIMULATION_STEPS = 5  # Máximo de passos por frame; o atraso excedente é descartado
+RENDER_INTERPOLATION = True  # Desenha a auto-rotação interpolada entre dois passos da simulação
+# Menu, tutorial, pausa e game over dormem à espera de eventos e só redesenham se algo mudar
+IDLE_WAIT = True
+IDLE_EVENT_TIMEOUT = 500  # Espera máxima por um evento nas telas paradas (ms)
 TITLE = "MathShape Quest - Aventura das Formas Geométricas"
 
 # Cores
@@ -36,6 +43,21 @@ NEAR_PLANE = 0.1
 FAR_PLANE = 1000.0
 FOV = 90  # Field of view em graus
 ENABLE_BACKFACE_CULLING = False  # Se False, mostra bases dos objetos
+# 'painter' (ordenação por profundidade) ou 'zbuffer' (framebuffer NumPy)
+RASTERIZER_BACKEND = 'painter'
+PHONG_PER_PIXEL = False  # Phong por pixel via G-buffer (requer o backend 'zbuffer')
+PHONG_HALF_RESOLUTION = True  # Ilumina o G-buffer em blocos 2x2 (cabe nos 16 ms em 1280x720)
+# Threads do rasterizador 'zbuffer' por tiles; None = núcleos da CPU, 1 = sem threads
+RASTER_WORKERS = None
+# Lado (px) dos tiles rasterizados em paralelo; None = faixas verticais, duas por thread
+RASTER_TILE_SIZE = None
+# Desenha a cena 3D em uma thread separada a partir de snapshots (double buffer)
+THREADED_RENDERING = False
+# Diretório para gravar as malhas geradas em .npz (ex.: 'cache/meshes'); None = só memória
+MESH_CACHE_DIR = None
+LOD_LEVELS = 3  # Níveis de detalhe por primitiva curva (o mais detalhado é o do construtor)
+LOD_SCREEN_RADII = (24, 8)  # Raio projetado mínimo (px) de cada nível; abaixo, o mais simples
+LOD_HYSTERESIS = 0.2  # Margem relativa em torno de cada limiar para evitar trocas a cada frame
 
 # Configurações de iluminação
 AMBIENT_LIGHT = 0.2
@@ -54,6 +76,10 @@ MAX_LIVES = 3
 POINTS_PER_CORRECT = 100
 POINTS_PER_LEVEL = 500
 TIME_LIMIT = 300  # segundos
+TRANSFORM_HISTORY_LIMIT = 1000  # Máximo de entradas no histórico de cada objeto (None = sem limite)
+# Guarda transformações como translação/quaternion/escala (matriz composta sob demanda;
+# a matriz fica somente leitura, por isso é opcional)
+TRANSFORM_DECOMPOSED = False
 
 # Modelos de iluminação disponíveis
 SHADING_MODELS = {
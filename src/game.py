@@ -4,18 +4,27 @@ Loop principal do jogo MathShape Quest
 
 import pygame
 import sys
+import time
 from enum import Enum
 
 try:
     from .core.config import *
-    from .rendering import Camera, Renderer, Light, create_shading_model
+    from .rendering import (
+        Camera, Renderer, Light, RenderThread, create_shading_model, scene_fingerprint,
+        take_snapshot
+    )
     from .game_logic import Player, LevelManager
     from .ui import Menu, MenuState, HUD, Tutorial
+    from .utils.time_utils import FixedTimestep
 except ImportError:
     from core.config import *
-    from rendering import Camera, Renderer, Light, create_shading_model
+    from rendering import (
+        Camera, Renderer, Light, RenderThread, create_shading_model, scene_fingerprint,
+        take_snapshot
+    )
     from game_logic import Player, LevelManager
     from ui import Menu, MenuState, HUD, Tutorial
+    from utils.time_utils import FixedTimestep
 
 
 class GameState(Enum):
@@ -29,6 +38,10 @@ class GameState(Enum):
     TUTORIAL = "tutorial"  # Tela de tutorial/como jogar
 
 
+# Telas paradas: com IDLE_WAIT, o loop dorme à espera de eventos e só redesenha quando algo muda
+IDLE_STATES = (GameState.MENU, GameState.TUTORIAL, GameState.PAUSED, GameState.GAME_OVER)
+
+
 class Game:
     """Classe principal do jogo"""
 
@@ -43,10 +56,17 @@ class Game:
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption(TITLE)
 
-        # Clock para FPS
+        # Clock para FPS e simulação com passo fixo
         self.clock = pygame.time.Clock()
         self.running = True
         self.dt = 0
+        self.timestep = FixedTimestep(SIMULATION_RATE, MAX_SIMULATION_STEPS)
+        self._last_frame_time = None
+
+        # Redesenho sob demanda nas telas paradas
+        self._view_state = None  # Aparência da tela no último desenho
+        self._idle_frame = False  # Último frame sem eventos nem mudanças: o próximo pode dormir
+        self._frozen_game = None  # Cena 3D (com HUD) congelada sob a pausa e o game over
 
         # Estado do jogo
         self.state = GameState.MENU
@@ -59,9 +79,14 @@ class Game:
         self.tutorial = Tutorial(WINDOW_WIDTH, WINDOW_HEIGHT)
 
         # Renderização 3D
-        self.renderer = Renderer(self.window_width, self.window_height)
+        self.renderer = Renderer(self.window_width, self.window_height, RASTERIZER_BACKEND,
+                                 half_resolution_shading=PHONG_HALF_RESOLUTION)
         self.renderer.set_surface(self.screen)
 
+        # Thread de renderização opcional (desenha a cena 3D a partir de snapshots)
+        self.render_thread = RenderThread(self.renderer) if THREADED_RENDERING else None
+        self._submitted_scene = None  # Resumo da cena do último snapshot enviado à thread
+
         # Câmera
         self.camera = Camera(
             position=[CAMERA_DISTANCE, CAMERA_HEIGHT, CAMERA_DISTANCE],
@@ -79,7 +104,7 @@ class Game:
 
         # Modelo de iluminação atual
         self.shading_models = {
-            'phong': create_shading_model('phong'),
+            'phong': create_shading_model('phong', per_pixel=PHONG_PER_PIXEL),
             'lambertian': create_shading_model('lambertian'),
             'gouraud': create_shading_model('gouraud')
         }
@@ -99,7 +124,7 @@ class Game:
 
         # Auto-rotação dos objetos
         self.auto_rotate = True
-        self.rotation_speed = 0.5
+        self.rotation_speed = 30.0  # Graus por segundo
 
         # Modo treino
         self.training_shapes = []
@@ -110,26 +135,109 @@ class Game:
         """Loop principal do jogo"""
         while self.running:
             # Delta time
-            self.dt = self.clock.tick(FPS) / 1000.0
+            self.dt = self.tick()
 
-            # Eventos
-            self.handle_events()
+            # Eventos (numa tela parada que não mudou, dorme até o próximo)
+            events = self.wait_events() if self._idle_frame else pygame.event.get()
+            self.handle_events(events)
 
-            # Update
+            # Update (lógica e interface, uma vez por frame)
             self.update()
 
-            # Draw
-            self.draw()
+            # Simulação com passo fixo (animações independentes do FPS)
+            for _ in range(self.timestep.advance(self.dt)):
+                self.fixed_update(self.timestep.step)
+
+            # Draw (telas paradas só são redesenhadas quando algo muda)
+            if self.needs_redraw(events):
+                self.draw()
 
-            # Atualiza display
-            pygame.display.flip()
+                # Atualiza display
+                pygame.display.flip()
 
+        if self.render_thread is not None:
+            self.render_thread.stop()
         pygame.quit()
         sys.exit()
 
-    def handle_events(self):
-        """Processa eventos"""
-        for event in pygame.event.get():
+    def tick(self):
+        """
+        Espera o próximo frame conforme o limite de FPS
+        FPS = 0 desliga o limite (benchmark); FPS_BUSY_LOOP usa tick_busy_loop,
+        mais preciso que o sleep do tick comum.
+        Returns:
+            Tempo real decorrido desde o frame anterior, em segundos
+        """
+        if FPS_BUSY_LOOP and FPS:
+            self.clock.tick_busy_loop(FPS)
+        else:
+            self.clock.tick(FPS)
+
+        # O clock mede em milissegundos inteiros; perf_counter evita o arredondamento
+        now = time.perf_counter()
+        frame_time = 0.0 if self._last_frame_time is None else now - self._last_frame_time
+        self._last_frame_time = now
+        return frame_time
+
+    def wait_events(self):
+        """
+        Dorme até chegar um evento (ou IDLE_EVENT_TIMEOUT), sem gastar CPU
+        O tempo dormindo não entra no delta time do próximo frame.
+        Returns:
+            Lista de eventos pendentes (vazia se o tempo esgotou)
+        """
+        event = pygame.event.wait(IDLE_EVENT_TIMEOUT)
+        self._last_frame_time = time.perf_counter()
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def is_idle(self):
+        """Tela parada: estado sem animação, em que o loop pode dormir à espera de eventos"""
+        return IDLE_WAIT and self.state in IDLE_STATES and not self.animated_shapes()
+
+    def view_state(self):
+        """
+        Resumo da aparência da tela (estado, tamanho e o que está sob o mouse)
+        Returns:
+            Tupla comparável: se for igual à do último desenho, a tela não mudou
+        """
+        if self.state == GameState.TUTORIAL:
+            ui = self.tutorial.view_state(pygame.mouse.get_pos())
+        elif self.state in IDLE_STATES:
+            ui = self.menu.view_state()
+        else:
+            ui = None
+        return (self.state, self.window_width, self.window_height, ui)
+
+    def needs_redraw(self, events):
+        """
+        Decide se o frame precisa ser desenhado e se o próximo pode dormir
+        Fora das telas paradas, sempre redesenha; nelas, só depois de um evento
+        que não seja movimento do mouse ou se a aparência (estado, página,
+        hover) mudou. O loop só dorme depois de um frame sem eventos nem
+        mudanças, então o menu ainda vê o botão do mouse ser solto.
+        Args:
+            events: Eventos processados neste frame
+        Returns:
+            True se o frame deve ser desenhado
+        """
+        view = self.view_state()
+        clicked = any(event.type != pygame.MOUSEMOTION for event in events)
+        changed = clicked or view != self._view_state
+        self._view_state = view
+
+        idle = self.is_idle()
+        self._idle_frame = idle and not changed and not events
+        return changed or not idle
+
+    def handle_events(self, events):
+        """
+        Processa eventos
+        Args:
+            events: Lista de eventos do pygame
+        """
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -333,19 +441,57 @@ class Game:
             level_num = int(action.split('_')[-1])
             self.start_game(level_num - 1)
 
+    def fixed_update(self, step):
+        """
+        Avança as animações em um passo fixo da simulação
+        Args:
+            step: Duração do passo em segundos
+        """
+        angle = self.rotation_speed * step
+        for shape in self.animated_shapes():
+            shape.rotate_y(angle, animated=True)
+
+    def animated_shapes(self):
+        """Formas com auto-rotação ativa no estado atual"""
+        if not self.auto_rotate:
+            return []
+
+        if self.state == GameState.PLAYING and self.player.lives > 0:
+            level = self.level_manager.get_current_level()
+            return list(level.shapes) if level else []
+
+        if self.state == GameState.TRAINING and len(self.training_shapes) > 0:
+            return [self.training_shapes[self.current_shape_index]]
+
+        return []
+
+    def interpolated_shapes(self, shapes):
+        """
+        Formas a desenhar entre dois passos da simulação
+        Com RENDER_INTERPOLATION, a auto-rotação avança a fração já decorrida do
+        próximo passo em cópias de renderização (Shape3D.snapshot), o que suaviza
+        a animação quando o FPS é maior que SIMULATION_RATE.
+        """
+        alpha = self.timestep.alpha
+        if not RENDER_INTERPOLATION or alpha <= 0:
+            return shapes
+
+        animated = {id(shape) for shape in self.animated_shapes()}
+        if not animated:
+            return shapes
+
+        angle = self.rotation_speed * self.timestep.step * alpha
+        return [
+            shape.snapshot().rotate_y(angle) if id(shape) in animated else shape
+            for shape in shapes
+        ]
+
     def update_playing(self):
         """Atualiza gameplay"""
         # Verifica se ainda tem vidas (proteção contra game over)
         if self.player.lives <= 0:
             return
 
-        # Auto-rotação dos objetos
-        if self.auto_rotate:
-            level = self.level_manager.get_current_level()
-            if level:
-                for shape in level.shapes:
-                    shape.rotate_y(self.rotation_speed)
-
         # Verifica se o nível foi completo
         level = self.level_manager.get_current_level()
         if level and level.is_completed():
@@ -403,44 +549,72 @@ class Game:
         elif self.state == GameState.PLAYING:
             self.draw_game()
         elif self.state == GameState.PAUSED:
-            self.draw_game()  # Desenha jogo em baixo
+            self.draw_frozen_game()  # Desenha jogo em baixo
             self.menu.draw(self.screen)  # Menu por cima
         elif self.state == GameState.GAME_OVER:
-            self.draw_game()  # Desenha jogo em baixo (desfocado)
+            self.draw_frozen_game()  # Desenha jogo em baixo (desfocado)
             self.menu.draw(self.screen)  # Tela de Game Over por cima
         elif self.state == GameState.TRAINING:
             self.draw_training()
         elif self.state == GameState.TUTORIAL:
             self.tutorial.draw(self.screen)
 
+        # O jogo congelado só vale enquanto a pausa ou o game over estiverem na tela
+        if self.state != GameState.PAUSED and self.state != GameState.GAME_OVER:
+            self._frozen_game = None
+
+    def draw_frozen_game(self):
+        """
+        Desenha o jogo parado sob a pausa e o game over
+        A cena é renderizada uma vez ao entrar no estado e guardada em uma
+        superfície; os redesenhos seguintes (hover no menu) só a copiam.
+        """
+        if self._frozen_game is None:
+            self.draw_game()
+            self._frozen_game = self.screen.copy()
+        else:
+            self.screen.blit(self._frozen_game, (0, 0))
+
+    def draw_3d(self, shapes, shading_model):
+        """
+        Desenha a cena 3D na tela (uma única fila de triângulos para a cena inteira)
+        Se nada na cena mudou desde o frame anterior, a imagem anterior é
+        reaproveitada e só o HUD é redesenhado por cima. Com a thread de
+        renderização, publica um snapshot quando a cena muda e copia para a
+        tela o último frame que ela completou.
+        Args:
+            shapes: Objetos do jogo (a interpolação é aplicada aqui)
+            shading_model: Modelo de iluminação
+        """
+        # LOD escolhido nos objetos do jogo antes da interpolação: as cópias
+        # interpoladas já nascem com a malha certa e a histerese vale entre frames
+        self.renderer.select_lod(shapes, self.camera)
+        shapes = self.interpolated_shapes(shapes)
+
+        if self.render_thread is None:
+            self.renderer.render_frame(shapes, self.camera, shading_model, self.light, BG_COLOR)
+            return
+
+        # O LOD já foi escolhido acima, então o snapshot não troca malhas
+        fingerprint = scene_fingerprint(shapes, self.camera, shading_model, self.light, BG_COLOR)
+        if fingerprint != self._submitted_scene:
+            self.render_thread.submit(take_snapshot(
+                shapes, self.camera, self.light, shading_model, BG_COLOR
+            ))
+            self._submitted_scene = fingerprint
+        self.render_thread.blit_latest(self.screen, BG_COLOR)
+
     def draw_game(self):
         """Desenha o gameplay"""
-        # Limpa a tela
-        self.renderer.clear(BG_COLOR)
-
         # Pega nível atual
         level = self.level_manager.get_current_level()
         if not level:
+            self.screen.fill(BG_COLOR)
             return
 
         # Renderiza objetos 3D
         shading_model = self.shading_models[self.current_shading]
-
-        for shape in level.shapes:
-            vertices = shape.get_vertices()
-            faces = shape.get_faces()
-            normals = shape.get_normals()
-            color = shape.get_color()
-
-            self.renderer.draw_mesh(
-                vertices,
-                faces,
-                normals,
-                self.camera,
-                shading_model,
-                self.light,
-                color
-            )
+        self.draw_3d(level.shapes, shading_model)
 
         # Desenha HUD
         current_puzzle = self.get_current_puzzle()
@@ -754,11 +928,18 @@ class Game:
             self.screen = pygame.display.set_mode((self.window_width, self.window_height))
 
         # Atualiza o renderer
-        self.renderer = Renderer(self.window_width, self.window_height)
+        if self.render_thread is not None:
+            self.render_thread.stop()
+        self.renderer = Renderer(self.window_width, self.window_height, self.renderer.backend,
+                                 half_resolution_shading=self.renderer.half_resolution_shading)
         self.renderer.set_surface(self.screen)
+        if self.render_thread is not None:
+            self.render_thread = RenderThread(self.renderer)
+            self._submitted_scene = None
 
         # Atualiza a câmera
         self.camera.aspect = self.window_width / self.window_height
+        self._frozen_game = None
 
         # Atualiza menu e HUD
         self.menu = Menu(self.window_width, self.window_height)
@@ -801,36 +982,15 @@ class Game:
         # Modo treino iniciado (sem mensagem)
 
     def update_training(self):
-        """Atualiza modo treino"""
-        # Auto-rotação da forma atual
-        if self.auto_rotate and len(self.training_shapes) > 0:
-            current_shape = self.training_shapes[self.current_shape_index]
-            current_shape.rotate_y(self.rotation_speed)
+        """Atualiza modo treino (a auto-rotação da forma atual é feita em fixed_update)"""
 
     def draw_training(self):
         """Desenha modo treino (com a mesma aparência do jogo normal)"""
-        # Limpa a tela
-        self.renderer.clear(BG_COLOR)
-
         # Renderiza forma atual
+        shapes = []
         if len(self.training_shapes) > 0:
-            shape = self.training_shapes[self.current_shape_index]
-            shading_model = self.shading_models[self.current_shading]
-
-            vertices = shape.get_vertices()
-            faces = shape.get_faces()
-            normals = shape.get_normals()
-            color = shape.get_color()
-
-            self.renderer.draw_mesh(
-                vertices,
-                faces,
-                normals,
-                self.camera,
-                shading_model,
-                self.light,
-                color
-            )
+            shapes = [self.training_shapes[self.current_shape_index]]
+        self.draw_3d(shapes, self.shading_models[self.current_shading])
 
         # Usa o HUD padrão do jogo, mas sem puzzle
         # Cria um "pseudo-level" para o HUD
@@ -2,7 +2,8 @@
 Módulo de objetos 3D
 """
 
+from .mesh import Mesh
 from .shape3d import Shape3D
 from .primitives import Cube, Pyramid, Sphere, Cylinder, Torus
 
-__all__ = ['Shape3D', 'Cube', 'Pyramid', 'Sphere', 'Cylinder', 'Torus']
+__all__ = ['Mesh', 'Shape3D', 'Cube', 'Pyramid', 'Sphere', 'Cylinder', 'Torus']
@@ -0,0 +1,264 @@
+"""
+Geometria imutável e compartilhável (flyweight) dos objetos 3D
+"""
+
+import numpy as np
+from collections import namedtuple
+
+
+# Representação compactada das faces (pré-compilada na construção)
+PackedFaces = namedtuple('PackedFaces', [
+    'triangles', 'triangle_faces', 'face_indices', 'face_sizes'
+])
+
+
+def _read_only(array):
+    """Marca um array como somente leitura (pode ser exposto sem cópia) e o retorna"""
+    array.flags.writeable = False
+    return array
+
+
+def pack_faces(faces):
+    """
+    Pré-compila faces poligonais (listas irregulares) em arrays contíguos
+    Cada face é triangulada em leque a partir do seu primeiro vértice.
+    Args:
+        faces: Lista de faces (cada face é lista de índices de vértices) ou
+               array (F, k) de faces com k vértices cada
+    Returns:
+        PackedFaces com:
+        - triangles: Array (T, 3) int32 com os índices de cada triângulo
+        - triangle_faces: Array (T,) int32 com a face de origem de cada triângulo
+        - face_indices: Array int32 com os índices de todas as faces concatenados
+        - face_sizes: Array (F,) int32 com o número de vértices de cada face
+    """
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        # Faces uniformes já em array: sem passar por listas Python
+        face_sizes = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        face_indices = np.array(faces, dtype=np.int32).reshape(-1)
+    else:
+        face_sizes = np.fromiter((len(face) for face in faces), dtype=np.int32, count=len(faces))
+        face_indices = np.fromiter(
+            (index for face in faces for index in face), dtype=np.int32, count=int(face_sizes.sum())
+        )
+
+    return pack_face_arrays(face_indices, face_sizes)
+
+
+def pack_face_arrays(face_indices, face_sizes):
+    """
+    Pré-compila faces já em formato CSR (índices concatenados + tamanhos)
+    Útil para geradores vetorizados com faces de tamanhos diferentes.
+    Args:
+        face_indices: Array com os índices de todas as faces concatenados
+        face_sizes: Array (F,) com o número de vértices de cada face
+    Returns:
+        PackedFaces (ver pack_faces)
+    """
+    face_indices = np.asarray(face_indices, dtype=np.int32).reshape(-1)
+    face_sizes = np.asarray(face_sizes, dtype=np.int32).reshape(-1)
+
+    triangles = []
+    triangle_faces = []
+    offsets = np.concatenate(([0], np.cumsum(face_sizes)[:-1])).astype(np.int32)
+
+    # Agrupa faces com o mesmo número de vértices: cada grupo é triangulado de uma vez
+    for size in np.unique(face_sizes):
+        if size < 3:
+            continue
+
+        face_ids = np.nonzero(face_sizes == size)[0].astype(np.int32)
+        group = face_indices[offsets[face_ids][:, np.newaxis] + np.arange(size)]
+
+        fan = np.arange(1, size - 1)
+        group_triangles = np.stack([
+            np.repeat(group[:, :1], size - 2, axis=1),
+            group[:, fan],
+            group[:, fan + 1]
+        ], axis=2).reshape(-1, 3)
+
+        triangles.append(group_triangles)
+        triangle_faces.append(np.repeat(face_ids, size - 2))
+
+    if not triangles:
+        return PackedFaces(
+            np.empty((0, 3), dtype=np.int32), np.empty(0, dtype=np.int32), face_indices, face_sizes
+        )
+
+    triangles = np.concatenate(triangles)
+    triangle_faces = np.concatenate(triangle_faces)
+
+    # Mantém os triângulos na ordem das faces (e a ordem do leque dentro de cada face)
+    order = np.argsort(triangle_faces, kind='stable')
+    return PackedFaces(
+        np.ascontiguousarray(triangles[order], dtype=np.int32),
+        np.ascontiguousarray(triangle_faces[order], dtype=np.int32),
+        face_indices,
+        face_sizes
+    )
+
+
+def repeat_packed_faces(packed, copies, vertex_count):
+    """
+    Repete faces compactadas para várias cópias de uma malha (instâncias)
+    A cópia i usa os vértices [i * vertex_count, (i + 1) * vertex_count) de um
+    buffer com as cópias empilhadas, e suas faces vêm depois das da cópia i - 1.
+    Args:
+        packed: Faces compactadas (PackedFaces) de uma cópia
+        copies: Número de cópias
+        vertex_count: Número de vértices de cada cópia
+    Returns:
+        PackedFaces com as faces de todas as cópias
+    """
+    face_count = len(packed.face_sizes)
+    vertex_offsets = (np.arange(copies, dtype=np.int32) * vertex_count)[:, np.newaxis]
+    face_offsets = (np.arange(copies, dtype=np.int32) * face_count)[:, np.newaxis]
+
+    return PackedFaces(
+        (packed.triangles.reshape(1, -1) + vertex_offsets).reshape(-1, 3),
+        (packed.triangle_faces[np.newaxis, :] + face_offsets).reshape(-1),
+        (packed.face_indices[np.newaxis, :] + vertex_offsets).reshape(-1),
+        np.tile(packed.face_sizes, copies)
+    )
+
+
+def calculate_face_normals(vertices, packed):
+    """
+    Calcula vetores normais para cada face (vetorizado)
+    Args:
+        vertices: Array (N, 3) de posições
+        packed: Faces compactadas (PackedFaces)
+    Returns:
+        Array (F, 3) float32; faces com menos de 3 vértices recebem (0, 1, 0)
+    """
+    normals = np.zeros((len(packed.face_sizes), 3), dtype=np.float32)
+    normals[:, 1] = 1.0
+
+    if len(packed.triangles) == 0:
+        return normals
+
+    # O primeiro triângulo do leque de cada face usa os três primeiros vértices
+    face_ids, first = np.unique(packed.triangle_faces, return_index=True)
+    corners = vertices[packed.triangles[first]]
+
+    # Produto vetorial das arestas para obter a normal
+    edge1 = corners[:, 1] - corners[:, 0]
+    edge2 = corners[:, 2] - corners[:, 0]
+    face_normals = np.cross(edge1, edge2)
+
+    norm_magnitude = np.linalg.norm(face_normals, axis=1, keepdims=True)
+    face_normals = np.divide(
+        face_normals, norm_magnitude, out=face_normals, where=norm_magnitude > 0
+    )
+
+    normals[face_ids] = face_normals
+    return normals
+
+
+def calculate_vertex_normals(vertices, triangles):
+    """
+    Calcula normais suaves por vértice, ponderadas pela área (vetorizado)
+    O produto vetorial não normalizado de cada triângulo tem módulo igual ao
+    dobro da sua área, então somá-lo nos vértices já pondera pela área.
+    Args:
+        vertices: Array (N, 3) de posições
+        triangles: Buffer de índices (T, 3)
+    Returns:
+        Array (N, 3) float32 com normais unitárias
+    """
+    corners = vertices[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+
+    vertex_count = len(vertices)
+    flat_indices = triangles.reshape(-1)
+    vertex_normals = np.stack([
+        np.bincount(flat_indices, weights=np.repeat(cross[:, axis], 3), minlength=vertex_count)
+        for axis in range(3)
+    ], axis=1).astype(np.float32)
+
+    norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+    return np.divide(vertex_normals, norms, out=vertex_normals, where=norms > 0)
+
+
+class Mesh:
+    """
+    Geometria imutável no espaço do objeto, compartilhada entre instâncias
+
+    Guarda vértices, faces compactadas, normais por face e limites locais em
+    arrays somente leitura; as normais por vértice são calculadas no primeiro
+    uso. Vários Shape3D podem apontar para o mesmo Mesh: cada um só guarda a
+    própria transformação e cor, então a memória cresce com o número de
+    malhas distintas e não com o número de objetos.
+    """
+
+    def __init__(self, vertices, faces):
+        """
+        Cria uma malha
+        Arrays somente leitura (vértices float32, PackedFaces) são usados sem cópia.
+        Args:
+            vertices: Lista de vértices [(x, y, z), ...] ou array (N, 3)
+            faces: Lista de faces, array (F, k) de faces com k vértices ou PackedFaces
+        """
+        vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        if vertices.flags.writeable:
+            vertices = _read_only(vertices.copy())
+        self.vertices = vertices
+
+        # Representação compactada (triângulos int32 + face de origem de cada triângulo)
+        if isinstance(faces, PackedFaces):
+            self.packed = PackedFaces(*(
+                array if not array.flags.writeable else _read_only(array.copy()) for array in faces
+            ))
+        else:
+            self.packed = PackedFaces(*(_read_only(array) for array in pack_faces(faces)))
+        self.triangles = self.packed.triangles
+        self.triangle_faces = self.packed.triangle_faces
+        self._faces = None
+
+        # Normais por face no espaço do objeto
+        self.normals = _read_only(calculate_face_normals(vertices, self.packed))
+        self._vertex_normals = None
+
+        # Caixa e esfera envolventes locais (centro da AABB + maior distância)
+        if len(vertices):
+            local_min = vertices.min(axis=0)
+            local_max = vertices.max(axis=0)
+            self.center = _read_only((local_min + local_max) * 0.5)
+            self.extent = _read_only((local_max - local_min) * 0.5)
+            self.radius = float(np.linalg.norm(vertices - self.center, axis=1).max())
+        else:
+            self.center = _read_only(np.zeros(3, dtype=np.float32))
+            self.extent = _read_only(np.zeros(3, dtype=np.float32))
+            self.radius = 0.0
+
+    @property
+    def faces(self):
+        """
+        Faces como tupla de tuplas de índices (reconstruída no primeiro acesso)
+        É imutável porque o Mesh é compartilhado entre todos os objetos que o usam.
+        """
+        if self._faces is None:
+            sizes = self.packed.face_sizes
+            if len(sizes) == 0:
+                self._faces = ()
+            else:
+                splits = np.cumsum(sizes)[:-1]
+                indices = np.split(self.packed.face_indices, splits)
+                self._faces = tuple(tuple(face.tolist()) for face in indices)
+        return self._faces
+
+    @property
+    def vertex_normals(self):
+        """Normais suaves por vértice no espaço do objeto (calculadas no primeiro uso)"""
+        if self._vertex_normals is None:
+            normals = calculate_vertex_normals(self.vertices, self.triangles)
+            self._vertex_normals = _read_only(normals)
+        return self._vertex_normals
+
+    def __len__(self):
+        """Número de faces"""
+        return len(self.packed.face_sizes)
+
+    def __repr__(self):
+        return (f"Mesh({len(self.vertices)} vértices, {len(self)} faces, "
+                f"{len(self.triangles)} triângulos)")
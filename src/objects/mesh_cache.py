@@ -0,0 +1,93 @@
+"""
+Cache de malhas geradas proceduralmente (Sphere, Cylinder, Torus)
+As malhas são memoizadas pelos parâmetros do construtor e compartilhadas entre
+instâncias; opcionalmente também são gravadas em .npz no MESH_CACHE_DIR
+"""
+
+import hashlib
+import numpy as np
+from pathlib import Path
+
+from .mesh import Mesh, PackedFaces, _read_only
+
+try:
+    from core.config import MESH_CACHE_DIR
+    from core.logger import get_logger
+except ImportError:
+    from ..core.config import MESH_CACHE_DIR
+    from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Incrementar quando os geradores mudarem, para invalidar os arquivos em disco
+MESH_CACHE_VERSION = 2
+
+_memory_cache = {}
+
+
+def _cache_path(cache_dir, key):
+    """Caminho do .npz de uma chave (hash dos parâmetros e da versão do cache)"""
+    digest = hashlib.sha1(repr((MESH_CACHE_VERSION, key)).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"{key[0]}_{digest}.npz"
+
+
+def _load(path):
+    """Lê uma malha do disco; None se o arquivo não existir ou estiver corrompido"""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return Mesh(
+                _read_only(data['vertices']),
+                PackedFaces(*(_read_only(data[field]) for field in PackedFaces._fields))
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Cache de malha inválido em {path}, gerando de novo: {e}")
+        return None
+
+
+def _save(path, mesh):
+    """Grava uma malha em disco (falhas só geram aviso)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, vertices=mesh.vertices, **mesh.packed._asdict())
+    except OSError as e:
+        logger.warning(f"Não foi possível gravar o cache de malha {path}: {e}")
+
+
+def cached_mesh(kind, params, generator, cache_dir=None):
+    """
+    Retorna a malha de uma primitiva, gerando-a só na primeira vez
+    Args:
+        kind: Nome da primitiva (ex.: 'sphere')
+        params: Tupla com os parâmetros geométricos do construtor
+        generator: Função generator(*params) -> (vertices, faces), com faces
+                   em lista, array (F, k) ou PackedFaces
+        cache_dir: Diretório do cache em disco (padrão: MESH_CACHE_DIR; None = só memória)
+    Returns:
+        Mesh imutável, compartilhado entre as instâncias
+    """
+    key = (kind,) + tuple(params)
+    mesh = _memory_cache.get(key)
+    if mesh is not None:
+        return mesh
+
+    cache_dir = MESH_CACHE_DIR if cache_dir is None else cache_dir
+    path = _cache_path(cache_dir, key) if cache_dir else None
+
+    mesh = _load(path) if path is not None else None
+    if mesh is None:
+        vertices, faces = generator(*params)
+        mesh = Mesh(vertices, faces)
+        if path is not None:
+            _save(path, mesh)
+        logger.debug(f"Malha gerada: {key}")
+
+    _memory_cache[key] = mesh
+    return mesh
+
+
+def clear_mesh_cache():
+    """Esvazia o cache em memória (os arquivos em disco são mantidos)"""
+    _memory_cache.clear()
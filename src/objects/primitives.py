@@ -6,6 +6,30 @@ Define formas básicas como Cubo, Esfera, Pirâmide, etc.
 import numpy as np
 import math
 from .shape3d import Shape3D
+from .mesh import pack_face_arrays
+from .mesh_cache import cached_mesh
+
+try:
+    from core.config import LOD_LEVELS
+except ImportError:
+    from ..core.config import LOD_LEVELS
+
+
+def _lod_resolutions(resolution, minimum):
+    """
+    Resoluções da cadeia de LOD: a pedida e metades sucessivas, sem passar do mínimo
+    Args:
+        resolution: Resolução do construtor (nível mais detalhado)
+        minimum: Menor resolução aceitável
+    Returns:
+        Lista sem repetições, da mais detalhada à mais simples
+    """
+    levels = []
+    for level in range(LOD_LEVELS):
+        value = max(resolution >> level, min(minimum, resolution))
+        if value not in levels:
+            levels.append(value)
+    return levels
 
 
 class Cube(Shape3D):
@@ -93,19 +117,25 @@ class Sphere(Shape3D):
             subdivisions: Nível de subdivisão (qualidade)
             color: Cor RGB (0.0-1.0)
         """
-        # Cria um icosaedro e subdivide
-        vertices, faces = self._create_icosphere(radius, subdivisions)
+        # Cria um icosaedro e subdivide (uma vez por (raio, subdivisões))
+        mesh = cached_mesh('sphere', (radius, subdivisions), self._create_icosphere)
 
-        super().__init__(vertices, faces, color)
+        super().__init__(mesh, color=color)
         self.name = "Sphere"
 
+        # Cadeia de LOD: a mesma esfera com menos subdivisões
+        self.set_lod_chain([
+            cached_mesh('sphere', (radius, level), self._create_icosphere)
+            for level in range(subdivisions, max(subdivisions - LOD_LEVELS, -1), -1)
+        ])
+
     def _create_icosphere(self, radius, subdivisions):
         """Cria uma esfera usando subdivisão de icosaedro"""
         # Constantes do icosaedro
         t = (1.0 + math.sqrt(5.0)) / 2.0
 
         # 12 vértices do icosaedro
-        vertices = [
+        vertices = np.array([
             (-1,  t,  0),
             ( 1,  t,  0),
             (-1, -t,  0),
@@ -118,64 +148,65 @@ class Sphere(Shape3D):
             ( t,  0,  1),
             (-t,  0, -1),
             (-t,  0,  1),
-        ]
+        ], dtype=np.float64)
 
         # Normaliza e aplica raio
-        vertices = [
-            tuple(np.array(v) / np.linalg.norm(v) * radius)
-            for v in vertices
-        ]
+        vertices = vertices / np.linalg.norm(vertices, axis=1, keepdims=True) * radius
 
         # 20 faces do icosaedro
-        faces = [
+        faces = np.array([
             [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
             [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
             [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
             [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1],
-        ]
+        ], dtype=np.int64)
 
         # Subdivisão
         for _ in range(subdivisions):
             vertices, faces = self._subdivide(vertices, faces, radius)
 
-        return vertices, faces
+        return vertices, faces.astype(np.int32)
 
     def _subdivide(self, vertices, faces, radius):
-        """Subdivide as faces da esfera"""
-        new_faces = []
-        edge_cache = {}
-
-        def get_middle_point(v1_idx, v2_idx):
-            """Obtém ponto médio entre dois vértices"""
-            key = tuple(sorted([v1_idx, v2_idx]))
-            if key in edge_cache:
-                return edge_cache[key]
-
-            v1 = np.array(vertices[v1_idx])
-            v2 = np.array(vertices[v2_idx])
-            middle = (v1 + v2) / 2.0
-
-            # Normaliza e aplica raio
-            middle = middle / np.linalg.norm(middle) * radius
+        """
+        Subdivide cada face da esfera em 4 (vetorizado)
+        Os pontos médios das arestas são deduplicados com np.unique e numerados
+        na ordem da primeira ocorrência (faces em ordem, arestas v1-v2, v2-v3,
+        v3-v1), o que reproduz exatamente a numeração da subdivisão incremental.
+        Args:
+            vertices: Array (N, 3) float64
+            faces: Array (F, 3) de índices
+            radius: Raio da esfera
+        Returns:
+            Tupla (vertices (N + E, 3), faces (4F, 3))
+        """
+        vertex_count = len(vertices)
 
-            vertices.append(tuple(middle))
-            edge_cache[key] = len(vertices) - 1
-            return edge_cache[key]
+        # Arestas (v1, v2), (v2, v3), (v3, v1) de cada face, em ordem
+        edges = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+        keys = edges.min(axis=1) * vertex_count + edges.max(axis=1)
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
 
-        # Subdivide cada face em 4
-        for face in faces:
-            v1, v2, v3 = face[:3]
+        # Índice de cada aresta única segundo a ordem da primeira ocorrência
+        order = np.argsort(first)
+        edge_ids = np.empty(len(unique_keys), dtype=np.int64)
+        edge_ids[order] = vertex_count + np.arange(len(unique_keys))
 
-            a = get_middle_point(v1, v2)
-            b = get_middle_point(v2, v3)
-            c = get_middle_point(v3, v1)
+        # Pontos médios projetados na esfera
+        first_edges = edges[first[order]]
+        middle = (vertices[first_edges[:, 0]] + vertices[first_edges[:, 1]]) / 2.0
+        middle = middle / np.linalg.norm(middle, axis=1, keepdims=True) * radius
 
-            new_faces.append([v1, a, c])
-            new_faces.append([v2, b, a])
-            new_faces.append([v3, c, b])
-            new_faces.append([a, b, c])
+        v1, v2, v3 = faces.T
+        a, b, c = edge_ids[inverse.reshape(-1)].reshape(-1, 3).T
+        new_faces = np.stack([
+            np.stack([v1, a, c], axis=1),
+            np.stack([v2, b, a], axis=1),
+            np.stack([v3, c, b], axis=1),
+            np.stack([a, b, c], axis=1)
+        ], axis=1).reshape(-1, 3)
 
-        return vertices, new_faces
+        return np.concatenate([vertices, middle]), new_faces
 
 
 class Cylinder(Shape3D):
@@ -190,50 +221,45 @@ class Cylinder(Shape3D):
             segments: Número de segmentos (qualidade)
             color: Cor RGB (0.0-1.0)
         """
-        vertices = []
-        faces = []
-
-        h = height / 2
-
-        # Cria vértices do círculo superior e inferior
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-
-            vertices.append((x, -h, z))  # Círculo inferior
-            vertices.append((x,  h, z))  # Círculo superior
+        mesh = cached_mesh('cylinder', (radius, height, segments), self._create_cylinder)
 
-        # Adiciona centros das tampas
-        center_bottom = len(vertices)
-        vertices.append((0, -h, 0))
-
-        center_top = len(vertices)
-        vertices.append((0,  h, 0))
+        super().__init__(mesh, color=color)
+        self.name = "Cylinder"
 
-        # Cria faces laterais
-        for i in range(segments):
-            next_i = (i + 1) % segments
+        # Cadeia de LOD: metade dos segmentos a cada nível
+        self.set_lod_chain([
+            cached_mesh('cylinder', (radius, height, level), self._create_cylinder)
+            for level in _lod_resolutions(segments, 6)
+        ])
 
-            v1 = i * 2
-            v2 = i * 2 + 1
-            v3 = next_i * 2 + 1
-            v4 = next_i * 2
+    def _create_cylinder(self, radius, height, segments):
+        """Cria vértices e faces do cilindro (laterais em quadriláteros + tampas em leque)"""
+        h = height / 2
+        angles = 2 * np.pi * np.arange(segments) / segments
+        x = radius * np.cos(angles)
+        z = radius * np.sin(angles)
 
-            faces.append([v1, v4, v3, v2])
+        # Círculos inferior e superior intercalados (2i embaixo, 2i + 1 em cima)
+        # + centros das tampas
+        rings = np.stack([
+            np.stack([x, np.full(segments, -h), z], axis=1),
+            np.stack([x, np.full(segments, h), z], axis=1)
+        ], axis=1).reshape(-1, 3)
+        vertices = np.concatenate([rings, [(0, -h, 0), (0, h, 0)]])
+        center_bottom = 2 * segments
+        center_top = 2 * segments + 1
 
-        # Cria tampa inferior
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            faces.append([center_bottom, next_i * 2, i * 2])
+        i = np.arange(segments)
+        next_i = (i + 1) % segments
 
-        # Cria tampa superior
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            faces.append([center_top, i * 2 + 1, next_i * 2 + 1])
+        # Faces laterais, tampa inferior e tampa superior (mesma ordem dos índices)
+        sides = np.stack([2 * i, 2 * next_i, 2 * next_i + 1, 2 * i + 1], axis=1)
+        bottom = np.stack([np.full(segments, center_bottom), 2 * next_i, 2 * i], axis=1)
+        top = np.stack([np.full(segments, center_top), 2 * i + 1, 2 * next_i + 1], axis=1)
 
-        super().__init__(vertices, faces, color)
-        self.name = "Cylinder"
+        face_indices = np.concatenate([sides.reshape(-1), bottom.reshape(-1), top.reshape(-1)])
+        face_sizes = np.repeat([4, 3, 3], segments)
+        return vertices, pack_face_arrays(face_indices, face_sizes)
 
 
 class Torus(Shape3D):
@@ -249,35 +275,47 @@ class Torus(Shape3D):
             minor_segments: Segmentos ao redor do tubo
             color: Cor RGB (0.0-1.0)
         """
-        vertices = []
-        faces = []
-
-        # Gera vértices
-        for i in range(major_segments):
-            theta = 2 * math.pi * i / major_segments
+        key = (major_radius, minor_radius, major_segments, minor_segments)
+        mesh = cached_mesh('torus', key, self._create_torus)
 
-            for j in range(minor_segments):
-                phi = 2 * math.pi * j / minor_segments
-
-                x = (major_radius + minor_radius * math.cos(phi)) * math.cos(theta)
-                y = minor_radius * math.sin(phi)
-                z = (major_radius + minor_radius * math.cos(phi)) * math.sin(theta)
+        super().__init__(mesh, color=color)
+        self.name = "Torus"
 
-                vertices.append((x, y, z))
+        # Cadeia de LOD: metade dos segmentos (nas duas direções) a cada nível;
+        # a direção que chega antes ao mínimo fica nele nos níveis seguintes
+        majors = _lod_resolutions(major_segments, 6)
+        minors = _lod_resolutions(minor_segments, 4)
+        count = max(len(majors), len(minors))
+        majors += majors[-1:] * (count - len(majors))
+        minors += minors[-1:] * (count - len(minors))
+        self.set_lod_chain([
+            cached_mesh('torus', (major_radius, minor_radius, major, minor), self._create_torus)
+            for major, minor in zip(majors, minors)
+        ])
+
+    def _create_torus(self, major_radius, minor_radius, major_segments, minor_segments):
+        """Cria vértices e faces (quadriláteros) do torus"""
+        # Grade (theta, phi): o vértice (i, j) fica na posição i * minor_segments + j
+        theta = 2 * np.pi * np.arange(major_segments) / major_segments
+        phi = 2 * np.pi * np.arange(minor_segments) / minor_segments
+        theta, phi = np.meshgrid(theta, phi, indexing='ij')
+
+        ring = major_radius + minor_radius * np.cos(phi)
+        vertices = np.stack([
+            ring * np.cos(theta),
+            minor_radius * np.sin(phi),
+            ring * np.sin(theta)
+        ], axis=2).reshape(-1, 3)
 
         # Gera faces
-        for i in range(major_segments):
-            next_i = (i + 1) % major_segments
-
-            for j in range(minor_segments):
-                next_j = (j + 1) % minor_segments
-
-                v1 = i * minor_segments + j
-                v2 = next_i * minor_segments + j
-                v3 = next_i * minor_segments + next_j
-                v4 = i * minor_segments + next_j
+        i, j = np.meshgrid(np.arange(major_segments), np.arange(minor_segments), indexing='ij')
+        next_i = (i + 1) % major_segments
+        next_j = (j + 1) % minor_segments
+        faces = np.stack([
+            i * minor_segments + j,
+            next_i * minor_segments + j,
+            next_i * minor_segments + next_j,
+            i * minor_segments + next_j
+        ], axis=2).reshape(-1, 4)
 
-                faces.append([v1, v2, v3, v4])
-
-        super().__init__(vertices, faces, color)
-        self.name = "Torus"
+        return vertices, faces
@@ -5,9 +5,11 @@ Classe base para objetos 3D
 import numpy as np
 
 try:
+    from core.config import LOD_HYSTERESIS, LOD_SCREEN_RADII
     from core.logger import get_logger
     from core.exceptions import SingularMatrixException
 except ImportError:
+    from ..core.config import LOD_HYSTERESIS, LOD_SCREEN_RADII
     from ..core.logger import get_logger
     from ..core.exceptions import SingularMatrixException
 
@@ -16,194 +18,423 @@ try:
 except ImportError:
     from transformations.geometric import GeometricTransformations
 
+from .mesh import Mesh, _read_only, calculate_face_normals, calculate_vertex_normals
+
 logger = get_logger(__name__)
 
 
 class Shape3D:
-    """Classe base para representar objetos 3D"""
-
-    def __init__(self, vertices, faces, color=(1.0, 0.5, 0.0)):
+    """
+    Classe base para representar objetos 3D
+
+    A geometria fica em um Mesh imutável, compartilhado entre as instâncias que
+    usam a mesma malha; cada objeto guarda só a transformação, a cor e caches.
+    Os vértices originais nunca são reescritos: cada transformação só muda a
+    matriz de modelo e marca o objeto como sujo. Vértices, normais e limites no
+    espaço do mundo são calculados no primeiro acesso depois de uma mudança e
+    ficam em cache até a próxima; o renderer aplica a matriz de modelo junto
+    com a view-projection e não precisa dos vértices transformados.
+    """
+
+    def __init__(self, vertices, faces=None, color=(1.0, 0.5, 0.0)):
         """
         Inicializa um objeto 3D
         Args:
-            vertices: Lista de vértices [(x, y, z), ...]
-            faces: Lista de faces (cada face é lista de índices de vértices)
+            vertices: Mesh compartilhado, ou lista de vértices [(x, y, z), ...] / array (N, 3)
+            faces: Faces da malha quando vertices não é um Mesh (lista, array (F, k)
+                   ou PackedFaces)
             color: Cor do material RGB (0.0-1.0)
         """
-        self.original_vertices = np.array(vertices, dtype=np.float32)
-        self.vertices = self.original_vertices.copy()
-        self.faces = faces
+        self.mesh = vertices if isinstance(vertices, Mesh) else Mesh(vertices, faces)
         self.color = color
 
-        # Transformações acumuladas
+        # Transformações acumuladas (compartilhadas com cópias até a primeira escrita)
         self.transform = GeometricTransformations()
+        self._transform_shared = False
+
+        # Cadeia de níveis de detalhe: do mais detalhado (0) ao mais simples;
+        # só as primitivas curvas têm mais de um nível
+        self.lod_meshes = [self.mesh]
+        self.lod_level = 0
 
-        # Calcula normais
-        self.normals = self._calculate_normals()
-        # Guarda normais originais para otimização
-        self.original_normals = np.array(self.normals, dtype=np.float32)
+        # Contador de mudanças da transformação (caches de frame comparam versões)
+        self.version = 0
+        self._invalidate()
 
         # Propriedades do objeto
         self.name = "Shape3D"
         self.visible = True
 
-    def _calculate_normals(self):
-        """Calcula vetores normais para cada face"""
-        normals = []
+    # ==================== GEOMETRIA (MESH) ====================
 
-        for face in self.faces:
-            if len(face) < 3:
-                normals.append((0, 1, 0))
-                continue
+    @property
+    def original_vertices(self):
+        """Vértices no espaço do objeto (do Mesh ativo, somente leitura)"""
+        return self.mesh.vertices
 
-            # Pega três vértices da face
-            v0 = self.vertices[face[0]]
-            v1 = self.vertices[face[1]]
-            v2 = self.vertices[face[2]]
+    @property
+    def packed(self):
+        """Faces compactadas do Mesh ativo"""
+        return self.mesh.packed
 
-            # Calcula vetores das arestas
-            edge1 = v1 - v0
-            edge2 = v2 - v0
+    @property
+    def triangles(self):
+        """Buffer de índices (T, 3) do Mesh ativo"""
+        return self.mesh.triangles
 
-            # Produto vetorial para obter normal
-            normal = np.cross(edge1, edge2)
-            norm_magnitude = np.linalg.norm(normal)
+    @property
+    def triangle_faces(self):
+        """Face de origem de cada triângulo do Mesh ativo"""
+        return self.mesh.triangle_faces
 
-            if norm_magnitude > 0:
-                normal = normal / norm_magnitude
+    @property
+    def faces(self):
+        """Lista de faces do Mesh ativo"""
+        return self.mesh.faces
 
-            normals.append(tuple(normal))
+    @property
+    def original_normals(self):
+        """Normais por face no espaço do objeto"""
+        return self.mesh.normals
 
-        return normals
+    # ==================== NÍVEIS DE DETALHE ====================
 
-    def apply_transformations(self):
+    def set_lod_chain(self, meshes):
         """
-        Aplica as transformações acumuladas aos vértices e normais
-        Otimizado: transforma normais diretamente ao invés de recalcular
+        Define a cadeia de níveis de detalhe e volta ao nível 0
+        Os limites (AABB/esfera) continuam os da malha mais detalhada, que envolve
+        as mais simples.
+        Args:
+            meshes: Lista de Mesh, do mais detalhado ao mais simples
         """
-        # Transforma vértices usando multiplicação matricial (mais rápido)
-        transform_matrix = self.transform.matrix.data
-
-        # Adiciona coordenada homogênea (w=1) aos vértices
-        ones = np.ones((len(self.original_vertices), 1), dtype=np.float32)
-        vertices_homogeneous = np.hstack([self.original_vertices, ones])
+        self.lod_meshes = list(meshes)
+        self.lod_level = 0
+        if self.lod_meshes[0] is not self.mesh:
+            self._set_mesh(self.lod_meshes[0])
 
-        # Aplica transformação (multiplicação matricial vetorizada)
-        transformed = (transform_matrix @ vertices_homogeneous.T).T
-        self.vertices = transformed[:, :3]  # Remove coordenada homogênea
-
-        # Transforma normais usando matriz normal (inverse-transpose)
-        # Para normais, usamos apenas a parte 3x3 da matriz
+    def select_lod(self, screen_radius, thresholds=None, hysteresis=None):
+        """
+        Escolhe o nível de detalhe pelo raio projetado da esfera envolvente
+        O nível k é usado enquanto o raio for pelo menos thresholds[k]; para
+        mudar de nível o raio precisa passar o limiar com uma margem relativa
+        (histerese), então oscilações pequenas do zoom não trocam a malha.
+        Args:
+            screen_radius: Raio projetado em pixels
+            thresholds: Raios mínimos dos níveis 0, 1, ... (padrão: LOD_SCREEN_RADII)
+            hysteresis: Margem relativa (padrão: LOD_HYSTERESIS)
+        Returns:
+            True se o nível mudou
+        """
+        last = len(self.lod_meshes) - 1
+        if last == 0:
+            return False
+
+        thresholds = LOD_SCREEN_RADII if thresholds is None else thresholds
+        hysteresis = LOD_HYSTERESIS if hysteresis is None else hysteresis
+        thresholds = list(thresholds[:last]) + [0.0] * (last - len(thresholds))
+
+        level = self.lod_level
+        while level > 0 and screen_radius >= thresholds[level - 1] * (1 + hysteresis):
+            level -= 1
+        while level < last and screen_radius < thresholds[level] * (1 - hysteresis):
+            level += 1
+
+        if level == self.lod_level:
+            return False
+
+        self.lod_level = level
+        self._set_mesh(self.lod_meshes[level])
+        return True
+
+    def _set_mesh(self, mesh):
+        """Troca o Mesh ativo (mantém transformação e limites)"""
+        self.mesh = mesh
+        self._vertices = None
+        self._face_normals = None
+        self._normals = None
+        self._vertex_normals = None
+        self._bounding_box = None
+
+    # ==================== ESTADO NO ESPAÇO DO MUNDO ====================
+
+    def _invalidate(self):
+        """Marca o objeto como sujo; os dados no espaço do mundo são recalculados sob demanda"""
+        self.version += 1
+        self._dirty = True
+        self._vertices = None
+        self._face_normals = None
+        self._normals = None
+        self._vertex_normals = None
+        self._bounding_box = None
+
+    def _update(self):
+        """Recalcula matriz de modelo, matriz normal e limites se o objeto estiver sujo"""
+        if not self._dirty:
+            return
+
+        self._model_matrix = self.transform.matrix.data
         try:
-            # Matriz normal = inversa transposta da parte rotação/escala
-            rotation_scale = transform_matrix[:3, :3]
-            normal_matrix = np.linalg.inv(rotation_scale).T
-
-            # Aplica transformação às normais (mais rápido que recalcular)
-            transformed_normals = (normal_matrix @ self.original_normals.T).T
-
-            # Normaliza os vetores
-            norms = np.linalg.norm(transformed_normals, axis=1, keepdims=True)
-            norms[norms == 0] = 1  # Evita divisão por zero
-            self.normals = (transformed_normals / norms).tolist()
+            # No modo decomposto a matriz normal é analítica (R · K⁻ᵀ)
+            self._normal_matrix = np.asarray(self.transform.get_normal_matrix(), dtype=np.float32)
+        except SingularMatrixException:
+            logger.warning("Matriz singular detectada, normais serão recalculadas do zero")
+            self._normal_matrix = None
+
+        self._update_bounds()
+        self._dirty = False
+
+    @property
+    def model_matrix(self):
+        """Matriz de modelo 4x4 (float32) da transformação atual"""
+        self._update()
+        return self._model_matrix
+
+    @property
+    def normal_matrix(self):
+        """Matriz normal 3x3 (float32), ou None se a transformação for singular"""
+        self._update()
+        return self._normal_matrix
+
+    @property
+    def vertices(self):
+        """Vértices no espaço do mundo, array (N, 3) calculado no primeiro acesso"""
+        if self._vertices is None:
+            matrix = self.model_matrix
+            self._vertices = _read_only(
+                (self.original_vertices @ matrix[:3, :3].T + matrix[:3, 3]).astype(np.float32)
+            )
+        return self._vertices
+
+    @property
+    def face_normals(self):
+        """Normais por face no espaço do mundo, array (F, 3) calculado no primeiro acesso"""
+        if self._face_normals is None:
+            normal_matrix = self.normal_matrix
+            if normal_matrix is None:
+                # Matriz singular: recalcula a partir dos vértices transformados
+                self._face_normals = _read_only(self._calculate_normals(self.vertices))
+            else:
+                transformed = self.original_normals @ normal_matrix.T
+                norms = np.linalg.norm(transformed, axis=1, keepdims=True)
+                norms[norms == 0] = 1  # Evita divisão por zero
+                self._face_normals = _read_only((transformed / norms).astype(np.float32))
+        return self._face_normals
+
+    @property
+    def normals(self):
+        """Normais por face como lista (compatibilidade; prefira face_normals)"""
+        if self._normals is None:
+            self._normals = self.face_normals.tolist()
+        return self._normals
+
+    @property
+    def bounding_min(self):
+        """Canto mínimo da AABB exata no espaço do mundo (mínimo dos vértices)"""
+        return self._exact_bounding_box()[0]
+
+    @property
+    def bounding_max(self):
+        """Canto máximo da AABB exata no espaço do mundo (máximo dos vértices)"""
+        return self._exact_bounding_box()[1]
+
+    @property
+    def culling_min(self):
+        """Canto mínimo da AABB conservadora (caixa local transformada), usada no culling"""
+        self._update()
+        return self._culling_min
+
+    @property
+    def culling_max(self):
+        """Canto máximo da AABB conservadora (caixa local transformada), usada no culling"""
+        self._update()
+        return self._culling_max
+
+    @property
+    def bounding_center(self):
+        """Centro da esfera envolvente no espaço do mundo"""
+        self._update()
+        return self._bounding_center
+
+    @property
+    def bounding_radius(self):
+        """Raio da esfera envolvente no espaço do mundo"""
+        self._update()
+        return self._bounding_radius
+
+    def _calculate_normals(self, vertices):
+        """Normais por face do Mesh ativo para as posições dadas (ver calculate_face_normals)"""
+        return calculate_face_normals(vertices, self.packed)
+
+    def get_vertex_normals(self):
+        """
+        Retorna as normais suaves por vértice já transformadas
+        Usa a matriz normal sobre as normais originais (sem materializar os
+        vértices); o resultado fica em cache até a próxima transformação.
+        Returns:
+            Array (N, 3) float32 somente leitura
+        """
+        if self._vertex_normals is None:
+            normal_matrix = self.normal_matrix
+            if normal_matrix is None:
+                # Matriz singular: recalcula a partir dos vértices transformados
+                normals = calculate_vertex_normals(self.vertices, self.triangles)
+                self._vertex_normals = _read_only(normals)
+            else:
+                # Normais locais calculadas uma vez por Mesh e compartilhadas
+                transformed = self.mesh.vertex_normals @ normal_matrix.T
+                norms = np.linalg.norm(transformed, axis=1, keepdims=True)
+                self._vertex_normals = _read_only(np.divide(
+                    transformed, norms, out=transformed, where=norms > 0
+                ).astype(np.float32))
+
+        return self._vertex_normals
+
+    def _exact_bounding_box(self):
+        """
+        AABB exata (min, max) dos vértices no espaço do mundo
+        Calculada no primeiro acesso a partir dos vértices em cache.
+        """
+        if self._bounding_box is None:
+            vertices = self.vertices
+            self._bounding_box = (_read_only(vertices.min(axis=0)),
+                                  _read_only(vertices.max(axis=0)))
+        return self._bounding_box
 
-            logger.debug(f"Transformações aplicadas com otimização (vetorizado)")
+    def _update_bounds(self):
+        """
+        Atualiza a AABB conservadora e a esfera envolvente no espaço do mundo
+        Ambas vêm só da matriz de modelo, sem transformar os vértices: a AABB é
+        a caixa local transformada (centro M·c, meia-extensão |M|·e) e a esfera
+        transforma o centro local e escala o raio pelo maior valor singular da
+        parte 3x3. As duas são conservadoras e valem também com distorção.
+        """
+        matrix = self._model_matrix
+        reference = self.lod_meshes[0]
+        linear = matrix[:3, :3]
+        center = linear @ reference.center + matrix[:3, 3]
+        extent = np.abs(linear) @ reference.extent
+        self._culling_min = (center - extent).astype(np.float32)
+        self._culling_max = (center + extent).astype(np.float32)
+
+        self._bounding_center = center.astype(np.float32)
+        max_scale = float(np.linalg.norm(linear.astype(np.float64), 2))
+        self._bounding_radius = reference.radius * max_scale
 
-        except np.linalg.LinAlgError:
-            # Se a matriz for singular, recalcula normais do zero
-            logger.warning("Matriz singular detectada, recalculando normais do zero")
-            self.normals = self._calculate_normals()
+    def apply_transformations(self):
+        """
+        Materializa já os vértices e normais no espaço do mundo
+        Normalmente isso acontece sob demanda, no primeiro acesso depois de uma
+        transformação; este método só antecipa o cálculo.
+        """
+        self.vertices
+        self.face_normals
 
     def reset_transformations(self):
         """Reseta todas as transformações"""
-        self.transform.reset()
-        self.vertices = self.original_vertices.copy()
-        self.normals = self._calculate_normals()
+        if self._transform_shared:
+            self.transform = GeometricTransformations(
+                self.transform.history_limit, self.transform.decomposed
+            )
+            self._transform_shared = False
+        else:
+            self.transform.reset()
+        self._invalidate()
+
+    def _writable_transform(self):
+        """
+        Retorna a transformação para escrita (copy-on-write)
+        Depois de copy(), original e cópia compartilham a mesma transformação; o
+        primeiro a transformar-se passa a ter a sua própria.
+        """
+        if self._transform_shared:
+            self.transform = self.transform.copy()
+            self._transform_shared = False
+        return self.transform
 
     # ==================== MÉTODOS DE TRANSFORMAÇÃO ====================
 
-    def translate(self, tx, ty, tz):
-        """Aplica translação"""
-        self.transform.translate(tx, ty, tz)
-        self.apply_transformations()
+    def translate(self, tx, ty, tz, animated=False):
+        """Aplica translação (animated=True: histórico de animação compactado)"""
+        self._writable_transform().translate(tx, ty, tz, animated=animated)
+        self._invalidate()
         return self
 
-    def rotate_x(self, angle):
-        """Aplica rotação em X"""
-        self.transform.rotate_x(angle)
-        self.apply_transformations()
+    def rotate_x(self, angle, animated=False):
+        """Aplica rotação em X (animated=True: histórico de animação compactado)"""
+        self._writable_transform().rotate_x(angle, animated=animated)
+        self._invalidate()
         return self
 
-    def rotate_y(self, angle):
-        """Aplica rotação em Y"""
-        self.transform.rotate_y(angle)
-        self.apply_transformations()
+    def rotate_y(self, angle, animated=False):
+        """Aplica rotação em Y (animated=True: histórico de animação compactado)"""
+        self._writable_transform().rotate_y(angle, animated=animated)
+        self._invalidate()
         return self
 
-    def rotate_z(self, angle):
-        """Aplica rotação em Z"""
-        self.transform.rotate_z(angle)
-        self.apply_transformations()
+    def rotate_z(self, angle, animated=False):
+        """Aplica rotação em Z (animated=True: histórico de animação compactado)"""
+        self._writable_transform().rotate_z(angle, animated=animated)
+        self._invalidate()
         return self
 
-    def rotate(self, rx, ry, rz):
-        """Aplica rotação combinada"""
-        self.transform.rotate(rx, ry, rz)
-        self.apply_transformations()
+    def rotate(self, rx, ry, rz, animated=False):
+        """Aplica rotação combinada (animated=True: histórico de animação compactado)"""
+        self._writable_transform().rotate(rx, ry, rz, animated=animated)
+        self._invalidate()
         return self
 
-    def scale(self, sx, sy, sz):
-        """Aplica escala"""
-        self.transform.scale(sx, sy, sz)
-        self.apply_transformations()
+    def scale(self, sx, sy, sz, animated=False):
+        """Aplica escala (animated=True: histórico de animação compactado)"""
+        self._writable_transform().scale(sx, sy, sz, animated=animated)
+        self._invalidate()
         return self
 
-    def scale_uniform(self, s):
-        """Aplica escala uniforme"""
-        self.transform.scale_uniform(s)
-        self.apply_transformations()
+    def scale_uniform(self, s, animated=False):
+        """Aplica escala uniforme (animated=True: histórico de animação compactado)"""
+        self._writable_transform().scale_uniform(s, animated=animated)
+        self._invalidate()
         return self
 
     def reflect_x(self):
         """Aplica reflexão em X"""
-        self.transform.reflect_x()
-        self.apply_transformations()
+        self._writable_transform().reflect_x()
+        self._invalidate()
         return self
 
     def reflect_y(self):
         """Aplica reflexão em Y"""
-        self.transform.reflect_y()
-        self.apply_transformations()
+        self._writable_transform().reflect_y()
+        self._invalidate()
         return self
 
     def reflect_z(self):
         """Aplica reflexão em Z"""
-        self.transform.reflect_z()
-        self.apply_transformations()
+        self._writable_transform().reflect_z()
+        self._invalidate()
         return self
 
     def shear_xy(self, shx, shy):
         """Aplica distorção XY"""
-        self.transform.shear_xy(shx, shy)
-        self.apply_transformations()
+        self._writable_transform().shear_xy(shx, shy)
+        self._invalidate()
         return self
 
     def shear_xz(self, shx, shz):
         """Aplica distorção XZ"""
-        self.transform.shear_xz(shx, shz)
-        self.apply_transformations()
+        self._writable_transform().shear_xz(shx, shz)
+        self._invalidate()
         return self
 
     def shear_yz(self, shy, shz):
         """Aplica distorção YZ"""
-        self.transform.shear_yz(shy, shz)
-        self.apply_transformations()
+        self._writable_transform().shear_yz(shy, shz)
+        self._invalidate()
         return self
 
     # ==================== MÉTODOS AUXILIARES ====================
 
     def get_vertices(self):
-        """Retorna os vértices transformados"""
+        """Retorna os vértices transformados como lista (cópia; prefira get_vertex_array)"""
         return self.vertices.tolist()
 
     def get_faces(self):
@@ -211,9 +442,37 @@ class Shape3D:
         return self.faces
 
     def get_normals(self):
-        """Retorna as normais"""
+        """Retorna as normais como lista (prefira get_normal_array)"""
         return self.normals
 
+    def get_vertex_array(self):
+        """
+        Retorna os vértices no espaço do mundo sem cópia
+        Returns:
+            Array (N, 3) float32 somente leitura
+        """
+        return self.vertices
+
+    def get_normal_array(self):
+        """
+        Retorna as normais por face no espaço do mundo sem cópia
+        Returns:
+            Array (F, 3) float32 somente leitura
+        """
+        return self.face_normals
+
+    def get_index_buffer(self):
+        """
+        Retorna o buffer de índices dos triângulos (faces trianguladas em leque)
+        Returns:
+            Array (T, 3) int32 somente leitura
+        """
+        return self.packed.triangles
+
+    def get_packed_faces(self):
+        """Retorna a representação compactada das faces (PackedFaces, arrays somente leitura)"""
+        return self.packed
+
     def get_color(self):
         """Retorna a cor do material"""
         return self.color
@@ -223,22 +482,48 @@ class Shape3D:
         self.color = color
 
     def get_centroid(self):
-        """Retorna o centroide do objeto"""
-        return tuple(np.mean(self.vertices, axis=0))
+        """Retorna o centroide do objeto (a média comuta com a transformação afim)"""
+        matrix = self.model_matrix
+        return tuple(matrix[:3, :3] @ self.original_vertices.mean(axis=0) + matrix[:3, 3])
 
     def get_bounding_box(self):
-        """Retorna a bounding box (min, max)"""
-        min_point = np.min(self.vertices, axis=0)
-        max_point = np.max(self.vertices, axis=0)
-        return (tuple(min_point), tuple(max_point))
+        """Retorna a bounding box exata (min, max) no espaço do mundo"""
+        return (tuple(self.bounding_min), tuple(self.bounding_max))
+
+    def get_culling_box(self):
+        """Retorna a bounding box conservadora (min, max) usada no frustum culling"""
+        return (tuple(self.culling_min), tuple(self.culling_max))
+
+    def get_bounding_sphere(self):
+        """Retorna a esfera envolvente (centro, raio) no espaço do mundo"""
+        return (tuple(self.bounding_center), self.bounding_radius)
 
     def copy(self):
-        """Cria uma cópia do objeto"""
-        new_shape = Shape3D(
-            self.original_vertices.tolist(),
-            self.faces.copy(),
-            self.color
-        )
-        new_shape.transform = self.transform.copy()
-        new_shape.apply_transformations()
+        """
+        Cria uma cópia do objeto em O(1)
+        A cópia compartilha o Mesh (imutável), os caches no espaço do mundo
+        (arrays somente leitura) e a transformação, que só é copiada na primeira
+        vez que um dos dois objetos for transformado.
+        """
+        new_shape = object.__new__(type(self))
+        new_shape.__dict__.update(self.__dict__)
+        new_shape.lod_meshes = list(self.lod_meshes)
+        new_shape._transform_shared = True
+        self._transform_shared = True
+        return new_shape
+
+    def snapshot(self):
+        """
+        Cria uma cópia para renderização, sem custo para o original
+        Compartilha o Mesh e os caches já calculados, mas leva só a transformação
+        atual (sem histórico) e não marca o original como compartilhado: ao
+        contrário de copy(), a próxima transformação do original não precisa
+        copiar a sua GeometricTransformations.
+        """
+        self._update()
+        new_shape = object.__new__(type(self))
+        new_shape.__dict__.update(self.__dict__)
+        new_shape.lod_meshes = list(self.lod_meshes)
+        new_shape.transform = self.transform.copy(history=False)
+        new_shape._transform_shared = False
         return new_shape
@@ -5,6 +5,10 @@ Implementa modelos de iluminação e renderização
 
 from .lighting import PhongShading, LambertianShading, GouraudShading, Light, create_shading_model
 from .camera import Camera
-from .renderer import Renderer
+from .renderer import Renderer, scene_fingerprint
+from .rasterizer import ZBufferRasterizer
+from .render_thread import RenderThread, SceneSnapshot, take_snapshot
 
-__all__ = ['PhongShading', 'LambertianShading', 'GouraudShading', 'Light', 'Camera', 'Renderer', 'create_shading_model']
+__all__ = ['PhongShading', 'LambertianShading', 'GouraudShading', 'Light', 'Camera', 'Renderer',
+           'ZBufferRasterizer', 'create_shading_model',
+           'RenderThread', 'SceneSnapshot', 'take_snapshot', 'scene_fingerprint']
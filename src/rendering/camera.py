@@ -12,7 +12,15 @@ except ImportError:
 
 
 class Camera:
-    """Classe para representar uma câmera 3D"""
+    """
+    Classe para representar uma câmera 3D
+
+    As matrizes de view, projeção, view * projection e sua inversa são
+    guardadas em cache e recalculadas apenas quando algo que as afeta muda:
+    posição/alvo/up invalidam a view; fov/aspect/near/far invalidam a projeção.
+    O contador `version` aumenta a cada mudança, para que renderizadores e
+    caches saibam se a câmera se moveu desde o último frame.
+    """
 
     def __init__(self, position, target, up=(0, 1, 0), fov=90, aspect=16/9, near=0.1, far=1000):
         """
@@ -26,9 +34,16 @@ class Camera:
             near: Plano de corte próximo
             far: Plano de corte distante
         """
-        self.position = np.array(position, dtype=np.float32)
-        self.target = np.array(target, dtype=np.float32)
-        self.up = np.array(up, dtype=np.float32)
+        self.version = 0
+        self._view_matrix = None
+        self._projection_matrix = None
+        self._view_projection_matrix = None
+        self._inverse_view_projection_matrix = None
+        self._frustum_planes = None
+
+        self.position = position
+        self.target = target
+        self.up = up
         self.fov = fov
         self.aspect = aspect
         self.near = near
@@ -39,32 +54,139 @@ class Camera:
         self.orbit_angle_v = 0  # Vertical
         self.orbit_distance = np.linalg.norm(self.position - self.target)
 
-        self.update_matrices()
+    # ==================== PARÂMETROS (invalidam o cache) ====================
+
+    @staticmethod
+    def _frozen_vector(value):
+        """Copia um vetor 3D como array somente leitura (mudanças passam pelo setter)"""
+        vector = np.array(value, dtype=np.float32)
+        vector.setflags(write=False)
+        return vector
+
+    def _invalidate_view(self):
+        """Marca a view (e as matrizes derivadas) para recálculo"""
+        self._view_matrix = None
+        self._view_projection_matrix = None
+        self._inverse_view_projection_matrix = None
+        self._frustum_planes = None
+        self.version += 1
+
+    def _invalidate_projection(self):
+        """Marca a projeção (e as matrizes derivadas) para recálculo"""
+        self._projection_matrix = None
+        self._view_projection_matrix = None
+        self._inverse_view_projection_matrix = None
+        self._frustum_planes = None
+        self.version += 1
+
+    @property
+    def position(self):
+        """Posição da câmera (array somente leitura)"""
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = self._frozen_vector(value)
+        self._invalidate_view()
+
+    @property
+    def target(self):
+        """Ponto alvo (array somente leitura)"""
+        return self._target
+
+    @target.setter
+    def target(self, value):
+        self._target = self._frozen_vector(value)
+        self._invalidate_view()
+
+    @property
+    def up(self):
+        """Vetor "para cima" (array somente leitura)"""
+        return self._up
+
+    @up.setter
+    def up(self, value):
+        self._up = self._frozen_vector(value)
+        self._invalidate_view()
+
+    @property
+    def fov(self):
+        """Campo de visão em graus"""
+        return self._fov
+
+    @fov.setter
+    def fov(self, value):
+        self._fov = value
+        self._invalidate_projection()
+
+    @property
+    def aspect(self):
+        """Razão de aspecto (largura/altura)"""
+        return self._aspect
+
+    @aspect.setter
+    def aspect(self, value):
+        self._aspect = value
+        self._invalidate_projection()
+
+    @property
+    def near(self):
+        """Plano de corte próximo"""
+        return self._near
+
+    @near.setter
+    def near(self, value):
+        self._near = value
+        self._invalidate_projection()
+
+    @property
+    def far(self):
+        """Plano de corte distante"""
+        return self._far
+
+    @far.setter
+    def far(self, value):
+        self._far = value
+        self._invalidate_projection()
+
+    # ==================== MATRIZES (calculadas sob demanda) ====================
+
+    @property
+    def view_matrix(self):
+        """Matriz de view (recalculada só após mudar posição, alvo ou up)"""
+        if self._view_matrix is None:
+            self._view_matrix = Matrix4x4.look_at(self._position, self._target, self._up)
+        return self._view_matrix
+
+    @property
+    def projection_matrix(self):
+        """Matriz de projeção (recalculada só após mudar fov, aspect, near ou far)"""
+        if self._projection_matrix is None:
+            self._projection_matrix = Matrix4x4.perspective(
+                self._fov, self._aspect, self._near, self._far
+            )
+        return self._projection_matrix
 
     def update_matrices(self):
-        """Atualiza as matrizes de view e projeção"""
-        self.view_matrix = Matrix4x4.look_at(self.position, self.target, self.up)
-        self.projection_matrix = Matrix4x4.perspective(self.fov, self.aspect, self.near, self.far)
+        """Força o recálculo das matrizes de view e projeção"""
+        self._invalidate_view()
+        self._invalidate_projection()
 
     def move(self, dx, dy, dz):
         """Move a câmera no espaço"""
-        self.position += np.array([dx, dy, dz], dtype=np.float32)
-        self.update_matrices()
+        self.position = self.position + np.array([dx, dy, dz], dtype=np.float32)
 
     def set_position(self, x, y, z):
         """Define a posição da câmera"""
-        self.position = np.array([x, y, z], dtype=np.float32)
-        self.update_matrices()
+        self.position = (x, y, z)
 
     def set_target(self, x, y, z):
         """Define o ponto alvo da câmera"""
-        self.target = np.array([x, y, z], dtype=np.float32)
-        self.update_matrices()
+        self.target = (x, y, z)
 
     def look_at(self, target):
         """Faz a câmera olhar para um ponto"""
-        self.target = np.array(target, dtype=np.float32)
-        self.update_matrices()
+        self.target = target
 
     def orbit(self, delta_h, delta_v):
         """
@@ -84,8 +206,7 @@ class Camera:
         y = self.target[1] + self.orbit_distance * math.sin(self.orbit_angle_v)
         z = self.target[2] + self.orbit_distance * math.cos(self.orbit_angle_v) * math.cos(self.orbit_angle_h)
 
-        self.position = np.array([x, y, z], dtype=np.float32)
-        self.update_matrices()
+        self.position = (x, y, z)
 
     def zoom(self, delta):
         """
@@ -100,12 +221,70 @@ class Camera:
         y = self.target[1] + self.orbit_distance * math.sin(self.orbit_angle_v)
         z = self.target[2] + self.orbit_distance * math.cos(self.orbit_angle_v) * math.cos(self.orbit_angle_h)
 
-        self.position = np.array([x, y, z], dtype=np.float32)
-        self.update_matrices()
+        self.position = (x, y, z)
 
     def get_view_projection_matrix(self):
-        """Retorna a matriz combinada view * projection"""
-        return self.projection_matrix.multiply(self.view_matrix)
+        """
+        Retorna a matriz combinada view * projection
+        A mesma instância é devolvida enquanto a câmera não mudar; não a modifique.
+        """
+        if self._view_projection_matrix is None:
+            self._view_projection_matrix = self.projection_matrix.multiply(self.view_matrix)
+        return self._view_projection_matrix
+
+    def get_inverse_view_projection_matrix(self):
+        """
+        Retorna a inversa de view * projection (tela/NDC -> mundo), em cache
+        Raises:
+            SingularMatrixException: Se a matriz não for inversível
+        """
+        if self._inverse_view_projection_matrix is None:
+            self._inverse_view_projection_matrix = self.get_view_projection_matrix().inverse()
+        return self._inverse_view_projection_matrix
+
+    def get_frustum_planes(self):
+        """
+        Retorna os 6 planos do frustum no espaço do mundo, em cache
+        Extraídos de view * projection (Gribb-Hartmann): cada linha (a, b, c, d) é
+        normalizada e aponta para dentro, ou seja, a*x + b*y + c*z + d >= 0 dentro.
+        Returns:
+            Array (6, 4) float32 na ordem esquerda, direita, baixo, cima, perto, longe
+        """
+        if self._frustum_planes is None:
+            m = self.get_view_projection_matrix().data.astype(np.float64)
+            planes = np.array([
+                m[3] + m[0],
+                m[3] - m[0],
+                m[3] + m[1],
+                m[3] - m[1],
+                m[3] + m[2],
+                m[3] - m[2]
+            ])
+            planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+            self._frustum_planes = planes.astype(np.float32)
+        return self._frustum_planes
+
+    def is_sphere_visible(self, center, radius):
+        """
+        Testa uma esfera contra o frustum
+        Returns:
+            False se a esfera estiver inteiramente fora de algum plano
+        """
+        planes = self.get_frustum_planes()
+        distances = planes[:, :3] @ np.asarray(center, dtype=np.float32) + planes[:, 3]
+        return bool(np.all(distances >= -radius))
+
+    def is_box_visible(self, min_point, max_point):
+        """
+        Testa uma AABB contra o frustum (teste do vértice positivo)
+        Returns:
+            False se a caixa estiver inteiramente fora de algum plano
+        """
+        planes = self.get_frustum_planes()
+        # Para cada plano, o canto da caixa mais à frente na direção da normal
+        positive = np.where(planes[:, :3] >= 0, max_point, min_point)
+        distances = np.einsum('ij,ij->i', planes[:, :3], positive) + planes[:, 3]
+        return bool(np.all(distances >= 0))
 
     def get_position(self):
         """Retorna a posição da câmera"""
@@ -118,3 +297,13 @@ class Camera:
         if norm > 0:
             forward = forward / norm
         return tuple(forward)
+
+    def copy(self):
+        """
+        Cria uma cópia da câmera em O(1)
+        Os vetores são somente leitura e as matrizes em cache nunca são
+        modificadas (só substituídas), então podem ser compartilhadas.
+        """
+        new_camera = object.__new__(Camera)
+        new_camera.__dict__.update(self.__dict__)
+        return new_camera
@@ -0,0 +1,177 @@
+"""
+Recorte (clipping) de triângulos no espaço de recorte homogêneo
+Sutherland-Hodgman vetorizado contra o plano próximo e uma guard band
+"""
+
+import numpy as np
+from collections import namedtuple
+
+
+# Resultado do recorte: triângulos sobre o buffer de vértices estendido
+# - triangles: (T', 3) índices; valores >= N apontam para os novos vértices
+# - source: (T',) linha do triângulo de entrada que originou cada triângulo
+# - new_vertex_source: (V',) triângulo de entrada de cada novo vértice
+# - new_vertex_weights: (V', 3) pesos baricêntricos de cada novo vértice
+ClippedTriangles = namedtuple(
+    'ClippedTriangles', ['triangles', 'source', 'new_vertex_source', 'new_vertex_weights']
+)
+
+# Fator padrão da guard band: vértices até 4x meia-tela além da borda não são recortados
+GUARD_BAND = 4.0
+
+
+def _clip_planes(extent):
+    """
+    Planos (a, b, c, d) no espaço de recorte; dentro quando a*x + b*y + c*z + d*w >= 0
+    Args:
+        extent: Limite lateral em múltiplos de w (1.0 = bordas da tela)
+    Returns:
+        Array (5, 4): perto, esquerda, direita, baixo, cima
+    """
+    return np.array([
+        [0, 0, 1, 1],
+        [1, 0, 0, extent],
+        [-1, 0, 0, extent],
+        [0, 1, 0, extent],
+        [0, -1, 0, extent]
+    ], dtype=np.float32)
+
+
+def clip_triangles(clip, triangles, guard_band=GUARD_BAND):
+    """
+    Recorta triângulos contra o plano próximo e a guard band
+    Triângulos inteiramente fora da tela ou atrás do plano próximo são
+    descartados; os que cruzam um plano viram polígonos (até 8 vértices),
+    triangulados em leque. Os novos vértices são descritos por pesos
+    baricêntricos do triângulo de origem, então qualquer atributo por vértice
+    (posição, normal, cor) pode ser interpolado com interpolate_attributes.
+    Args:
+        clip: Array (N, 4) de vértices no espaço de recorte (x, y, z, w)
+        triangles: Buffer de índices (T, 3)
+        guard_band: Limite de recorte lateral, em múltiplos de w
+    Returns:
+        ClippedTriangles, com os triângulos na mesma ordem da entrada
+    """
+    clip = np.asarray(clip, dtype=np.float32).reshape(-1, 4)
+    triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+    vertex_count = len(clip)
+
+    # Rejeição trivial contra as bordas da tela; recorte contra a guard band
+    screen_dist = clip @ _clip_planes(1.0).T
+    guard_dist = clip @ _clip_planes(guard_band).T
+    rejected = np.any(np.all(screen_dist[triangles] < 0, axis=1), axis=1)
+    needs_clip = ~rejected & np.any(guard_dist[triangles] < 0, axis=(1, 2))
+    kept = ~rejected & ~needs_clip
+
+    kept_rows = np.nonzero(kept)[0].astype(np.int32)
+    clip_rows = np.nonzero(needs_clip)[0].astype(np.int32)
+
+    if len(clip_rows) == 0:
+        return ClippedTriangles(
+            triangles[kept_rows], kept_rows,
+            np.empty(0, dtype=np.int32), np.empty((0, 3), dtype=np.float32)
+        )
+
+    # Polígonos em pesos baricêntricos: começam como os três cantos
+    count = len(clip_rows)
+    weights = np.zeros((count, 3, 3), dtype=np.float32)
+    weights[:, [0, 1, 2], [0, 1, 2]] = 1.0
+    sizes = np.full(count, 3, dtype=np.int32)
+    corner_dist = guard_dist[triangles[clip_rows]]  # (K, 3 cantos, 5 planos)
+
+    for plane in range(corner_dist.shape[2]):
+        weights, sizes = _clip_polygons(weights, sizes, corner_dist[:, :, plane])
+
+    # Triangulação em leque (0, k, k + 1) dos polígonos com pelo menos 3 vértices
+    max_size = weights.shape[1]
+    valid_polygon = sizes >= 3
+    polygon_vertex = np.arange(max_size)[np.newaxis, :] < sizes[:, np.newaxis]
+    polygon_vertex &= valid_polygon[:, np.newaxis]
+
+    new_vertex_ids = np.full((count, max_size), -1, dtype=np.int64)
+    new_vertex_ids[polygon_vertex] = vertex_count + np.arange(int(polygon_vertex.sum()))
+    polygon_id, _ = np.nonzero(polygon_vertex)
+
+    fan = np.arange(1, max(max_size - 1, 1))
+    fan_valid = fan[np.newaxis, :] < (sizes - 1)[:, np.newaxis]
+    fan_valid &= valid_polygon[:, np.newaxis]
+    fan_polygon, fan_index = np.nonzero(fan_valid)
+    fan_k = fan[fan_index]
+
+    clipped_triangles = np.stack([
+        new_vertex_ids[fan_polygon, 0],
+        new_vertex_ids[fan_polygon, fan_k],
+        new_vertex_ids[fan_polygon, fan_k + 1]
+    ], axis=1).astype(np.int32)
+
+    # Junta triângulos mantidos e recortados preservando a ordem de entrada
+    all_triangles = np.concatenate([triangles[kept_rows], clipped_triangles])
+    all_source = np.concatenate([kept_rows, clip_rows[fan_polygon]])
+    order = np.argsort(all_source, kind='stable')
+
+    return ClippedTriangles(
+        all_triangles[order],
+        all_source[order],
+        clip_rows[polygon_id],
+        weights[polygon_vertex]
+    )
+
+
+def _clip_polygons(weights, sizes, corner_dist):
+    """
+    Uma etapa de Sutherland-Hodgman para vários polígonos contra um plano
+    Args:
+        weights: Array (K, n, 3) com os vértices dos polígonos (pesos baricêntricos)
+        sizes: Array (K,) com o número de vértices de cada polígono
+        corner_dist: Array (K, 3) com a distância ao plano dos cantos originais
+    Returns:
+        Tupla (weights, sizes) dos polígonos recortados
+    """
+    count, max_size = weights.shape[:2]
+    index = np.arange(max_size)[np.newaxis, :]
+    valid = index < sizes[:, np.newaxis]
+
+    # A distância é linear nos pesos baricêntricos
+    dist = np.einsum('knj,kj->kn', weights, corner_dist)
+    following = np.where(index + 1 < sizes[:, np.newaxis], index + 1, 0)
+    next_weights = np.take_along_axis(weights, following[:, :, np.newaxis], axis=1)
+    next_dist = np.take_along_axis(dist, following, axis=1)
+
+    inside = dist >= 0
+    emit_current = valid & inside
+    emit_crossing = valid & (inside != (next_dist >= 0))
+
+    # Ponto de interseção da aresta (atual -> próximo) com o plano
+    denominator = dist - next_dist
+    t = np.divide(dist, denominator, out=np.zeros_like(dist), where=emit_crossing)
+    crossing = weights + t[:, :, np.newaxis] * (next_weights - weights)
+
+    # Cada aresta emite [atual] e/ou [interseção]; compacta as saídas por polígono
+    candidates = np.stack([weights, crossing], axis=2).reshape(count, 2 * max_size, 3)
+    emitted = np.stack([emit_current, emit_crossing], axis=2).reshape(count, 2 * max_size)
+    order = np.argsort(~emitted, axis=1, kind='stable')
+    new_sizes = emitted.sum(axis=1).astype(np.int32)
+
+    new_max = max(int(new_sizes.max()), 1)
+    order = order[:, :new_max]
+    new_weights = np.take_along_axis(candidates, order[:, :, np.newaxis], axis=1)
+    return new_weights, new_sizes
+
+
+def interpolate_attributes(values, triangles, clipped):
+    """
+    Estende um atributo por vértice com os valores dos novos vértices do recorte
+    Args:
+        values: Array (N, C) com o atributo dos vértices originais
+        triangles: Buffer de índices (T, 3) passado para clip_triangles
+        clipped: Resultado de clip_triangles
+    Returns:
+        Array (N + V', C) com o atributo para o buffer de vértices estendido
+    """
+    values = np.asarray(values)
+    if len(clipped.new_vertex_source) == 0:
+        return values
+
+    corners = values[np.asarray(triangles)[clipped.new_vertex_source]]
+    new_values = np.einsum('vj,vjc->vc', clipped.new_vertex_weights, corners)
+    return np.concatenate([values, new_values.astype(values.dtype, copy=False)])
@@ -7,6 +7,79 @@ import numpy as np
 import math
 
 
+def _normalize_rows(vectors):
+    """
+    Normaliza cada linha de um array (..., 3), preservando vetores nulos
+    Args:
+        vectors: Array (..., 3)
+    Returns:
+        Array (..., 3) float32 com vetores unitários
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.sqrt(np.einsum('...i,...i->...', vectors, vectors))[..., np.newaxis]
+    return np.divide(vectors, norms, out=vectors.copy(), where=norms > 0)
+
+
+def _light_terms(points, normals, light, camera_pos,
+                 ambient, diffuse, specular=0.0, shininess=1):
+    """
+    Calcula os termos de luz independentes do material
+    A cor final é material * diffuse_terms + specular_terms, o que permite
+    iluminar em uma resolução e aplicar o material em outra.
+    Args:
+        points: Array (..., 3) de posições (ex.: (N, 3) ou um G-buffer (W, H, 3))
+        normals: Array (..., 3) de normais
+        light: Objeto Light
+        camera_pos: Posição da câmera (ignorada se specular == 0)
+        ambient, diffuse, specular, shininess: Coeficientes do modelo
+    Returns:
+        Tupla (diffuse_terms, specular_terms), arrays (..., 3) float32
+    """
+    points = np.asarray(points, dtype=np.float32)
+    normals = _normalize_rows(normals)
+
+    # Direção da luz e termo difuso (N · L)
+    light_dirs = _normalize_rows(light.position - points)
+    n_dot_l = np.maximum(0.0, np.einsum('...i,...i->...', normals, light_dirs))
+
+    diffuse_terms = ambient + (diffuse * light.intensity * n_dot_l)[..., np.newaxis] * light.color
+
+    if specular:
+        # Vetor de visão e reflexão: R = 2(N · L)N - L
+        view_dirs = _normalize_rows(np.asarray(camera_pos, dtype=np.float32) - points)
+        reflect_dirs = _normalize_rows(2.0 * n_dot_l[..., np.newaxis] * normals - light_dirs)
+        r_dot_v = np.maximum(0.0, np.einsum('...i,...i->...', reflect_dirs, view_dirs))
+        specular_strength = specular * light.intensity * r_dot_v ** shininess
+        specular_terms = specular_strength[..., np.newaxis] * light.color
+    else:
+        specular_terms = np.zeros_like(diffuse_terms)
+
+    return diffuse_terms.astype(np.float32), specular_terms.astype(np.float32)
+
+
+def _shade_batch(points, normals, light, material_color, camera_pos,
+                 ambient, diffuse, specular=0.0, shininess=1):
+    """
+    Avalia ambiente + difusa (+ especular de Phong) para N pontos de uma vez
+    Args:
+        points: Array (N, 3) de posições
+        normals: Array (N, 3) de normais
+        light: Objeto Light
+        material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3)
+        camera_pos: Posição da câmera (ignorada se specular == 0)
+        ambient, diffuse, specular, shininess: Coeficientes do modelo
+    Returns:
+        Array (N, 3) float32 com cores RGB (0.0-1.0)
+    """
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+    diffuse_terms, specular_terms = _light_terms(points, normals, light, camera_pos,
+                                                 ambient, diffuse, specular, shininess)
+    material = np.asarray(material_color, dtype=np.float32)
+    final_color = material * diffuse_terms + specular_terms
+    return np.clip(final_color, 0.0, 1.0).astype(np.float32)
+
+
 class Light:
     """Classe para representar uma fonte de luz"""
 
@@ -37,6 +110,17 @@ class Light:
             direction = direction / norm
         return direction
 
+    def get_directions_to(self, points):
+        """
+        Versão vetorizada de get_direction_to
+        Args:
+            points: Array (N, 3) de pontos
+        Returns:
+            Array (N, 3) com vetores normalizados da luz para cada ponto
+        """
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        return _normalize_rows(self.position - points)
+
     def get_distance_to(self, point):
         """Calcula distância da luz até um ponto"""
         point = np.array(point, dtype=np.float32)
@@ -109,13 +193,30 @@ class LambertianShading:
         final_color = np.clip(final_color, 0.0, 1.0)
         return tuple((final_color * 255).astype(int))
 
+    def calculate_colors(self, points, normals, light, material_color, camera_pos=None):
+        """
+        Calcula as cores de vários pontos de uma só vez (vetorizado)
+        Args:
+            points: Array (N, 3) de posições
+            normals: Array (N, 3) de normais
+            light: Objeto Light
+            material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3)
+            camera_pos: Posição da câmera (não usado no Lambertiano)
+        Returns:
+            Array (N, 3) uint8 com as cores RGB (0-255)
+        """
+        colors = _shade_batch(points, normals, light, material_color, camera_pos,
+                              self.ambient, self.diffuse)
+        return (colors * 255).astype(np.uint8)
+
 
 class PhongShading:
     """
     Modelo de iluminação PHONG
 
     Modelo completo com componentes ambiente, difusa e especular.
-    Calcula iluminação por pixel.
+    Com per_pixel=True (e o backend 'zbuffer'), a iluminação é calculada por
+    pixel sobre o G-buffer; caso contrário, uma vez por face.
 
     Intensidade = Ia + Id * (N · L) + Is * (R · V)^n
 
@@ -130,7 +231,7 @@ class PhongShading:
     - n: Coeficiente de brilho
     """
 
-    def __init__(self, ambient=0.2, diffuse=0.6, specular=0.5, shininess=32):
+    def __init__(self, ambient=0.2, diffuse=0.6, specular=0.5, shininess=32, per_pixel=False):
         """
         Inicializa o modelo Phong
         Args:
@@ -138,11 +239,13 @@ class PhongShading:
             diffuse: Intensidade da componente difusa
             specular: Intensidade da componente especular
             shininess: Coeficiente de brilho (quanto maior, mais concentrado o brilho)
+            per_pixel: Se True, ilumina cada pixel com normais interpoladas (G-buffer)
         """
         self.ambient = ambient
         self.diffuse = diffuse
         self.specular = specular
         self.shininess = shininess
+        self.per_pixel = per_pixel
 
     def calculate_color(self, point, normal, light, material_color, camera_pos):
         """
@@ -208,6 +311,36 @@ class PhongShading:
         final_color = np.clip(final_color, 0.0, 1.0)
         return tuple((final_color * 255).astype(int))
 
+    def calculate_colors(self, points, normals, light, material_color, camera_pos):
+        """
+        Calcula as cores de vários pontos de uma só vez (vetorizado)
+        Args:
+            points: Array (N, 3) de posições
+            normals: Array (N, 3) de normais
+            light: Objeto Light
+            material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3)
+            camera_pos: Posição da câmera
+        Returns:
+            Array (N, 3) uint8 com as cores RGB (0-255)
+        """
+        colors = _shade_batch(points, normals, light, material_color, camera_pos,
+                              self.ambient, self.diffuse, self.specular, self.shininess)
+        return (colors * 255).astype(np.uint8)
+
+    def calculate_light_terms(self, points, normals, light, camera_pos):
+        """
+        Calcula os termos de luz sem o material (usado no passo por pixel)
+        Args:
+            points: Array (N, 3) de posições
+            normals: Array (N, 3) de normais
+            light: Objeto Light
+            camera_pos: Posição da câmera
+        Returns:
+            Tupla (diffuse_terms, specular_terms); cor = material * difusa + especular
+        """
+        return _light_terms(points, normals, light, camera_pos,
+                            self.ambient, self.diffuse, self.specular, self.shininess)
+
 
 class GouraudShading:
     """
@@ -312,6 +445,36 @@ class GouraudShading:
         color = self.calculate_vertex_color(point, normal, light, material_color, camera_pos)
         return tuple((color * 255).astype(int))
 
+    def calculate_vertex_colors(self, vertices, normals, light, material_color, camera_pos):
+        """
+        Versão vetorizada de calculate_vertex_color
+        Args:
+            vertices: Array (N, 3) de posições dos vértices
+            normals: Array (N, 3) de normais nos vértices
+            light: Objeto Light
+            material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3)
+            camera_pos: Posição da câmera
+        Returns:
+            Array (N, 3) float32 com cores RGB (0.0-1.0) para interpolação
+        """
+        return _shade_batch(vertices, normals, light, material_color, camera_pos,
+                            self.ambient, self.diffuse, self.specular, self.shininess)
+
+    def calculate_colors(self, points, normals, light, material_color, camera_pos):
+        """
+        Calcula as cores de vários pontos de uma só vez (vetorizado)
+        Args:
+            points: Array (N, 3) de posições
+            normals: Array (N, 3) de normais
+            light: Objeto Light
+            material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3)
+            camera_pos: Posição da câmera
+        Returns:
+            Array (N, 3) uint8 com as cores RGB (0-255)
+        """
+        colors = self.calculate_vertex_colors(points, normals, light, material_color, camera_pos)
+        return (colors * 255).astype(np.uint8)
+
     @staticmethod
     def interpolate_colors(color1, color2, color3, w1, w2, w3):
         """
@@ -0,0 +1,499 @@
+"""
+Rasterizador por software com z-buffer
+Preenche triângulos em um framebuffer NumPy (cor + profundidade)
+"""
+
+import os
+import numpy as np
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from core.config import RASTER_TILE_SIZE, RASTER_WORKERS
+except ImportError:
+    from ..core.config import RASTER_TILE_SIZE, RASTER_WORKERS
+
+
+# Pools de threads compartilhados por número de workers (sobrevivem à troca de
+# resolução, que recria o Renderer e o rasterizador)
+_executors = {}
+
+
+def _get_executor(workers):
+    """Retorna o ThreadPoolExecutor compartilhado com o número de workers dado"""
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='raster')
+        _executors[workers] = executor
+    return executor
+
+
+class ZBufferRasterizer:
+    """
+    Rasterizador vetorizado com teste de profundidade por pixel
+
+    Os triângulos são agrupados pelo tamanho da bounding box e cada grupo é
+    rasterizado de uma vez com funções de aresta (edge functions) avaliadas
+    sobre todos os pixels candidatos. O custo cresce com o número de pixels
+    cobertos, não com o número de chamadas Python por triângulo.
+
+    Os buffers usam o layout (x, y) de pygame.surfarray, para que o resultado
+    seja copiado para a tela com um único blit por frame.
+
+    Para iluminação por pixel, draw_triangles_deferred grava posição, normal e
+    cor do material interpoladas em um G-buffer; shade_deferred ilumina depois
+    todos os pixels cobertos em um único passo vetorizado.
+
+    Com mais de um worker, a tela é dividida em tiles (por padrão, faixas
+    verticais: poucos lotes por tile e memória contígua no layout (x, y)).
+    Cada triângulo é distribuído aos tiles que sua bounding box toca, com a
+    caixa recortada ao tile, e os tiles são rasterizados (e iluminados) em
+    paralelo. Como cada tile escreve só nos seus pixels, as threads não
+    disputam os buffers, e o NumPy libera o GIL dentro dos kernels de array.
+    """
+
+    # Número máximo de pixels candidatos avaliados por lote
+    MAX_BATCH_PIXELS = 1 << 20
+
+    # Abaixo desta área total de bounding boxes (px) o custo das threads não compensa
+    MIN_PARALLEL_PIXELS = 1 << 16
+
+    def __init__(self, width, height, workers=None, tile_size=None):
+        """
+        Inicializa o framebuffer
+        Args:
+            width: Largura do framebuffer
+            height: Altura do framebuffer
+            workers: Threads de rasterização (padrão: RASTER_WORKERS; None no
+                     config = número de núcleos; 1 = sem threads)
+            tile_size: Lado dos tiles em pixels (padrão: RASTER_TILE_SIZE; None =
+                       faixas verticais de altura inteira, duas por worker)
+        """
+        if workers is None:
+            workers = RASTER_WORKERS if RASTER_WORKERS is not None else os.cpu_count()
+        self.workers = max(1, int(workers or 1))
+        self.tile_size = tile_size if tile_size is not None else RASTER_TILE_SIZE
+        self.resize(width, height)
+
+    def _parallel(self, work_pixels):
+        """Indica se vale a pena dividir um trabalho desse tamanho entre threads"""
+        return self.workers > 1 and work_pixels >= self.MIN_PARALLEL_PIXELS
+
+    def resize(self, width, height):
+        """Recria os buffers com um novo tamanho"""
+        self.width = width
+        self.height = height
+
+        # Tiles com largura par (não cortam os blocos 2x2 da iluminação em meia resolução)
+        if self.tile_size:
+            self.tile_width, self.tile_height = self.tile_size, self.tile_size
+        else:
+            self.tile_width, self.tile_height = -(-width // (2 * self.workers)), height
+        self.tile_width += self.tile_width % 2
+
+        self.color_buffer = np.zeros((width, height, 3), dtype=np.uint8)
+        self.depth_buffer = np.full((width, height), np.inf, dtype=np.float32)
+
+        # Framebuffer já preenchido com a cor de fundo (limpeza vira uma cópia contígua)
+        self._clear_color = None
+        self._clear_template = None
+
+        # G-buffer (criado no primeiro uso)
+        self.gbuffer_mask = None
+        self.gbuffer_positions = None
+        self.gbuffer_normals = None
+        self.gbuffer_albedo = None
+
+    def _ensure_gbuffer(self):
+        """Aloca o G-buffer se ainda não existir"""
+        if self.gbuffer_mask is not None:
+            return
+
+        self.gbuffer_mask = np.zeros((self.width, self.height), dtype=bool)
+        self.gbuffer_positions = np.zeros((self.width, self.height, 3), dtype=np.float32)
+        self.gbuffer_normals = np.zeros((self.width, self.height, 3), dtype=np.float32)
+        self.gbuffer_albedo = np.zeros((self.width, self.height, 3), dtype=np.float32)
+
+    def clear(self, color):
+        """
+        Limpa os buffers de cor e profundidade
+        Args:
+            color: Cor de fundo RGB (0-255)
+        """
+        color = tuple(color)
+        if color != self._clear_color:
+            self._clear_template = np.empty_like(self.color_buffer)
+            self._clear_template[:] = color
+            self._clear_color = color
+
+        np.copyto(self.color_buffer, self._clear_template)
+        self.depth_buffer.fill(np.inf)
+        if self.gbuffer_mask is not None:
+            self.gbuffer_mask.fill(False)
+
+    def draw_triangles(self, screen_points, depths, triangles, colors):
+        """
+        Rasteriza triângulos com cor sólida e teste de profundidade
+        Args:
+            screen_points: Array (N, 2) com coordenadas de tela (x, y)
+            depths: Array (N,) com a profundidade de cada vértice (menor = mais perto)
+            triangles: Buffer de índices (T, 3)
+            colors: Array (T, 3) com a cor RGB (0-255) de cada triângulo
+        """
+        triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+        colors = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+        self._draw(screen_points, depths, triangles, colors, mode='flat')
+
+    def draw_triangles_smooth(self, screen_points, depths, triangles, vertex_colors):
+        """
+        Rasteriza triângulos interpolando a cor dos vértices (Gouraud)
+        A cor de cada pixel é a combinação baricêntrica das cores dos três vértices.
+        Args:
+            screen_points: Array (N, 2) com coordenadas de tela (x, y)
+            depths: Array (N,) com a profundidade de cada vértice
+            triangles: Buffer de índices (T, 3)
+            vertex_colors: Array (N, 3) com a cor RGB (0.0-1.0) de cada vértice
+        """
+        triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+        vertex_colors = np.asarray(vertex_colors, dtype=np.float32).reshape(-1, 3)
+        colors = vertex_colors[triangles] * 255.0
+        self._draw(screen_points, depths, triangles, colors, mode='smooth')
+
+    def draw_triangles_deferred(self, screen_points, depths, triangles,
+                                vertex_positions, vertex_normals, material_color, flipped=None,
+                                inverse_w=None):
+        """
+        Rasteriza triângulos no G-buffer (posição, normal e material por pixel)
+        A iluminação é feita depois, uma única vez, por shade_deferred. Com
+        inverse_w, a interpolação é corrigida pela perspectiva: atributo/w e 1/w
+        são interpolados na tela e divididos por pixel.
+        Args:
+            screen_points: Array (N, 2) com coordenadas de tela (x, y)
+            depths: Array (N,) com a profundidade de cada vértice
+            triangles: Buffer de índices (T, 3)
+            vertex_positions: Array (N, 3) com as posições no mundo
+            vertex_normals: Array (N, 3) com as normais dos vértices
+            material_color: Cor do material RGB (0.0-1.0), (3,) ou (N, 3) por vértice
+            flipped: Array (T,) bool opcional; inverte as normais desses triângulos
+                     (faces vistas de costas)
+            inverse_w: Array (N,) opcional com 1/w (espaço de recorte) de cada
+                       vértice; None interpola linearmente na tela
+        """
+        self._ensure_gbuffer()
+        triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+
+        # Atributos pré-multiplicados por 1/w, com 1/w na última coluna
+        attributes = np.empty((len(vertex_positions), 10), dtype=np.float32)
+        attributes[:, 0:3] = vertex_positions
+        attributes[:, 3:6] = vertex_normals
+        attributes[:, 6:9] = material_color
+        attributes[:, 9] = 1.0 if inverse_w is None else inverse_w
+        attributes[:, 0:9] *= attributes[:, 9:10]
+
+        corner_attributes = attributes[triangles]
+        if flipped is not None:
+            corner_attributes[flipped, :, 3:6] *= -1.0
+
+        self._draw(screen_points, depths, triangles, corner_attributes, mode='deferred')
+
+    def shade_deferred(self, shading_model, light, camera_pos, half_resolution=False):
+        """
+        Ilumina todos os pixels do G-buffer em um único passo vetorizado
+        Args:
+            shading_model: Modelo com calculate_light_terms (PhongShading)
+            light: Objeto Light
+            camera_pos: Posição da câmera
+            half_resolution: Se True, ilumina blocos 2x2 (1/4 dos pixels) e aplica
+                             o material em resolução cheia, mantendo as bordas nítidas
+        """
+        if self.gbuffer_mask is None:
+            return
+
+        # Índices lineares (x * altura + y) dos pixels cobertos
+        pixels = np.flatnonzero(self.gbuffer_mask)
+        if len(pixels) == 0:
+            return
+
+        if not self._parallel(len(pixels)):
+            self._shade_pixels(pixels, shading_model, light, camera_pos, half_resolution)
+            return
+
+        # Faixas de colunas com largura de um tile (par, então os blocos 2x2 não
+        # são divididos); os índices são crescentes em x, então cada faixa é contígua
+        bounds = np.searchsorted(pixels, np.arange(0, self.width, self.tile_width) * self.height)
+        chunks = [chunk for chunk in np.split(pixels, bounds[1:]) if len(chunk)]
+
+        def shade(chunk):
+            self._shade_pixels(chunk, shading_model, light, camera_pos, half_resolution)
+
+        list(_get_executor(self.workers).map(shade, chunks))
+
+    def _shade_pixels(self, pixels, shading_model, light, camera_pos, half_resolution):
+        """Ilumina um conjunto de pixels do G-buffer (ver shade_deferred)"""
+        positions = self.gbuffer_positions.reshape(-1, 3)[pixels]
+        normals = self.gbuffer_normals.reshape(-1, 3)[pixels]
+
+        if half_resolution:
+            # Bloco 2x2 de cada pixel e lista compacta dos blocos ocupados
+            blocks_h = (self.height + 1) // 2
+            pixel_blocks = (pixels // self.height // 2) * blocks_h + (pixels % self.height) // 2
+            occupied = np.zeros(((self.width + 1) // 2) * blocks_h, dtype=bool)
+            occupied[pixel_blocks] = True
+            block_ids = np.flatnonzero(occupied)
+            block_lookup = np.empty(len(occupied), dtype=np.int64)
+            block_lookup[block_ids] = np.arange(len(block_ids))
+            pixel_blocks = block_lookup[pixel_blocks]
+
+            # Média das amostras cobertas de cada bloco
+            counts = np.bincount(pixel_blocks, minlength=len(block_ids))[:, np.newaxis]
+            block_positions = np.stack([
+                np.bincount(pixel_blocks, weights=positions[:, axis], minlength=len(block_ids))
+                for axis in range(3)
+            ], axis=1) / counts
+            block_normals = np.stack([
+                np.bincount(pixel_blocks, weights=normals[:, axis], minlength=len(block_ids))
+                for axis in range(3)
+            ], axis=1)
+
+            diffuse_terms, specular_terms = shading_model.calculate_light_terms(
+                block_positions, block_normals, light, camera_pos
+            )
+            diffuse_terms = diffuse_terms[pixel_blocks]
+            specular_terms = specular_terms[pixel_blocks]
+        else:
+            diffuse_terms, specular_terms = shading_model.calculate_light_terms(
+                positions, normals, light, camera_pos
+            )
+
+        # O material é aplicado em resolução cheia (bordas nítidas mesmo em meia resolução)
+        colors = self.gbuffer_albedo.reshape(-1, 3)[pixels] * diffuse_terms + specular_terms
+        colors = (np.clip(colors, 0.0, 1.0) * 255).astype(np.uint8)
+        self.color_buffer.reshape(-1, 3)[pixels] = colors
+
+    def _draw(self, screen_points, depths, triangles, colors, mode):
+        """
+        Agrupa os triângulos por tamanho de bounding box e rasteriza cada grupo
+        Args:
+            colors: (T, 3) cores por triângulo ('flat') ou (T, 3, C) atributos
+                    por canto a interpolar ('smooth' e 'deferred')
+        """
+        if len(triangles) == 0:
+            return
+
+        corners = np.asarray(screen_points, dtype=np.float32)[triangles]
+        corner_depths = np.asarray(depths, dtype=np.float32)[triangles]
+
+        # Bounding box em pixels (centros de pixel em i + 0.5), recortada à tela
+        x0 = np.ceil(corners[:, :, 0].min(axis=1) - 0.5).astype(np.int32)
+        x1 = np.floor(corners[:, :, 0].max(axis=1) - 0.5).astype(np.int32)
+        y0 = np.ceil(corners[:, :, 1].min(axis=1) - 0.5).astype(np.int32)
+        y1 = np.floor(corners[:, :, 1].max(axis=1) - 0.5).astype(np.int32)
+        np.clip(x0, 0, self.width, out=x0)
+        np.clip(y0, 0, self.height, out=y0)
+        np.clip(x1, -1, self.width - 1, out=x1)
+        np.clip(y1, -1, self.height - 1, out=y1)
+
+        # Área com sinal (descarta triângulos degenerados ou fora da tela)
+        area = (
+            (corners[:, 1, 0] - corners[:, 0, 0]) * (corners[:, 2, 1] - corners[:, 0, 1]) -
+            (corners[:, 1, 1] - corners[:, 0, 1]) * (corners[:, 2, 0] - corners[:, 0, 0])
+        )
+        valid = (area != 0) & (x1 >= x0) & (y1 >= y0)
+        if not np.any(valid):
+            return
+
+        ids = np.nonzero(valid)[0]
+        x0, x1, y0, y1 = x0[ids], x1[ids], y0[ids], y1[ids]
+        work_pixels = int(((x1 - x0 + 1).astype(np.int64) * (y1 - y0 + 1)).sum())
+
+        if not self._parallel(work_pixels):
+            self._draw_boxes(ids, x0, x1, y0, y1, corners, corner_depths, area, colors, mode)
+            return
+
+        tiles = self._bin_tiles(ids, x0, x1, y0, y1)
+        list(_get_executor(self.workers).map(
+            lambda tile: self._draw_boxes(*tile, corners, corner_depths, area, colors, mode),
+            tiles
+        ))
+
+    def _bin_tiles(self, ids, x0, x1, y0, y1):
+        """
+        Distribui os triângulos pelos tiles que suas bounding boxes tocam
+        Args:
+            ids: Array (T,) com os triângulos
+            x0, x1, y0, y1: Arrays (T,) com as bounding boxes em pixels
+        Returns:
+            Lista de tuplas (ids, x0, x1, y0, y1) por tile não vazio, com as caixas
+            recortadas ao tile e os triângulos na ordem de entrada
+        """
+        tile_w, tile_h = self.tile_width, self.tile_height
+        tiles_x = -(-self.width // tile_w)
+        tx0, tx1 = x0 // tile_w, x1 // tile_w
+        ty0, ty1 = y0 // tile_h, y1 // tile_h
+        span_x = tx1 - tx0 + 1
+        counts = span_x * (ty1 - ty0 + 1)
+
+        # Um par (triângulo, tile) para cada tile coberto por cada bounding box
+        pair = np.repeat(np.arange(len(ids)), counts)
+        local = np.arange(len(pair)) - np.repeat(np.cumsum(counts) - counts, counts)
+        tile_x = tx0[pair] + local % span_x[pair]
+        tile_y = ty0[pair] + local // span_x[pair]
+        tile_ids = tile_y * tiles_x + tile_x
+
+        order = np.argsort(tile_ids, kind='stable')
+        pair, tile_x, tile_y, tile_ids = pair[order], tile_x[order], tile_y[order], tile_ids[order]
+        starts = np.flatnonzero(np.diff(tile_ids, prepend=-1))
+        ends = np.append(starts[1:], len(pair))
+
+        tiles = []
+        for start, end in zip(starts, ends):
+            members = pair[start:end]
+            left, top = tile_x[start] * tile_w, tile_y[start] * tile_h
+            tiles.append((
+                ids[members],
+                np.maximum(x0[members], left),
+                np.minimum(x1[members], left + tile_w - 1),
+                np.maximum(y0[members], top),
+                np.minimum(y1[members], top + tile_h - 1)
+            ))
+        return tiles
+
+    def _draw_boxes(self, ids, x0, x1, y0, y1, corners, corner_depths, area, colors, mode):
+        """
+        Rasteriza triângulos restritos às caixas dadas (a tela inteira ou um tile)
+        Args:
+            ids: Array (T,) com os índices dos triângulos em corners/colors
+            x0, x1, y0, y1: Arrays (T,) com as caixas em pixels de cada triângulo
+        """
+        box_w = x1 - x0 + 1
+        box_h = y1 - y0 + 1
+
+        # Agrupa por tamanho de bounding box (potências de 2) para limitar desperdício
+        bucket_w = 1 << np.ceil(np.log2(box_w)).astype(np.int64)
+        bucket_h = 1 << np.ceil(np.log2(box_h)).astype(np.int64)
+        bucket_keys = bucket_w * (1 << 16) + bucket_h
+
+        for key in np.unique(bucket_keys):
+            in_bucket = np.nonzero(bucket_keys == key)[0]
+            grid_w = int(box_w[in_bucket].max())
+            grid_h = int(box_h[in_bucket].max())
+            per_batch = max(1, self.MAX_BATCH_PIXELS // (grid_w * grid_h))
+
+            for start in range(0, len(in_bucket), per_batch):
+                rows = in_bucket[start:start + per_batch]
+                batch = ids[rows]
+                self._rasterize_batch(
+                    corners[batch], corner_depths[batch], area[batch], colors[batch],
+                    x0[rows], x1[rows], y0[rows], y1[rows], grid_w, grid_h, mode
+                )
+
+    def _rasterize_batch(self, corners, corner_depths, area, colors,
+                         x0, x1, y0, y1, grid_w, grid_h, mode):
+        """Rasteriza um lote de triângulos com bounding boxes de tamanho parecido"""
+        grid_x = np.arange(grid_w, dtype=np.int32)[np.newaxis, np.newaxis, :]
+        grid_y = np.arange(grid_h, dtype=np.int32)[np.newaxis, :, np.newaxis]
+        px = x0[:, np.newaxis, np.newaxis] + grid_x
+        py = y0[:, np.newaxis, np.newaxis] + grid_y
+
+        weights, inside = self._barycentric(corners, area, px, py)
+        inside &= (px <= x1[:, np.newaxis, np.newaxis]) & (py <= y1[:, np.newaxis, np.newaxis])
+
+        tri_ids, rows, cols = np.nonzero(inside)
+        if len(tri_ids) == 0:
+            return
+
+        pixel_x = px[tri_ids, 0, cols]
+        pixel_y = py[tri_ids, rows, 0]
+        w0 = weights[0][tri_ids, rows, cols]
+        w1 = weights[1][tri_ids, rows, cols]
+        w2 = weights[2][tri_ids, rows, cols]
+
+        fragment_depths = (
+            w0 * corner_depths[tri_ids, 0] +
+            w1 * corner_depths[tri_ids, 1] +
+            w2 * corner_depths[tri_ids, 2]
+        )
+
+        pixels = pixel_x.astype(np.int64) * self.height + pixel_y
+        winners = self._depth_test(pixels, fragment_depths)
+
+        tri_ids = tri_ids[winners]
+        pixels = pixels[winners]
+
+        if mode == 'flat':
+            fragment_values = colors[tri_ids]
+        else:
+            # Interpolação baricêntrica dos atributos dos vértices (só nos fragmentos visíveis)
+            fragment_values = (
+                w0[winners, np.newaxis] * colors[tri_ids, 0] +
+                w1[winners, np.newaxis] * colors[tri_ids, 1] +
+                w2[winners, np.newaxis] * colors[tri_ids, 2]
+            )
+
+        if mode == 'deferred':
+            # Correção de perspectiva: (atributo/w) / (1/w) interpolados
+            fragment_values = fragment_values[:, 0:9] / fragment_values[:, 9:10]
+            pixel_x = pixel_x[winners]
+            pixel_y = pixel_y[winners]
+            self.gbuffer_positions[pixel_x, pixel_y] = fragment_values[:, 0:3]
+            self.gbuffer_normals[pixel_x, pixel_y] = fragment_values[:, 3:6]
+            self.gbuffer_albedo[pixel_x, pixel_y] = fragment_values[:, 6:9]
+            self.gbuffer_mask[pixel_x, pixel_y] = True
+            return
+
+        if mode == 'smooth':
+            fragment_values = np.clip(fragment_values, 0, 255).astype(np.uint8)
+
+        color_flat = self.color_buffer.reshape(-1, 3)
+        color_flat[pixels] = fragment_values
+
+        if self.gbuffer_mask is not None:
+            # Pixels pintados diretamente deixam de ser iluminados pelo passo por pixel
+            self.gbuffer_mask[pixel_x[winners], pixel_y[winners]] = False
+
+    @staticmethod
+    def _barycentric(corners, area, px, py):
+        """
+        Avalia as funções de aresta nos centros dos pixels
+        Returns:
+            Tupla (weights, inside) com os três pesos baricêntricos e a máscara de cobertura
+        """
+        cx = px + np.float32(0.5)
+        cy = py + np.float32(0.5)
+
+        def edge(a, b):
+            ax = corners[:, a, 0][:, np.newaxis, np.newaxis]
+            ay = corners[:, a, 1][:, np.newaxis, np.newaxis]
+            bx = corners[:, b, 0][:, np.newaxis, np.newaxis]
+            by = corners[:, b, 1][:, np.newaxis, np.newaxis]
+            return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+        inv_area = (1.0 / area)[:, np.newaxis, np.newaxis]
+        w0 = edge(1, 2) * inv_area
+        w1 = edge(2, 0) * inv_area
+        w2 = edge(0, 1) * inv_area
+
+        inside = (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+        return (w0, w1, w2), inside
+
+    def _depth_test(self, pixels, fragment_depths):
+        """
+        Atualiza o z-buffer e retorna os fragmentos vencedores
+        Args:
+            pixels: Índices lineares dos pixels (x * altura + y)
+            fragment_depths: Profundidade de cada fragmento
+        Returns:
+            Máscara booleana dos fragmentos que ficaram visíveis
+        """
+        fragment_depths = fragment_depths.astype(np.float32, copy=False)
+        depth_flat = self.depth_buffer.reshape(-1)
+        np.minimum.at(depth_flat, pixels, fragment_depths)
+        return fragment_depths <= depth_flat[pixels]
+
+    def present(self, surface):
+        """
+        Copia o framebuffer para uma superfície do Pygame (um blit por frame)
+        Args:
+            surface: pygame.Surface de mesmo tamanho do framebuffer
+        """
+        pygame.surfarray.blit_array(surface, self.color_buffer)
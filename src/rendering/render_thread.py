@@ -0,0 +1,160 @@
+"""
+Renderização da cena 3D em uma thread separada
+A thread do jogo publica snapshots imutáveis da cena; a thread de
+renderização os desenha em superfícies com double buffer
+"""
+
+import copy
+import threading
+import pygame
+from collections import namedtuple
+
+try:
+    from core.logger import get_logger
+except ImportError:
+    from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Estado da cena congelado em um frame
+# - shapes: tupla de cópias dos Shape3D visíveis (Shape3D.snapshot, sem histórico)
+# - camera, light: cópias da câmera e da luz
+# - shading_model: modelo de iluminação (sem estado mutável)
+# - background: cor de fundo RGB (0-255)
+SceneSnapshot = namedtuple('SceneSnapshot', [
+    'shapes', 'camera', 'light', 'shading_model', 'background'
+])
+
+
+def take_snapshot(shapes, camera, light, shading_model, background, renderer=None):
+    """
+    Congela a cena atual para a thread de renderização
+    As matrizes de modelo e os limites são calculados antes da cópia, para que
+    a thread de renderização não precise tocar na transformação dos originais.
+    Com um renderer, o nível de detalhe também é escolhido aqui (ver
+    Renderer.select_lod), o que só faz sentido se shapes forem os objetos do
+    jogo; quem passa cópias (ex.: interpoladas) escolhe o LOD antes, nos
+    originais, e não passa renderer.
+    Args:
+        shapes: Lista de Shape3D
+        camera: Objeto Camera
+        light: Objeto Light
+        shading_model: Modelo de iluminação
+        background: Cor de fundo RGB (0-255)
+        renderer: Renderer da thread (define o LOD); None mantém o nível atual
+    Returns:
+        SceneSnapshot
+    """
+    visible = [shape for shape in shapes if shape.visible]
+    if renderer is not None:
+        renderer.select_lod(visible, camera)
+
+    # snapshot() materializa matriz de modelo, matriz normal e limites
+    frozen = tuple(shape.snapshot() for shape in visible)
+    return SceneSnapshot(frozen, camera.copy(), copy.deepcopy(light), shading_model, background)
+
+
+class RenderThread:
+    """
+    Thread que desenha a cena 3D a partir de snapshots, com double buffer
+
+    submit() guarda o snapshot mais recente (os não desenhados a tempo são
+    descartados); a thread o desenha na superfície de trás e, ao terminar,
+    troca as superfícies. blit_latest() copia a da frente para a tela, então
+    o frame N+1 é preparado e rasterizado enquanto a thread do jogo trata
+    eventos, desenha o HUD e chama pygame.display.flip() do frame N.
+    """
+
+    def __init__(self, renderer):
+        """
+        Inicia a thread de renderização
+        Args:
+            renderer: Renderer usado só por esta thread (a superfície é definida aqui)
+        """
+        self.renderer = renderer
+        size = (renderer.width, renderer.height)
+        self._layers = [pygame.Surface(size), pygame.Surface(size)]
+        self._front = None  # Índice da última superfície completa (None = nenhuma)
+        self._pending = None
+        self._error = None
+        self._running = True
+        self.frames_rendered = 0
+
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='render', daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot):
+        """Publica o snapshot do próximo frame (substitui um ainda não desenhado)"""
+        with self._condition:
+            self._pending = snapshot
+            self._condition.notify()
+
+    def blit_latest(self, surface, background):
+        """
+        Copia o último frame completo para a superfície (ou o fundo, se ainda não houver)
+        Raises:
+            Exception: Erro ocorrido na thread de renderização
+        """
+        with self._condition:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if self._front is None:
+                surface.fill(background)
+            else:
+                surface.blit(self._layers[self._front], (0, 0))
+
+    def wait_idle(self, timeout=None):
+        """
+        Espera a thread desenhar o snapshot pendente
+        Returns:
+            True se não há mais snapshot pendente
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None, timeout)
+
+    def stop(self):
+        """Encerra a thread (o frame em andamento é concluído)"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        """Laço da thread: espera um snapshot, desenha na superfície de trás e troca"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or not self._running)
+                if not self._running:
+                    return
+                snapshot = self._pending
+                back = 0 if self._front != 0 else 1
+
+            try:
+                self._draw(snapshot, self._layers[back])
+            except Exception as e:
+                logger.error(f"Erro na thread de renderização: {e}")
+                with self._condition:
+                    self._error = e
+                    self._pending = None
+                    self._condition.notify_all()
+                continue
+
+            with self._condition:
+                self._front = back
+                self.frames_rendered += 1
+                if self._pending is snapshot:
+                    self._pending = None
+                self._condition.notify_all()
+
+    def _draw(self, snapshot, surface):
+        """Desenha um snapshot em uma superfície"""
+        renderer = self.renderer
+        renderer.set_surface(surface)
+        renderer.clear(snapshot.background)
+        renderer.draw_scene(
+            list(snapshot.shapes), snapshot.camera, snapshot.shading_model, snapshot.light
+        )
+        renderer.present()
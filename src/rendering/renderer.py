@@ -2,29 +2,142 @@
 Engine de renderização 3D para Pygame
 """
 
+import math
 import pygame
 import numpy as np
+from collections import namedtuple
 from .lighting import Light
+from .rasterizer import ZBufferRasterizer
+from .clipping import GUARD_BAND, clip_triangles, interpolate_attributes
+
+
+# Malha projetada, recortada e iluminada, pronta para o backend
+# - mode: 'flat' (cor por triângulo), 'smooth' (cor por vértice) ou 'deferred' (G-buffer)
+# - sort_keys: (T,) distância à câmera usada pela ordenação do painter
+# - inverse_w: (N,) 1/w de cada vértice, para interpolar o G-buffer com perspectiva
+MeshBatch = namedtuple('MeshBatch', [
+    'mode', 'screen_points', 'depths', 'triangles', 'sort_keys', 'triangle_colors',
+    'vertex_colors', 'positions', 'normals', 'materials', 'flipped', 'inverse_w'
+])
+
+
+def _merge_batches(batches):
+    """
+    Concatena lotes de várias malhas em um só (índices deslocados por malha)
+    Returns:
+        MeshBatch com todos os triângulos
+    """
+    if len(batches) == 1:
+        return batches[0]
+
+    offsets = np.cumsum([0] + [len(batch.screen_points) for batch in batches[:-1]])
+    merged = {
+        'mode': batches[0].mode,
+        'triangles': np.concatenate([
+            batch.triangles + offset for batch, offset in zip(batches, offsets)
+        ])
+    }
+
+    for field in MeshBatch._fields:
+        if field in merged:
+            continue
+        values = [getattr(batch, field) for batch in batches]
+        merged[field] = None if values[0] is None else np.concatenate(values)
+
+    return MeshBatch(**merged)
+
+
+def _normalize_rows(vectors):
+    """Normaliza vetores (..., 3) e os achata em um array (M, 3) float32"""
+    vectors = vectors.reshape(-1, 3)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=vectors, where=norms > 0).astype(np.float32)
+
+
+def scene_fingerprint(shapes, camera, shading_model, light, background):
+    """
+    Resumo comparável de tudo o que muda a imagem da cena 3D
+    Guarda os próprios objetos (comparados por identidade) com suas versões:
+    versão da transformação, visibilidade, cor e malha ativa de cada Shape3D,
+    versão da câmera e valores da luz. Os modelos de iluminação não têm estado
+    mutável e entram só pela identidade.
+    Args:
+        shapes: Lista de Shape3D
+        camera: Objeto Camera
+        shading_model: Modelo de iluminação
+        light: Objeto Light (ou None)
+        background: Cor de fundo RGB (0-255)
+    Returns:
+        Tupla: se for igual à do frame anterior, a imagem não mudou
+    """
+    shape_states = tuple(
+        (shape, shape.version, shape.visible, tuple(shape.color), shape.mesh) for shape in shapes
+    )
+    light_state = None
+    if light is not None:
+        light_state = (light.position.tobytes(), light.color.tobytes(), light.intensity)
+    return (shape_states, camera, camera.version, shading_model, light_state, tuple(background))
 
 
 class Renderer:
     """Renderizador 3D básico para Pygame"""
 
-    def __init__(self, width, height):
+    # Backends de rasterização disponíveis
+    BACKENDS = ('painter', 'zbuffer')
+
+    def __init__(self, width, height, backend='painter', half_resolution_shading=False):
         """
         Inicializa o renderizador
         Args:
             width: Largura da tela
             height: Altura da tela
+            backend: 'painter' (ordenação por profundidade + pygame.draw)
+                     ou 'zbuffer' (framebuffer NumPy com teste de profundidade)
+            half_resolution_shading: Se True, a iluminação por pixel (Phong com
+                                     per_pixel) é calculada em blocos 2x2
         """
         self.width = width
         self.height = height
         self.surface = None
+        self.rasterizer = None
+        self.half_resolution_shading = half_resolution_shading
+
+        # Iluminação pendente do G-buffer: (modelo, luz, posição da câmera)
+        self._deferred_lighting = None
+
+        # Limite do recorte lateral em múltiplos de w (ver rendering.clipping)
+        self.guard_band = GUARD_BAND
+
+        # Seleção automática do nível de detalhe das primitivas curvas
+        self.level_of_detail = True
+
+        # Reaproveita a imagem do último frame quando a cena não mudou (render_frame)
+        self.reuse_static_frames = True
+        self._static_frame = None  # (resumo da cena, cópia da camada 3D)
+
+        # Estatísticas de frustum culling (zeradas a cada clear)
+        self.culled_shapes = 0
+        self.culled_triangles = 0
+        self.set_backend(backend)
 
     def set_surface(self, surface):
         """Define a superfície de renderização"""
         self.surface = surface
 
+    def set_backend(self, backend):
+        """
+        Seleciona o backend de rasterização
+        Args:
+            backend: 'painter' ou 'zbuffer'
+        """
+        backend = backend.lower()
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de rasterização '{backend}' não reconhecido")
+
+        self.backend = backend
+        if backend == 'zbuffer' and self.rasterizer is None:
+            self.rasterizer = ZBufferRasterizer(self.width, self.height)
+
     def project_point(self, point_3d, camera):
         """
         Projeta um ponto 3D para coordenadas 2D de tela
@@ -57,6 +170,72 @@ class Renderer:
 
         return (screen_x, screen_y, z)
 
+    def project_points(self, points, camera, vp_matrix=None):
+        """
+        Projeta vários pontos 3D de uma só vez (versão vetorizada de project_point)
+        Args:
+            points: Array (N, 3) de pontos 3D
+            camera: Objeto Camera
+            vp_matrix: Matriz numpy 4x4 view * projection já calculada (opcional)
+        Returns:
+            Tupla (screen, depth, visible):
+            - screen: Array (N, 2) int32 com coordenadas de tela
+            - depth: Array (N,) com a profundidade normalizada
+            - visible: Array (N,) bool, False onde project_point retornaria None
+        """
+        screen, depth, _ = self._project(points, camera, vp_matrix)
+        screen = screen.astype(np.int32)
+
+        visible = (
+            (depth > 0) &
+            (screen[:, 0] >= 0) & (screen[:, 0] < self.width) &
+            (screen[:, 1] >= 0) & (screen[:, 1] < self.height)
+        )
+
+        return screen, depth, visible
+
+    def _project(self, points, camera, vp_matrix=None):
+        """
+        Transforma pontos 3D em coordenadas de tela (ponto flutuante)
+        Returns:
+            Tupla (screen (N, 2) float32, depth (N,) float32, w (N,) float32)
+        """
+        clip = self._to_clip(points, camera, vp_matrix)
+        screen, depth = self._clip_to_screen(clip)
+        return screen, depth, clip[:, 3]
+
+    def _to_clip(self, points, camera, vp_matrix=None):
+        """
+        Transforma pontos 3D para o espaço de recorte homogêneo
+        Returns:
+            Array (N, 4) float32 com (x, y, z, w)
+        """
+        if vp_matrix is None:
+            vp_matrix = camera.get_view_projection_matrix().data
+
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+
+        # Uma única multiplicação (N, 3) x (3, 4) para todos os vértices, sem
+        # montar a cópia homogênea [p, 1]: a coluna de translação é somada depois
+        return points @ vp_matrix[:, :3].T + vp_matrix[:, 3]
+
+    def _clip_to_screen(self, clip):
+        """
+        Divisão perspectiva + mapeamento de viewport
+        Returns:
+            Tupla (screen (N, 2) float32, depth (N,) float32)
+        """
+        # Divisão perspectiva (mesma regra de Matrix4x4.transform_point: ignora w == 0)
+        w = clip[:, 3:4]
+        ndc = clip[:, :3] / np.where(w != 0, w, 1.0)
+
+        # Mapeamento de viewport
+        screen = np.empty((len(clip), 2), dtype=np.float32)
+        screen[:, 0] = (ndc[:, 0] + 1) * 0.5 * self.width
+        screen[:, 1] = (1 - (ndc[:, 1] + 1) * 0.5) * self.height
+
+        return screen, ndc[:, 2]
+
     def draw_line_3d(self, point1, point2, camera, color, width=1):
         """
         Desenha uma linha 3D
@@ -110,122 +289,585 @@ class Renderer:
         if self.surface is None:
             return
 
-        # Projeta os vértices
-        proj1 = self.project_point(v1, camera)
-        proj2 = self.project_point(v2, camera)
-        proj3 = self.project_point(v3, camera)
-
-        # Verifica se todos os vértices estão visíveis
-        if proj1 is None or proj2 is None or proj3 is None:
+        # Recorta no espaço homogêneo: faces parcialmente visíveis continuam visíveis
+        clip = self._to_clip(np.array([v1, v2, v3], dtype=np.float32), camera)
+        clipped = clip_triangles(clip, [[0, 1, 2]], self.guard_band)
+        if len(clipped.triangles) == 0:
             return
 
-        # Desenha o triângulo preenchido
-        points = [
-            (proj1[0], proj1[1]),
-            (proj2[0], proj2[1]),
-            (proj3[0], proj3[1])
-        ]
-
-        pygame.draw.polygon(self.surface, color, points)
+        clip = interpolate_attributes(clip, [[0, 1, 2]], clipped)
+        screen, _ = self._clip_to_screen(clip)
+        for triangle in screen.astype(np.int32)[clipped.triangles].tolist():
+            pygame.draw.polygon(self.surface, color, triangle)
 
-    def draw_mesh(self, vertices, faces, normals, camera, shading_model, light, material_color):
+    def draw_mesh(self, vertices, faces, normals, camera, shading_model, light, material_color,
+                  packed=None, vertex_normals=None, model_matrix=None):
         """
         Desenha uma malha 3D com iluminação
+        Arrays NumPy float32 (ex.: Shape3D.get_vertex_array) são usados sem cópia.
         Args:
-            vertices: Lista de vértices 3D
-            faces: Lista de faces (cada face é uma lista de índices de vértices)
-            normals: Lista de normais (uma por face ou por vértice)
+            vertices: Array (N, 3) ou lista de vértices 3D
+            faces: Lista de faces, array (F, k) de faces com k vértices (ex.:
+                   Shape3D.get_index_buffer) ou PackedFaces
+            normals: Array (F, 3) ou lista de normais por face; None = calculadas
             camera: Objeto Camera
             shading_model: Modelo de iluminação (PhongShading, etc.)
             light: Objeto Light
-            material_color: Cor do material (0.0-1.0)
+            material_color: Cor do material (0.0-1.0), (3,) ou (N, 3) por vértice
+            packed: Faces pré-compiladas (PackedFaces); calculadas aqui se None
+            vertex_normals: Normais suaves por vértice (N, 3); com um modelo que
+                            tenha calculate_vertex_colors (Gouraud), a iluminação
+                            é feita uma vez por vértice e interpolada nos triângulos;
+                            com Phong per_pixel no backend 'zbuffer', as normais são
+                            interpoladas no G-buffer e iluminadas em present()
+            model_matrix: Matriz de modelo 4x4; se dada, vertices estão no espaço do objeto
         """
         if self.surface is None:
             return
 
-        # Ordena faces por profundidade (painter's algorithm básico)
-        face_depths = []
-        for face in faces:
-            # Calcula centroide da face
-            centroid = np.mean([vertices[i] for i in face], axis=0)
+        batch = self._prepare_mesh(vertices, faces, normals, camera, shading_model, light,
+                                   material_color, packed, vertex_normals, model_matrix)
+        if batch is not None:
+            self._submit_batch(batch, shading_model, light, camera)
 
-            # Calcula profundidade
-            depth = np.linalg.norm(centroid - np.array(camera.position))
-            face_depths.append((depth, face))
+    def _prepare_mesh(self, vertices, faces, normals, camera, shading_model, light, material_color,
+                      packed=None, vertex_normals=None, model_matrix=None):
+        """
+        Projeta, recorta e ilumina uma malha sem desenhá-la
+        Com model_matrix, os vértices estão no espaço do objeto: a matriz de modelo
+        entra na MVP e as posições no mundo só são calculadas quando a iluminação
+        por vértice/pixel precisa delas (normals e vertex_normals já no mundo).
+        Returns:
+            MeshBatch pronto para _submit_batch, ou None se não houver triângulos
+        """
+        try:
+            from core.config import ENABLE_BACKFACE_CULLING
+            from objects.mesh import PackedFaces, pack_faces
+        except ImportError:
+            from ..core.config import ENABLE_BACKFACE_CULLING
+            from ..objects.mesh import PackedFaces, pack_faces
 
-        # Ordena do mais distante para o mais próximo
-        face_depths.sort(reverse=True, key=lambda x: x[0])
+        if packed is None:
+            packed = faces if isinstance(faces, PackedFaces) else pack_faces(faces)
 
-        # Renderiza cada face
-        for depth, face in face_depths:
-            if len(face) < 3:
-                continue
+        if len(packed.triangles) == 0:
+            return None
 
-            # Pega os vértices da face
-            face_vertices = [vertices[i] for i in face]
-
-            # Calcula normal da face (se não fornecida)
-            if len(normals) == len(faces):
-                # Normais por face
-                face_idx = faces.index(face)
-                normal = normals[face_idx]
-            else:
-                # Calcula normal da face
-                v0 = np.array(face_vertices[0])
-                v1 = np.array(face_vertices[1])
-                v2 = np.array(face_vertices[2])
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                normal = np.cross(edge1, edge2)
-                norm_mag = np.linalg.norm(normal)
-                if norm_mag > 0:
-                    normal = normal / norm_mag
-
-            # Back-face culling (opcional via config)
-            # Garante que normal é um array numpy
-            normal = np.array(normal)
-
-            centroid = np.mean(face_vertices, axis=0)
-            view_dir = centroid - np.array(camera.position)
-            is_backface = np.dot(normal, view_dir) > 0
-
-            # Se backface culling estiver ativo, pula faces de trás
-            try:
-                from core.config import ENABLE_BACKFACE_CULLING
-            except ImportError:
-                from ..core.config import ENABLE_BACKFACE_CULLING
-
-            if ENABLE_BACKFACE_CULLING and is_backface:
-                continue
+        # Leva todos os vértices ao espaço de recorte de uma vez (VP calculada uma vez por malha)
+        vertex_array = np.asarray(vertices, dtype=np.float32)
+        material_color = np.asarray(material_color, dtype=np.float32)
+        vertex_materials = material_color.ndim == 2
+        vp_matrix = camera.get_view_projection_matrix().data
+        if model_matrix is not None:
+            vp_matrix = vp_matrix @ model_matrix
+        vertex_clip = self._to_clip(vertex_array, camera, vp_matrix)
+
+        camera_pos = np.asarray(camera.position, dtype=np.float32)
+        face_count = len(packed.face_sizes)
+
+        # Centroide de cada face (média dos seus vértices)
+        face_owner = np.repeat(np.arange(face_count), packed.face_sizes)
+        face_points = vertex_array[packed.face_indices]
+        centroids = np.stack([
+            np.bincount(face_owner, weights=face_points[:, axis], minlength=face_count)
+            for axis in range(3)
+        ], axis=1) / np.maximum(packed.face_sizes, 1)[:, np.newaxis]
+        if model_matrix is not None:
+            centroids = centroids @ model_matrix[:3, :3].T + model_matrix[:3, 3]
+        centroids = centroids.astype(np.float32)
+
+        # Normais por face (fornecidas) ou calculadas pelo primeiro triângulo de cada face
+        if normals is not None and len(normals) == face_count:
+            face_normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+        else:
+            face_normals = np.zeros((face_count, 3), dtype=np.float32)
+            face_ids, first = np.unique(packed.triangle_faces, return_index=True)
+            corners = vertex_array[packed.triangles[first]]
+            if model_matrix is not None:
+                corners = corners @ model_matrix[:3, :3].T
+            cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            norm_mag = np.linalg.norm(cross, axis=1, keepdims=True)
+            face_normals[face_ids] = np.divide(cross, norm_mag, out=cross, where=norm_mag > 0)
+
+        # Back-face culling (opcional via config)
+        view_dirs = centroids - camera_pos
+        is_backface = np.einsum('ij,ij->i', face_normals, view_dirs) > 0
+
+        drawable = packed.face_sizes >= 3
+        if ENABLE_BACKFACE_CULLING:
+            drawable &= ~is_backface
+
+        # Se a face está de costas, inverte a normal para iluminação correta
+        face_normals = np.where(is_backface[:, np.newaxis], -face_normals, face_normals)
+
+        face_ids = np.nonzero(drawable)[0]
+
+        # Triângulos das faces desenháveis, na ordem das faces (a ordenação é feita na submissão)
+        triangle_order = np.nonzero(drawable[packed.triangle_faces])[0]
+
+        # Recorte contra o plano próximo e a guard band: os triângulos que cruzam um
+        # plano viram polígonos cujos novos vértices são acrescentados ao buffer
+        source_triangles = packed.triangles[triangle_order]
+        clipped = clip_triangles(vertex_clip, source_triangles, self.guard_band)
+        triangles = clipped.triangles
+        triangle_order = triangle_order[clipped.source]
+        triangle_faces = packed.triangle_faces[triangle_order]
+
+        if len(triangles) == 0:
+            return None
 
-            # Se a face está de costas, inverte a normal para iluminação correta
-            if is_backface:
-                normal = -normal
+        if len(clipped.new_vertex_source):
+            vertex_clip = interpolate_attributes(vertex_clip, source_triangles, clipped)
+            vertex_array = interpolate_attributes(vertex_array, source_triangles, clipped)
+            if vertex_normals is not None:
+                vertex_normals = interpolate_attributes(
+                    np.asarray(vertex_normals, dtype=np.float32), source_triangles, clipped
+                )
+            if vertex_materials:
+                material_color = interpolate_attributes(material_color, source_triangles, clipped)
+
+        if model_matrix is not None and vertex_normals is not None:
+            # Posições no mundo só para a iluminação por vértice/pixel
+            vertex_array = vertex_array @ model_matrix[:3, :3].T + model_matrix[:3, 3]
+
+        screen_points, vertex_depths = self._clip_to_screen(vertex_clip)
+
+        # Chave de ordenação (painter): distância da câmera ao centroide da face de origem
+        sort_keys = np.linalg.norm(view_dirs, axis=1)[triangle_faces]
+
+        batch = MeshBatch(
+            mode='flat',
+            screen_points=screen_points,
+            depths=vertex_depths,
+            triangles=triangles,
+            sort_keys=sort_keys,
+            triangle_colors=None,
+            vertex_colors=None,
+            positions=None,
+            normals=None,
+            materials=None,
+            flipped=None,
+            inverse_w=None
+        )
 
-            # Calcula cor com iluminação
-            color = shading_model.calculate_color(
-                centroid,
-                normal,
+        if (self.backend == 'zbuffer' and vertex_normals is not None and
+                getattr(shading_model, 'per_pixel', False)):
+            # Phong por pixel: o G-buffer recebe posição, normal e material por vértice
+            # (vértices fora dos triângulos recortados podem ter w <= 0; não são usados)
+            w = vertex_clip[:, 3]
+            materials = np.empty((len(vertex_array), 3), dtype=np.float32)
+            materials[:] = material_color
+            return batch._replace(
+                mode='deferred',
+                positions=vertex_array,
+                normals=np.asarray(vertex_normals, dtype=np.float32),
+                materials=materials,
+                flipped=is_backface[triangle_faces],
+                inverse_w=np.divide(1.0, w, out=np.zeros_like(w), where=w != 0)
+            )
+
+        if vertex_normals is not None and hasattr(shading_model, 'calculate_vertex_colors'):
+            # Gouraud: ilumina cada vértice uma única vez (O(vértices))
+            vertex_colors = shading_model.calculate_vertex_colors(
+                vertex_array,
+                vertex_normals,
                 light,
                 material_color,
                 camera.position
             )
 
-            # Triangula a face se tiver mais de 3 vértices
-            for i in range(1, len(face_vertices) - 1):
-                self.draw_filled_triangle(
-                    face_vertices[0],
-                    face_vertices[i],
-                    face_vertices[i + 1],
-                    camera,
-                    color
+            if self.backend == 'zbuffer':
+                # Interpolação baricêntrica das cores no framebuffer
+                return batch._replace(mode='smooth', vertex_colors=vertex_colors)
+
+            # pygame.draw só preenche cor sólida: usa a média das cores dos vértices
+            return batch._replace(
+                triangle_colors=(vertex_colors[triangles].mean(axis=1) * 255).astype(np.uint8)
+            )
+
+        # Calcula cor com iluminação (todas as faces em um único passo vetorizado)
+        face_colors = np.zeros((face_count, 3), dtype=np.uint8)
+        if vertex_materials:
+            # Material por vértice: cada face usa o do seu primeiro vértice
+            face_starts = np.cumsum(packed.face_sizes) - packed.face_sizes
+            material_color = material_color[packed.face_indices[face_starts]]
+        if hasattr(shading_model, 'calculate_colors'):
+            face_colors[face_ids] = shading_model.calculate_colors(
+                centroids[face_ids],
+                face_normals[face_ids],
+                light,
+                material_color[face_ids] if vertex_materials else material_color,
+                camera.position
+            )
+        else:
+            for face_idx in face_ids:
+                face_colors[face_idx] = shading_model.calculate_color(
+                    centroids[face_idx],
+                    face_normals[face_idx],
+                    light,
+                    material_color[face_idx] if vertex_materials else material_color,
+                    camera.position
                 )
 
+        return batch._replace(triangle_colors=face_colors[triangle_faces])
+
+    def _submit_batch(self, batch, shading_model, light, camera):
+        """
+        Envia um lote preparado (uma malha ou a cena inteira) ao backend
+        No backend 'painter' os triângulos são ordenados aqui, uma única vez,
+        do mais distante ao mais próximo.
+        """
+        if self.backend == 'painter':
+            order = np.argsort(-batch.sort_keys, kind='stable')
+            self.rasterize_triangles(
+                batch.screen_points.astype(np.int32),
+                None,
+                batch.triangles[order],
+                batch.triangle_colors[order].tolist()
+            )
+        elif batch.mode == 'deferred':
+            self.rasterizer.draw_triangles_deferred(
+                batch.screen_points,
+                batch.depths,
+                batch.triangles,
+                batch.positions,
+                batch.normals,
+                batch.materials,
+                flipped=batch.flipped,
+                inverse_w=batch.inverse_w
+            )
+            self._deferred_lighting = (shading_model, light, camera.position)
+        elif batch.mode == 'smooth':
+            self.rasterizer.draw_triangles_smooth(
+                batch.screen_points, batch.depths, batch.triangles, batch.vertex_colors
+            )
+        else:
+            self.rasterizer.draw_triangles(
+                batch.screen_points, batch.depths, batch.triangles, batch.triangle_colors
+            )
+
+    def _cull_shape(self, shape, camera):
+        """
+        Frustum culling de um Shape3D inteiro (antes de qualquer trabalho por face)
+        Returns:
+            True se o objeto foi descartado
+        """
+        if (camera.is_sphere_visible(shape.bounding_center, shape.bounding_radius) and
+                camera.is_box_visible(shape.culling_min, shape.culling_max)):
+            return False
+
+        self.culled_shapes += 1
+        self.culled_triangles += len(shape.triangles)
+        return True
+
+    def projected_radius(self, center, radius, camera):
+        """
+        Raio em pixels da projeção de uma esfera (na direção vertical da tela)
+        Args:
+            center: Centro da esfera no mundo
+            radius: Raio da esfera
+            camera: Objeto Camera
+        Returns:
+            Raio projetado; infinito se a câmera estiver dentro da esfera
+        """
+        distance = float(np.linalg.norm(np.asarray(center, dtype=np.float32) - camera.position))
+        if distance <= radius:
+            return math.inf
+
+        focal = self.height / (2 * math.tan(math.radians(camera.fov) / 2))
+        return radius * focal / math.sqrt(distance * distance - radius * radius)
+
+    def select_lod(self, shapes, camera):
+        """
+        Escolhe o nível de detalhe dos objetos pelo raio projetado da esfera envolvente
+        Deve ser chamado nos objetos que persistem entre frames (não em cópias
+        descartáveis), para que a histerese de Shape3D.select_lod valha de um
+        frame para o outro; cópias feitas depois já levam a malha escolhida.
+        Args:
+            shapes: Lista de Shape3D
+            camera: Objeto Camera
+        """
+        if not self.level_of_detail:
+            return
+
+        for shape in shapes:
+            if len(shape.lod_meshes) > 1:
+                shape.select_lod(self.projected_radius(
+                    shape.bounding_center, shape.bounding_radius, camera
+                ))
+
+    def _prepare_shape(self, shape, camera, shading_model, light):
+        """
+        Prepara o lote de um Shape3D (ver _prepare_mesh)
+        Usa os vértices originais com a matriz de modelo na MVP, sem materializar
+        shape.vertices no espaço do mundo. Se o objeto tiver uma cadeia de LOD, o
+        nível é escolhido antes pelo raio projetado da esfera envolvente.
+        """
+        self.select_lod((shape,), camera)
+
+        vertex_normals = None
+        if (hasattr(shading_model, 'calculate_vertex_colors') or
+                (self.backend == 'zbuffer' and getattr(shading_model, 'per_pixel', False))):
+            vertex_normals = shape.get_vertex_normals()
+
+        return self._prepare_mesh(
+            shape.original_vertices,
+            shape.get_packed_faces(),
+            shape.face_normals,
+            camera,
+            shading_model,
+            light,
+            shape.get_color(),
+            packed=shape.get_packed_faces(),
+            vertex_normals=vertex_normals,
+            model_matrix=shape.model_matrix
+        )
+
+    def draw_shape(self, shape, camera, shading_model, light):
+        """
+        Desenha um Shape3D usando sua representação compactada
+        Args:
+            shape: Objeto Shape3D
+            camera: Objeto Camera
+            shading_model: Modelo de iluminação
+            light: Objeto Light
+        Returns:
+            False se o objeto foi descartado pelo frustum culling
+        """
+        if self._cull_shape(shape, camera):
+            return False
+
+        if self.surface is not None:
+            batch = self._prepare_shape(shape, camera, shading_model, light)
+            if batch is not None:
+                self._submit_batch(batch, shading_model, light, camera)
+        return True
+
+    def draw_scene(self, shapes, camera, shading_model, light):
+        """
+        Desenha vários Shape3D como uma única fila de triângulos
+        Os triângulos de todos os objetos visíveis são reunidos em um só lote e,
+        no backend 'painter', ordenados uma única vez pela distância à câmera,
+        o que corrige a sobreposição entre objetos diferentes.
+        Args:
+            shapes: Lista de Shape3D
+            camera: Objeto Camera
+            shading_model: Modelo de iluminação
+            light: Objeto Light
+        """
+        if self.surface is None:
+            return
+
+        batches = []
+        for shape in shapes:
+            if not shape.visible or self._cull_shape(shape, camera):
+                continue
+            batch = self._prepare_shape(shape, camera, shading_model, light)
+            if batch is not None:
+                batches.append(batch)
+
+        if batches:
+            self._submit_batch(_merge_batches(batches), shading_model, light, camera)
+
+    def render_frame(self, shapes, camera, shading_model, light, background):
+        """
+        Desenha um frame completo da cena 3D (clear + draw_scene + present)
+        Se a cena, a câmera, a luz, o modelo de iluminação, o backend e a
+        viewport forem os mesmos do frame anterior, só copia para a superfície
+        a camada 3D guardada, sem ordenar, iluminar nem rasterizar de novo.
+        Args:
+            shapes: Lista de Shape3D
+            camera: Objeto Camera
+            shading_model: Modelo de iluminação
+            light: Objeto Light
+            background: Cor de fundo RGB (0-255)
+        Returns:
+            True se a cena foi renderizada, False se a imagem anterior foi reaproveitada
+        """
+        if self.surface is None:
+            return False
+
+        size = self.surface.get_size()
+        settings = (self.backend, size, self.half_resolution_shading,
+                    self.level_of_detail, self.guard_band)
+        scene = (shapes, camera, shading_model, light, background)
+        if self.reuse_static_frames and self._static_frame is not None:
+            key, layer = self._static_frame
+            if key == (settings, scene_fingerprint(*scene)):
+                self.surface.blit(layer, (0, 0))
+                return False
+
+        self.clear(background)
+        self.draw_scene(shapes, camera, shading_model, light)
+        self.present()
+
+        if not self.reuse_static_frames:
+            self._static_frame = None
+            return True
+
+        # O resumo é tirado depois do desenho: a seleção de LOD pode ter trocado malhas
+        layer = self._static_frame[1] if self._static_frame is not None else None
+        if layer is None or layer.get_size() != size:
+            layer = pygame.Surface(size, 0, self.surface)
+        layer.blit(self.surface, (0, 0))
+        self._static_frame = ((settings, scene_fingerprint(*scene)), layer)
+        return True
+
+    def draw_instances(self, mesh, model_matrices, colors, camera, shading_model, light):
+        """
+        Desenha várias cópias de uma mesma malha em um único lote (instancing)
+        As instâncias são descartadas pelo frustum de uma vez, transformadas por
+        um einsum sobre a pilha de matrizes e iluminadas/rasterizadas juntas,
+        com a cor de cada instância como material por vértice.
+        Args:
+            mesh: Mesh compartilhado ou Shape3D (usa a malha do nível de detalhe atual)
+            model_matrices: Matrix4x4Stack, array (K, 4, 4) ou lista de Matrix4x4
+                            com a matriz de modelo de cada instância
+            colors: Cor (3,) de todas as instâncias ou array (K, 3) com uma por instância
+            camera: Objeto Camera
+            shading_model: Modelo de iluminação
+            light: Objeto Light
+        Returns:
+            Número de instâncias que passaram pelo frustum culling
+        """
+        mesh = getattr(mesh, 'mesh', mesh)
+        if hasattr(model_matrices, 'compose'):
+            model_matrices = model_matrices.data  # Matrix4x4Stack
+        elif not isinstance(model_matrices, np.ndarray):
+            model_matrices = [getattr(matrix, 'data', matrix) for matrix in model_matrices]
+        matrices = np.asarray(model_matrices, dtype=np.float32).reshape(-1, 4, 4)
+        colors = np.broadcast_to(
+            np.asarray(colors, dtype=np.float32), (len(matrices), 3)
+        )
+
+        visible = self._visible_instances(mesh, matrices, camera)
+        self.culled_shapes += int(len(matrices) - visible.sum())
+        self.culled_triangles += int(len(matrices) - visible.sum()) * len(mesh.triangles)
+        matrices = matrices[visible]
+        colors = colors[visible]
+
+        if self.surface is None or len(matrices) == 0:
+            return len(matrices)
+
+        try:
+            from objects.mesh import repeat_packed_faces
+        except ImportError:
+            from ..objects.mesh import repeat_packed_faces
+
+        count = len(matrices)
+        vertex_count = len(mesh.vertices)
+        linear = matrices[:, :3, :3]
+
+        # Todas as instâncias no espaço do mundo em um só passo: (K, N, 3) -> (K·N, 3)
+        vertices = (np.einsum('kij,nj->kni', linear, mesh.vertices)
+                    + matrices[:, np.newaxis, :3, 3]).reshape(-1, 3)
+
+        # Matrizes normais (inversa transposta) da pilha; singular = normais recalculadas
+        try:
+            normal_matrices = np.linalg.inv(linear).transpose(0, 2, 1)
+        except np.linalg.LinAlgError:
+            normal_matrices = None
+
+        normals = None
+        if normal_matrices is not None:
+            normals = _normalize_rows(np.einsum('kij,fj->kfi', normal_matrices, mesh.normals))
+
+        vertex_normals = None
+        if normal_matrices is not None and (
+                hasattr(shading_model, 'calculate_vertex_colors') or
+                (self.backend == 'zbuffer' and getattr(shading_model, 'per_pixel', False))):
+            vertex_normals = _normalize_rows(
+                np.einsum('kij,nj->kni', normal_matrices, mesh.vertex_normals)
+            )
+
+        packed = repeat_packed_faces(mesh.packed, count, vertex_count)
+        batch = self._prepare_mesh(
+            vertices,
+            packed,
+            normals,
+            camera,
+            shading_model,
+            light,
+            np.repeat(colors, vertex_count, axis=0),
+            packed=packed,
+            vertex_normals=vertex_normals
+        )
+        if batch is not None:
+            self._submit_batch(batch, shading_model, light, camera)
+        return count
+
+    def _visible_instances(self, mesh, matrices, camera):
+        """
+        Frustum culling das esferas envolventes de uma pilha de instâncias
+        O centro é o centro local transformado e o raio é o raio local vezes
+        a norma espectral da parte linear (maior fator de escala).
+        Returns:
+            Array (K,) bool com as instâncias visíveis
+        """
+        centers = matrices[:, :3, :3] @ mesh.center + matrices[:, :3, 3]
+        radii = mesh.radius * np.linalg.norm(matrices[:, :3, :3], ord=2, axis=(1, 2))
+        planes = camera.get_frustum_planes()
+        distances = centers @ planes[:, :3].T + planes[:, 3]
+        return np.all(distances >= -radii[:, np.newaxis], axis=1)
+
+    def rasterize_triangles(self, screen_points, visible, triangles, colors):
+        """
+        Desenha triângulos já projetados a partir de um buffer de índices
+        Args:
+            screen_points: Array (N, 2) de coordenadas de tela
+            visible: Array (N,) bool indicando os vértices dentro da tela, ou None
+                     se os triângulos já foram recortados (desenha todos)
+            triangles: Buffer de índices (T, 3), na ordem de desenho
+            colors: Cores RGB (0-255), uma por triângulo
+        """
+        if self.surface is None or len(triangles) == 0:
+            return
+
+        triangles = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+
+        if visible is None:
+            corners = screen_points[triangles].tolist()
+            kept_colors = colors
+        else:
+            # Descarta de uma vez os triângulos com algum vértice fora da tela
+            keep = np.all(visible[triangles], axis=1)
+            corners = screen_points[triangles[keep]].tolist()
+            kept_colors = [color for color, k in zip(colors, keep) if k]
+
+        surface = self.surface
+        for color, points in zip(kept_colors, corners):
+            pygame.draw.polygon(surface, color, points)
+
     def clear(self, color):
-        """Limpa a tela com uma cor"""
-        if self.surface:
+        """Limpa a tela com uma cor (início de um novo frame)"""
+        self._deferred_lighting = None
+        self.culled_shapes = 0
+        self.culled_triangles = 0
+        if self.backend == 'zbuffer':
+            self.rasterizer.clear(color)
+        elif self.surface:
             self.surface.fill(color)
 
+    def present(self):
+        """
+        Finaliza a cena 3D do frame
+        No backend 'zbuffer' ilumina o G-buffer (se houver Phong por pixel) e copia o
+        framebuffer para a superfície (um blit por frame); no backend 'painter' os
+        triângulos já foram desenhados diretamente.
+        """
+        if self.backend != 'zbuffer':
+            return
+
+        if self._deferred_lighting is not None:
+            shading_model, light, camera_pos = self._deferred_lighting
+            self.rasterizer.shade_deferred(
+                shading_model, light, camera_pos, half_resolution=self.half_resolution_shading
+            )
+            self._deferred_lighting = None
+
+        if self.surface is not None:
+            self.rasterizer.present(self.surface)
+
     def draw_text(self, text, position, font, color):
         """
         Desenha texto na tela
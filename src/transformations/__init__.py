@@ -4,6 +4,8 @@ Implementa todas as transformações 3D necessárias usando matrizes homogêneas
 """
 
 from .matrix import Matrix4x4
+from .matrix_stack import Matrix4x4Stack
 from .geometric import GeometricTransformations
+from .trs import TRSTransform
 
-__all__ = ['Matrix4x4', 'GeometricTransformations']
+__all__ = ['Matrix4x4', 'Matrix4x4Stack', 'GeometricTransformations', 'TRSTransform']
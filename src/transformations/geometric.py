@@ -4,40 +4,139 @@ Implementa: Translação, Rotação, Escala, Reflexão e Distorção
 """
 
 from .matrix import Matrix4x4
+from .trs import TRSTransform, quaternion_from_axis_angle, quaternion_multiply
 import math
 import numpy as np
-from typing import Tuple, List, Union
+from collections import deque
+from typing import Deque, Optional, Tuple
 
 try:
-    from core.exceptions import TransformationException
+    from core.config import TRANSFORM_DECOMPOSED, TRANSFORM_HISTORY_LIMIT
+    from core.exceptions import SingularMatrixException, TransformationException
     from core.logger import get_logger
 except ImportError:
-    from ..core.exceptions import TransformationException
+    from ..core.config import TRANSFORM_DECOMPOSED, TRANSFORM_HISTORY_LIMIT
+    from ..core.exceptions import SingularMatrixException, TransformationException
     from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class GeometricTransformations:
-    """Classe para gerenciar e aplicar transformações geométricas"""
+    """
+    Classe para gerenciar e aplicar transformações geométricas
 
-    def __init__(self) -> None:
-        """Inicializa com matriz identidade"""
-        self.matrix: Matrix4x4 = Matrix4x4.identity()
-        self.history: List[Tuple] = []  # Histórico de transformações aplicadas
+    O histórico é guardado em dois buffers circulares limitados:
+    - history: passos exatos (ações do jogador), um por chamada
+    - animation_history: transformações com animated=True (ex.: auto-rotação),
+      com passos consecutivos compatíveis fundidos em uma única entrada
+
+    Com decomposed=True a transformação é guardada como TRSTransform
+    (translação, quaternion, escala/distorção) e a matriz 4x4 é composta só
+    quando pedida; sem isso, cada operação multiplica a Matrix4x4 acumulada.
+    """
+
+    # Transformações de animação que podem ser fundidas com a anterior
+    _MERGEABLE = ('translate', 'rotate_x', 'rotate_y', 'rotate_z', 'scale')
+
+    def __init__(self, history_limit: Optional[int] = None,
+                 decomposed: Optional[bool] = None) -> None:
+        """
+        Inicializa com matriz identidade
+        Args:
+            history_limit: Máximo de entradas guardadas em cada histórico
+                           (padrão: TRANSFORM_HISTORY_LIMIT; None no config = sem limite)
+            decomposed: Usa a representação TRS (padrão: TRANSFORM_DECOMPOSED)
+        """
+        self.history_limit = TRANSFORM_HISTORY_LIMIT if history_limit is None else history_limit
+        self.decomposed = TRANSFORM_DECOMPOSED if decomposed is None else decomposed
+        self._trs: Optional[TRSTransform] = TRSTransform() if self.decomposed else None
+        self._matrix: Optional[Matrix4x4] = None if self.decomposed else Matrix4x4.identity()
+        self.history: Deque[Tuple] = deque(maxlen=self.history_limit)  # Passos exatos
+        # Animação compactada
+        self.animation_history: Deque[Tuple] = deque(maxlen=self.history_limit)
+
+    @property
+    def matrix(self) -> Matrix4x4:
+        """
+        Matriz 4x4 acumulada
+        No modo decomposto é composta sob demanda e reaproveitada até a próxima
+        operação; os dados são somente leitura (use set_matrix para substituir).
+        """
+        if self._matrix is None:
+            self._matrix = Matrix4x4(self._trs.to_matrix())
+            self._matrix.data.flags.writeable = False
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix: Matrix4x4) -> None:
+        self.set_matrix(matrix)
+
+    def _apply(self, op: Matrix4x4) -> None:
+        """Pós-multiplica a transformação acumulada por uma matriz"""
+        if self._trs is not None:
+            self._trs.compose(op.data)
+            self._matrix = None
+        else:
+            self._matrix = self._matrix.multiply(op)
+
+    def _apply_rotation(self, quaternion, rotation_matrix: Matrix4x4) -> None:
+        """Aplica uma rotação (quaternion no modo decomposto, matriz no outro)"""
+        if self._trs is not None:
+            self._trs.rotate(quaternion)
+            self._matrix = None
+        else:
+            self._matrix = self._matrix.multiply(rotation_matrix)
 
     def reset(self) -> None:
         """Reseta para matriz identidade"""
-        self.matrix = Matrix4x4.identity()
-        self.history = []
+        if self.decomposed:
+            self._trs = TRSTransform()
+            self._matrix = None
+        else:
+            self._matrix = Matrix4x4.identity()
+        self.history.clear()
+        self.animation_history.clear()
+
+    def _record(self, entry: Tuple, animated: bool = False) -> None:
+        """
+        Registra uma transformação no histórico
+        Args:
+            entry: Tupla (nome, *parâmetros)
+            animated: Se True, vai para o histórico de animação e é fundida com a
+                      entrada anterior quando ambas forem do mesmo tipo (rotações no
+                      mesmo eixo e translações somam; escalas uniformes multiplicam)
+        """
+        if not animated:
+            self.history.append(entry)
+            return
+
+        name = entry[0]
+        if self.animation_history and name in self._MERGEABLE:
+            last = self.animation_history[-1]
+            if last[0] == name:
+                if name == 'scale':
+                    if len(set(entry[1:])) == 1 and len(set(last[1:])) == 1:
+                        factor = last[1] * entry[1]
+                        self.animation_history[-1] = ('scale', factor, factor, factor)
+                        return
+                else:
+                    self.animation_history[-1] = (name,) + tuple(
+                        a + b for a, b in zip(last[1:], entry[1:])
+                    )
+                    return
+
+        self.animation_history.append(entry)
 
     # ==================== TRANSLAÇÃO ====================
-    def translate(self, tx: float, ty: float, tz: float) -> 'GeometricTransformations':
+    def translate(self, tx: float, ty: float, tz: float,
+                  animated: bool = False) -> 'GeometricTransformations':
         """
         Aplica TRANSLAÇÃO (movimento)
         Move o objeto no espaço 3D
         Args:
             tx, ty, tz: Deslocamentos em cada eixo
+            animated: Se True, registra no histórico de animação (compactado)
 
         Raises:
             TransformationException: Se algum valor de translação for inválido
@@ -49,18 +148,22 @@ class GeometricTransformations:
                     f"Valor de translação {name} deve ser finito, recebido: {value}"
                 )
 
-        trans_matrix = Matrix4x4.translation(tx, ty, tz)
-        self.matrix = self.matrix.multiply(trans_matrix)
-        self.history.append(('translate', tx, ty, tz))
+        if self._trs is not None:
+            self._trs.translate((tx, ty, tz))
+            self._matrix = None
+        else:
+            self._matrix = self._matrix.multiply(Matrix4x4.translation(tx, ty, tz))
+        self._record(('translate', tx, ty, tz), animated)
         logger.debug(f"Translação aplicada: tx={tx}, ty={ty}, tz={tz}")
         return self
 
     # ==================== ROTAÇÃO ====================
-    def rotate_x(self, angle_degrees: float) -> 'GeometricTransformations':
+    def rotate_x(self, angle_degrees: float, animated: bool = False) -> 'GeometricTransformations':
         """
         Aplica ROTAÇÃO em torno do eixo X
         Args:
             angle_degrees: Ângulo em graus
+            animated: Se True, registra no histórico de animação (compactado)
 
         Raises:
             TransformationException: Se o ângulo for inválido
@@ -71,57 +174,73 @@ class GeometricTransformations:
             )
 
         angle_rad = math.radians(angle_degrees)
-        rot_matrix = Matrix4x4.rotation_x(angle_rad)
-        self.matrix = self.matrix.multiply(rot_matrix)
-        self.history.append(('rotate_x', angle_degrees))
+        self._apply_rotation(
+            quaternion_from_axis_angle((1, 0, 0), angle_rad),
+            Matrix4x4.rotation_x(angle_rad)
+        )
+        self._record(('rotate_x', angle_degrees), animated)
         logger.debug(f"Rotação X aplicada: {angle_degrees}°")
         return self
 
-    def rotate_y(self, angle_degrees):
+    def rotate_y(self, angle_degrees, animated=False):
         """
         Aplica ROTAÇÃO em torno do eixo Y
         Args:
             angle_degrees: Ângulo em graus
+            animated: Se True, registra no histórico de animação (compactado)
         """
         angle_rad = math.radians(angle_degrees)
-        rot_matrix = Matrix4x4.rotation_y(angle_rad)
-        self.matrix = self.matrix.multiply(rot_matrix)
-        self.history.append(('rotate_y', angle_degrees))
+        self._apply_rotation(
+            quaternion_from_axis_angle((0, 1, 0), angle_rad),
+            Matrix4x4.rotation_y(angle_rad)
+        )
+        self._record(('rotate_y', angle_degrees), animated)
         return self
 
-    def rotate_z(self, angle_degrees):
+    def rotate_z(self, angle_degrees, animated=False):
         """
         Aplica ROTAÇÃO em torno do eixo Z
         Args:
             angle_degrees: Ângulo em graus
+            animated: Se True, registra no histórico de animação (compactado)
         """
         angle_rad = math.radians(angle_degrees)
-        rot_matrix = Matrix4x4.rotation_z(angle_rad)
-        self.matrix = self.matrix.multiply(rot_matrix)
-        self.history.append(('rotate_z', angle_degrees))
+        self._apply_rotation(
+            quaternion_from_axis_angle((0, 0, 1), angle_rad),
+            Matrix4x4.rotation_z(angle_rad)
+        )
+        self._record(('rotate_z', angle_degrees), animated)
         return self
 
-    def rotate(self, rx_degrees, ry_degrees, rz_degrees):
+    def rotate(self, rx_degrees, ry_degrees, rz_degrees, animated=False):
         """
         Aplica ROTAÇÃO combinada (Euler angles)
         Args:
             rx_degrees, ry_degrees, rz_degrees: Ângulos em graus
+            animated: Se True, registra no histórico de animação (não é fundida)
         """
         rx_rad = math.radians(rx_degrees)
         ry_rad = math.radians(ry_degrees)
         rz_rad = math.radians(rz_degrees)
-        rot_matrix = Matrix4x4.rotation(rx_rad, ry_rad, rz_rad)
-        self.matrix = self.matrix.multiply(rot_matrix)
-        self.history.append(('rotate', rx_degrees, ry_degrees, rz_degrees))
+        # Mesma ordem de Matrix4x4.rotation: Z · Y · X
+        quaternion = quaternion_multiply(
+            quaternion_multiply(quaternion_from_axis_angle((0, 0, 1), rz_rad),
+                                quaternion_from_axis_angle((0, 1, 0), ry_rad)),
+            quaternion_from_axis_angle((1, 0, 0), rx_rad)
+        )
+        self._apply_rotation(quaternion, Matrix4x4.rotation(rx_rad, ry_rad, rz_rad))
+        self._record(('rotate', rx_degrees, ry_degrees, rz_degrees), animated)
         return self
 
     # ==================== ESCALA ====================
-    def scale(self, sx: float, sy: float, sz: float) -> 'GeometricTransformations':
+    def scale(self, sx: float, sy: float, sz: float,
+              animated: bool = False) -> 'GeometricTransformations':
         """
         Aplica ESCALA (redimensionamento)
         Aumenta ou diminui o tamanho do objeto
         Args:
             sx, sy, sz: Fatores de escala para cada eixo
+            animated: Se True, registra no histórico de animação (compactado)
 
         Raises:
             TransformationException: Se algum fator de escala for inválido
@@ -139,18 +258,19 @@ class GeometricTransformations:
                 )
 
         scale_matrix = Matrix4x4.scale(sx, sy, sz)
-        self.matrix = self.matrix.multiply(scale_matrix)
-        self.history.append(('scale', sx, sy, sz))
+        self._apply(scale_matrix)
+        self._record(('scale', sx, sy, sz), animated)
         logger.debug(f"Escala aplicada: sx={sx}, sy={sy}, sz={sz}")
         return self
 
-    def scale_uniform(self, s):
+    def scale_uniform(self, s, animated=False):
         """
         Aplica ESCALA uniforme (mantém proporções)
         Args:
             s: Fator de escala igual para todos os eixos
+            animated: Se True, registra no histórico de animação (compactado)
         """
-        return self.scale(s, s, s)
+        return self.scale(s, s, s, animated)
 
     # ==================== REFLEXÃO ====================
     def reflect_x(self):
@@ -159,8 +279,8 @@ class GeometricTransformations:
         Espelha o objeto no eixo X
         """
         reflect_matrix = Matrix4x4.reflection_x()
-        self.matrix = self.matrix.multiply(reflect_matrix)
-        self.history.append(('reflect_x',))
+        self._apply(reflect_matrix)
+        self._record(('reflect_x',))
         return self
 
     def reflect_y(self):
@@ -169,8 +289,8 @@ class GeometricTransformations:
         Espelha o objeto no eixo Y
         """
         reflect_matrix = Matrix4x4.reflection_y()
-        self.matrix = self.matrix.multiply(reflect_matrix)
-        self.history.append(('reflect_y',))
+        self._apply(reflect_matrix)
+        self._record(('reflect_y',))
         return self
 
     def reflect_z(self):
@@ -179,8 +299,8 @@ class GeometricTransformations:
         Espelha o objeto no eixo Z
         """
         reflect_matrix = Matrix4x4.reflection_z()
-        self.matrix = self.matrix.multiply(reflect_matrix)
-        self.history.append(('reflect_z',))
+        self._apply(reflect_matrix)
+        self._record(('reflect_z',))
         return self
 
     # ==================== DISTORÇÃO (SHEAR) ====================
@@ -193,8 +313,8 @@ class GeometricTransformations:
             shy: Fator de distorção em Y
         """
         shear_matrix = Matrix4x4.shear_xy(shx, shy)
-        self.matrix = self.matrix.multiply(shear_matrix)
-        self.history.append(('shear_xy', shx, shy))
+        self._apply(shear_matrix)
+        self._record(('shear_xy', shx, shy))
         return self
 
     def shear_xz(self, shx, shz):
@@ -205,8 +325,8 @@ class GeometricTransformations:
             shz: Fator de distorção em Z
         """
         shear_matrix = Matrix4x4.shear_xz(shx, shz)
-        self.matrix = self.matrix.multiply(shear_matrix)
-        self.history.append(('shear_xz', shx, shz))
+        self._apply(shear_matrix)
+        self._record(('shear_xz', shx, shz))
         return self
 
     def shear_yz(self, shy, shz):
@@ -217,8 +337,8 @@ class GeometricTransformations:
             shz: Fator de distorção em Z
         """
         shear_matrix = Matrix4x4.shear_yz(shy, shz)
-        self.matrix = self.matrix.multiply(shear_matrix)
-        self.history.append(('shear_yz', shy, shz))
+        self._apply(shear_matrix)
+        self._record(('shear_yz', shy, shz))
         return self
 
     # ==================== APLICAÇÃO ====================
@@ -244,33 +364,84 @@ class GeometricTransformations:
 
     def apply_to_points(self, points):
         """
-        Aplica transformações a uma lista de pontos
+        Aplica transformações a vários pontos com um único produto matricial
         Args:
-            points: Lista de tuplas (x, y, z)
+            points: Lista de tuplas (x, y, z) ou array (N, 3)
         Returns:
-            Lista de pontos transformados
+            Lista de pontos transformados (array (N, 3) float32 se points for array)
         """
-        return [self.apply_to_point(p) for p in points]
+        transformed = self.matrix.transform_points(points)
+        if isinstance(points, np.ndarray):
+            return transformed
+        return [tuple(point) for point in transformed.tolist()]
 
     def get_matrix(self):
         """Retorna a matriz de transformação atual"""
         return self.matrix
 
     def set_matrix(self, matrix):
-        """Define a matriz de transformação"""
-        self.matrix = matrix
+        """
+        Define a matriz de transformação
+
+        Raises:
+            TransformationException: No modo decomposto, se a matriz não for afim
+        """
+        if self.decomposed:
+            self._trs = TRSTransform.from_matrix(matrix.data)
+            self._matrix = None
+        else:
+            self._matrix = matrix
         return self
 
-    def copy(self):
-        """Cria uma cópia desta transformação"""
-        new_transform = GeometricTransformations()
-        new_transform.matrix = Matrix4x4(self.matrix.data.copy())
-        new_transform.history = self.history.copy()
+    def get_inverse_matrix(self):
+        """
+        Retorna a inversa da transformação atual
+        No modo decomposto é analítica: K⁻¹ · Rᵀ · T(-t)
+
+        Raises:
+            SingularMatrixException: Se a transformação não for inversível
+        """
+        if self._trs is not None:
+            return Matrix4x4(self._trs.inverse_matrix())
+        return self._matrix.inverse()
+
+    def get_normal_matrix(self):
+        """
+        Retorna a matriz normal 3x3 (inversa transposta da parte linear)
+
+        Raises:
+            SingularMatrixException: Se a transformação não for inversível
+        """
+        if self._trs is not None:
+            return self._trs.normal_matrix().astype(np.float32)
+        try:
+            return np.linalg.inv(self._matrix.data[:3, :3]).T
+        except np.linalg.LinAlgError as e:
+            raise SingularMatrixException(f"Erro ao calcular matriz normal: {e}") from e
+
+    def copy(self, history=True):
+        """
+        Cria uma cópia desta transformação
+        Args:
+            history: Se False, copia só a transformação atual (históricos vazios)
+        """
+        new_transform = GeometricTransformations(self.history_limit, self.decomposed)
+        if self._trs is not None:
+            new_transform._trs = self._trs.copy()
+        else:
+            new_transform._matrix = Matrix4x4(self._matrix.data.copy())
+        if history:
+            new_transform.history = self.history.copy()
+            new_transform.animation_history = self.animation_history.copy()
         return new_transform
 
     def get_history(self):
-        """Retorna o histórico de transformações aplicadas"""
-        return self.history.copy()
+        """Retorna o histórico de transformações aplicadas pelo jogador (passos exatos)"""
+        return list(self.history)
+
+    def get_animation_history(self):
+        """Retorna o histórico compactado das transformações de animação"""
+        return list(self.animation_history)
 
     def __str__(self):
         """Representação em string"""
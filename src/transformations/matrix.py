@@ -16,6 +16,29 @@ except ImportError:
 logger = get_logger(__name__)
 
 
+_IDENTITY = np.eye(4, dtype=np.float32)
+
+
+def _identity_into(out):
+    """
+    Buffer de destino das variantes out=: os dados de out sobrescritos com a
+    identidade, ou uma nova identidade se out for None
+    """
+    if out is None:
+        return _IDENTITY.copy()
+    out.data[...] = _IDENTITY
+    return out.data
+
+
+def _wrap(data, out):
+    """Retorna out (já preenchida) ou uma Matrix4x4 sobre data, sem copiar"""
+    if out is not None:
+        return out
+    matrix = Matrix4x4.__new__(Matrix4x4)
+    matrix.data = data
+    return matrix
+
+
 class Matrix4x4:
     """Classe para representar e manipular matrizes 4x4"""
 
@@ -36,92 +59,101 @@ class Matrix4x4:
         return Matrix4x4()
 
     @staticmethod
-    def translation(tx, ty, tz):
+    def translation(tx, ty, tz, out=None):
         """
         Cria matriz de TRANSLAÇÃO
         Move um ponto no espaço 3D
+        Args:
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
-        matrix = np.eye(4, dtype=np.float32)
+        matrix = _identity_into(out)
         matrix[0, 3] = tx
         matrix[1, 3] = ty
         matrix[2, 3] = tz
-        return Matrix4x4(matrix)
+        return _wrap(matrix, out)
 
     @staticmethod
-    def rotation_x(angle):
+    def rotation_x(angle, out=None):
         """
         Cria matriz de ROTAÇÃO em torno do eixo X
         Args:
             angle: Ângulo em radianos
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
         c = math.cos(angle)
         s = math.sin(angle)
-        matrix = np.array([
-            [1, 0, 0, 0],
-            [0, c, -s, 0],
-            [0, s, c, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
-        return Matrix4x4(matrix)
+        matrix = _identity_into(out)
+        matrix[1, 1] = c
+        matrix[1, 2] = -s
+        matrix[2, 1] = s
+        matrix[2, 2] = c
+        return _wrap(matrix, out)
 
     @staticmethod
-    def rotation_y(angle):
+    def rotation_y(angle, out=None):
         """
         Cria matriz de ROTAÇÃO em torno do eixo Y
         Args:
             angle: Ângulo em radianos
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
         c = math.cos(angle)
         s = math.sin(angle)
-        matrix = np.array([
-            [c, 0, s, 0],
-            [0, 1, 0, 0],
-            [-s, 0, c, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
-        return Matrix4x4(matrix)
+        matrix = _identity_into(out)
+        matrix[0, 0] = c
+        matrix[0, 2] = s
+        matrix[2, 0] = -s
+        matrix[2, 2] = c
+        return _wrap(matrix, out)
 
     @staticmethod
-    def rotation_z(angle):
+    def rotation_z(angle, out=None):
         """
         Cria matriz de ROTAÇÃO em torno do eixo Z
         Args:
             angle: Ângulo em radianos
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
         c = math.cos(angle)
         s = math.sin(angle)
-        matrix = np.array([
-            [c, -s, 0, 0],
-            [s, c, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
-        return Matrix4x4(matrix)
+        matrix = _identity_into(out)
+        matrix[0, 0] = c
+        matrix[0, 1] = -s
+        matrix[1, 0] = s
+        matrix[1, 1] = c
+        return _wrap(matrix, out)
 
     @staticmethod
-    def rotation(rx, ry, rz):
+    def rotation(rx, ry, rz, out=None):
         """
         Cria matriz de ROTAÇÃO combinada (Euler angles)
         Aplica rotações em ordem: Z -> Y -> X
+        O produto Rz · Ry · Rx é escrito em forma fechada, sem matrizes intermediárias
+        Args:
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
-        mat_x = Matrix4x4.rotation_x(rx)
-        mat_y = Matrix4x4.rotation_y(ry)
-        mat_z = Matrix4x4.rotation_z(rz)
-        return mat_z.multiply(mat_y).multiply(mat_x)
+        cx, sx = math.cos(rx), math.sin(rx)
+        cy, sy = math.cos(ry), math.sin(ry)
+        cz, sz = math.cos(rz), math.sin(rz)
+        matrix = _identity_into(out)
+        matrix[0, :3] = (cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx)
+        matrix[1, :3] = (sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx)
+        matrix[2, :3] = (-sy, cy * sx, cy * cx)
+        return _wrap(matrix, out)
 
     @staticmethod
-    def scale(sx, sy, sz):
+    def scale(sx, sy, sz, out=None):
         """
         Cria matriz de ESCALA
         Aumenta ou diminui o tamanho do objeto
+        Args:
+            out: Matrix4x4 reaproveitada como destino (sem alocar)
         """
-        matrix = np.array([
-            [sx, 0, 0, 0],
-            [0, sy, 0, 0],
-            [0, 0, sz, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
-        return Matrix4x4(matrix)
+        matrix = _identity_into(out)
+        matrix[0, 0] = sx
+        matrix[1, 1] = sy
+        matrix[2, 2] = sz
+        return _wrap(matrix, out)
 
     @staticmethod
     def reflection_x():
@@ -256,10 +288,17 @@ class Matrix4x4:
 
         return Matrix4x4(matrix)
 
-    def multiply(self, other):
-        """Multiplica esta matriz por outra"""
-        result_data = np.dot(self.data, other.data)
-        return Matrix4x4(result_data)
+    def multiply(self, other, out=None):
+        """
+        Multiplica esta matriz por outra
+        Args:
+            other: Matrix4x4 à direita do produto
+            out: Matrix4x4 de destino (pode ser self ou other)
+        """
+        if out is None:
+            return _wrap(np.dot(self.data, other.data), None)
+        np.matmul(self.data, other.data, out=out.data)
+        return out
 
     def transform_point(self, point):
         """
@@ -297,6 +336,40 @@ class Matrix4x4:
 
         return tuple(transformed[:3])
 
+    def transform_points(self, points, out=None):
+        """
+        Transforma vários pontos 3D com um único produto matricial
+        Mesma regra de transform_point: divide por w quando a matriz é
+        projetiva, ignorando w == 0.
+        Args:
+            points: Array (N, 3) ou lista de pontos (x, y, z)
+            out: Array (N, 3) float32 de destino (pode ser o próprio points)
+        Returns:
+            Array (N, 3) float32
+        """
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        projective = not np.array_equal(self.data[3], (0, 0, 0, 1))
+        if projective:
+            w = points @ self.data[3, :3] + self.data[3, 3]
+
+        out = np.matmul(points, self.data[:3, :3].T, out=out)
+        out += self.data[:3, 3]
+        if projective:
+            np.divide(out, w[:, np.newaxis], out=out, where=w[:, np.newaxis] != 0)
+        return out
+
+    def transform_vectors(self, vectors, out=None):
+        """
+        Transforma vários vetores 3D (sem translação)
+        Args:
+            vectors: Array (N, 3) ou lista de vetores (x, y, z)
+            out: Array (N, 3) float32 de destino
+        Returns:
+            Array (N, 3) float32
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, 3)
+        return np.matmul(vectors, self.data[:3, :3].T, out=out)
+
     def inverse(self):
         """
         Retorna a matriz inversa
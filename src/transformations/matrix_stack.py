@@ -0,0 +1,212 @@
+"""
+Pilhas de matrizes 4x4 (N, 4, 4) para operações em lote
+Compõe, inverte e aplica N transformações homogêneas de uma vez, sem um
+objeto Matrix4x4 por matriz
+"""
+
+import numpy as np
+
+from .matrix import Matrix4x4
+
+try:
+    from core.exceptions import SingularMatrixException
+    from core.logger import get_logger
+except ImportError:
+    from ..core.exceptions import SingularMatrixException
+    from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _stack_data(matrices):
+    """Dados (N, 4, 4) de uma Matrix4x4Stack, Matrix4x4 (N = 1) ou array"""
+    if isinstance(matrices, (Matrix4x4, Matrix4x4Stack)):
+        matrices = matrices.data
+    return np.asarray(matrices, dtype=np.float32)
+
+
+class Matrix4x4Stack:
+    """
+    Pilha de N matrizes 4x4 (array float32 (N, 4, 4))
+
+    As fábricas recebem arrays (N,) de parâmetros e criam as N matrizes em um
+    passo; compose e os métodos transform_* aceitam out= para reaproveitar
+    buffers em laços quentes.
+    """
+
+    def __init__(self, data=None, count=1):
+        """
+        Inicializa uma pilha de matrizes
+        Args:
+            data: Array (N, 4, 4) ou (4, 4); None para count identidades
+            count: Número de matrizes quando data é None
+        """
+        if data is None:
+            self.data = np.tile(np.eye(4, dtype=np.float32), (count, 1, 1))
+        else:
+            self.data = np.array(data, dtype=np.float32).reshape(-1, 4, 4)
+
+    @staticmethod
+    def identity(count):
+        """Retorna uma pilha de count matrizes identidade"""
+        return Matrix4x4Stack(count=count)
+
+    @staticmethod
+    def from_matrices(matrices):
+        """Empilha uma lista de Matrix4x4 (ou arrays 4x4)"""
+        return Matrix4x4Stack(np.stack([_stack_data(matrix) for matrix in matrices]))
+
+    @staticmethod
+    def translation(offsets):
+        """
+        Cria N matrizes de TRANSLAÇÃO
+        Args:
+            offsets: Array (N, 3) de deslocamentos
+        """
+        offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+        stack = Matrix4x4Stack(count=len(offsets))
+        stack.data[:, :3, 3] = offsets
+        return stack
+
+    @staticmethod
+    def scale(factors):
+        """
+        Cria N matrizes de ESCALA
+        Args:
+            factors: Array (N, 3) de fatores por eixo
+        """
+        factors = np.asarray(factors, dtype=np.float32).reshape(-1, 3)
+        stack = Matrix4x4Stack(count=len(factors))
+        stack.data[:, [0, 1, 2], [0, 1, 2]] = factors
+        return stack
+
+    @staticmethod
+    def _axis_rotation(angles, axes):
+        """N rotações em torno de um eixo; axes = (i, j) do plano girado"""
+        angles = np.asarray(angles, dtype=np.float64).reshape(-1)
+        c = np.cos(angles)
+        s = np.sin(angles)
+        i, j = axes
+        stack = Matrix4x4Stack(count=len(angles))
+        stack.data[:, i, i] = c
+        stack.data[:, i, j] = -s
+        stack.data[:, j, i] = s
+        stack.data[:, j, j] = c
+        return stack
+
+    @staticmethod
+    def rotation_x(angles):
+        """Cria N matrizes de ROTAÇÃO em torno do eixo X (ângulos em radianos)"""
+        return Matrix4x4Stack._axis_rotation(angles, (1, 2))
+
+    @staticmethod
+    def rotation_y(angles):
+        """Cria N matrizes de ROTAÇÃO em torno do eixo Y (ângulos em radianos)"""
+        return Matrix4x4Stack._axis_rotation(angles, (2, 0))
+
+    @staticmethod
+    def rotation_z(angles):
+        """Cria N matrizes de ROTAÇÃO em torno do eixo Z (ângulos em radianos)"""
+        return Matrix4x4Stack._axis_rotation(angles, (0, 1))
+
+    @staticmethod
+    def rotation(rx, ry, rz):
+        """
+        Cria N matrizes de ROTAÇÃO combinada (mesma ordem de Matrix4x4.rotation: Z · Y · X)
+        Args:
+            rx, ry, rz: Arrays (N,) de ângulos em radianos
+        """
+        rx, ry, rz = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64).reshape(-1)
+                                           for a in (rx, ry, rz)))
+        cx, sx = np.cos(rx), np.sin(rx)
+        cy, sy = np.cos(ry), np.sin(ry)
+        cz, sz = np.cos(rz), np.sin(rz)
+        stack = Matrix4x4Stack(count=len(rx))
+        stack.data[:, 0, :3] = np.stack(
+            [cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx], axis=1
+        )
+        stack.data[:, 1, :3] = np.stack(
+            [sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx], axis=1
+        )
+        stack.data[:, 2, :3] = np.stack([-sy, cy * sx, cy * cx], axis=1)
+        return stack
+
+    def __len__(self):
+        """Número de matrizes na pilha"""
+        return len(self.data)
+
+    def __getitem__(self, index):
+        """Matriz index como Matrix4x4 (cópia); fatias retornam Matrix4x4Stack"""
+        if isinstance(index, (int, np.integer)):
+            return Matrix4x4(self.data[index])
+        return Matrix4x4Stack(self.data[index])
+
+    def compose(self, other, out=None):
+        """
+        Multiplica cada matriz da pilha pela correspondente de other (self · other)
+        Args:
+            other: Matrix4x4Stack do mesmo tamanho, ou Matrix4x4 aplicada a todas
+            out: Matrix4x4Stack de destino (pode ser self)
+        Returns:
+            Matrix4x4Stack com os produtos
+        """
+        if out is None:
+            return Matrix4x4Stack(np.matmul(self.data, _stack_data(other)))
+        np.matmul(self.data, _stack_data(other), out=out.data)
+        return out
+
+    def inverse(self):
+        """
+        Retorna a pilha das matrizes inversas
+
+        Raises:
+            SingularMatrixException: Se alguma matriz for singular (determinante ~= 0)
+        """
+        det = np.linalg.det(self.data)
+        singular = np.nonzero(np.abs(det) < 1e-10)[0]
+        if len(singular):
+            logger.error(f"Tentativa de inverter matrizes singulares: {singular.tolist()}")
+            raise SingularMatrixException(
+                f"Não é possível inverter as matrizes {singular.tolist()} da pilha "
+                f"(determinante próximo de zero)"
+            )
+        return Matrix4x4Stack(np.linalg.inv(self.data))
+
+    def transpose(self):
+        """Retorna a pilha das matrizes transpostas"""
+        return Matrix4x4Stack(self.data.transpose(0, 2, 1))
+
+    def transform_points(self, points, out=None):
+        """
+        Aplica cada matriz a um conjunto de pontos (produto em lote + divisão por w)
+        Args:
+            points: Array (M, 3), aplicado a todas as matrizes, ou (N, M, 3), um
+                    conjunto por matriz
+            out: Array (N, M, 3) float32 de destino
+        Returns:
+            Array (N, M, 3) float32; w == 0 é ignorado, como em Matrix4x4.transform_point
+        """
+        points = np.asarray(points, dtype=np.float32)
+        last_row = self.data[:, 3, np.newaxis, :]
+        w = points @ last_row[..., :3].transpose(0, 2, 1) + last_row[..., 3:]
+
+        out = np.matmul(points, self.data[:, :3, :3].transpose(0, 2, 1), out=out)
+        out += self.data[:, np.newaxis, :3, 3]
+        np.divide(out, w, out=out, where=w != 0)
+        return out
+
+    def transform_vectors(self, vectors, out=None):
+        """
+        Aplica a parte linear de cada matriz a um conjunto de vetores (sem translação)
+        Args:
+            vectors: Array (M, 3) ou (N, M, 3)
+            out: Array (N, M, 3) float32 de destino
+        Returns:
+            Array (N, M, 3) float32
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return np.matmul(vectors, self.data[:, :3, :3].transpose(0, 2, 1), out=out)
+
+    def __str__(self):
+        """Representação em string da pilha"""
+        return str(self.data)
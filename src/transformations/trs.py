@@ -0,0 +1,229 @@
+"""
+Representação decomposta de transformações afins: M = T · R · K
+T é uma translação, R uma rotação guardada como quaternion unitário e K uma
+matriz 3x3 triangular superior com escala (diagonal) e distorção (fora dela)
+"""
+
+import numpy as np
+
+try:
+    from core.exceptions import SingularMatrixException, TransformationException
+except ImportError:
+    from ..core.exceptions import SingularMatrixException, TransformationException
+
+
+def quaternion_multiply(q1, q2):
+    """
+    Produto de Hamilton de dois quaternions (w, x, y, z)
+    A rotação do produto equivale a aplicar q2 e depois q1
+    """
+    w1, x1, y1, z1 = q1
+    w2, x2, y2, z2 = q2
+    return np.array([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    ], dtype=np.float64)
+
+
+def quaternion_from_axis_angle(axis, angle):
+    """
+    Cria o quaternion unitário de uma rotação
+    Args:
+        axis: Eixo (x, y, z); não precisa estar normalizado
+        angle: Ângulo em radianos
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    axis = axis / np.linalg.norm(axis)
+    half = 0.5 * angle
+    return np.concatenate([[np.cos(half)], np.sin(half) * axis])
+
+
+def quaternion_to_matrix(q):
+    """Converte um quaternion unitário (w, x, y, z) em matriz de rotação 3x3"""
+    w, x, y, z = q
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+        [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)]
+    ], dtype=np.float64)
+
+
+def quaternion_from_matrix(rotation):
+    """
+    Converte uma matriz de rotação 3x3 em quaternion unitário (w, x, y, z)
+    Escolhe o maior termo da diagonal para evitar divisões por valores pequenos
+    """
+    m = np.asarray(rotation, dtype=np.float64)
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+    if trace > 0:
+        s = 2.0 * np.sqrt(trace + 1.0)
+        q = [0.25 * s, (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s]
+    elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2])
+        q = [(m[2, 1] - m[1, 2]) / s, 0.25 * s, (m[0, 1] + m[1, 0]) / s, (m[0, 2] + m[2, 0]) / s]
+    elif m[1, 1] > m[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2])
+        q = [(m[0, 2] - m[2, 0]) / s, (m[0, 1] + m[1, 0]) / s, 0.25 * s, (m[1, 2] + m[2, 1]) / s]
+    else:
+        s = 2.0 * np.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1])
+        q = [(m[1, 0] - m[0, 1]) / s, (m[0, 2] + m[2, 0]) / s, (m[1, 2] + m[2, 1]) / s, 0.25 * s]
+    q = np.array(q, dtype=np.float64)
+    return q / np.linalg.norm(q)
+
+
+def _decompose_linear(linear):
+    """
+    Fatora uma matriz 3x3 em rotação · triangular superior (QR)
+    A diagonal de K fica positiva, exceto o último termo quando a matriz
+    contém reflexão, para que a parte ortogonal seja sempre uma rotação.
+    Returns:
+        Tupla (rotation 3x3, shear_scale 3x3)
+    """
+    q, k = np.linalg.qr(linear)
+    signs = np.where(np.diag(k) < 0, -1.0, 1.0)
+    q = q * signs[np.newaxis, :]
+    k = k * signs[:, np.newaxis]
+    if np.linalg.det(q) < 0:
+        q[:, 2] = -q[:, 2]
+        k[2, :] = -k[2, :]
+    return q, k
+
+
+def _invert_upper_triangular(k):
+    """
+    Inversa analítica de uma matriz 3x3 triangular superior
+    Raises:
+        SingularMatrixException: Se algum termo da diagonal for ~0
+    """
+    a, b, c = k[0]
+    d, e = k[1, 1:]
+    f = k[2, 2]
+    if min(abs(a), abs(d), abs(f)) < 1e-10:
+        raise SingularMatrixException(
+            f"Não é possível inverter transformação com escala próxima de zero: {(a, d, f)}"
+        )
+    return np.array([
+        [1 / a, -b / (a * d), (b * e - c * d) / (a * d * f)],
+        [0, 1 / d, -e / (d * f)],
+        [0, 0, 1 / f]
+    ], dtype=np.float64)
+
+
+class TRSTransform:
+    """
+    Transformação afim decomposta em translação, quaternion e escala/distorção
+
+    As operações são aplicadas no espaço local (pós-multiplicação, como
+    Matrix4x4.multiply). Rotações sobre escala uniforme só multiplicam o
+    quaternion, que é renormalizado a cada passo e por isso não acumula
+    deriva; escalas e reflexões multiplicam K diretamente; distorções e
+    rotações sobre escala não uniforme refatoram R · K por QR.
+    """
+
+    def __init__(self):
+        """Inicializa com a transformação identidade"""
+        self.translation = np.zeros(3, dtype=np.float64)
+        self.rotation = np.array([1.0, 0.0, 0.0, 0.0])  # Quaternion (w, x, y, z)
+        self.shear_scale = np.eye(3, dtype=np.float64)  # K triangular superior
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Decompõe uma matriz afim 4x4
+        Raises:
+            TransformationException: Se a matriz tiver parte projetiva
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if not np.allclose(matrix[3], (0, 0, 0, 1)):
+            raise TransformationException(
+                f"Só matrizes afins podem ser decompostas, última linha: {matrix[3]}"
+            )
+        transform = cls()
+        rotation, transform.shear_scale = _decompose_linear(matrix[:3, :3])
+        transform.rotation = quaternion_from_matrix(rotation)
+        transform.translation = matrix[:3, 3].copy()
+        return transform
+
+    def copy(self):
+        """Cria uma cópia independente"""
+        new = TRSTransform()
+        new.translation = self.translation.copy()
+        new.rotation = self.rotation.copy()
+        new.shear_scale = self.shear_scale.copy()
+        return new
+
+    def _has_uniform_scale(self):
+        """Indica se K = s·I (então K comuta com qualquer rotação)"""
+        k = self.shear_scale
+        return (k[0, 1] == 0 and k[0, 2] == 0 and k[1, 2] == 0
+                and k[0, 0] == k[1, 1] == k[2, 2])
+
+    def translate(self, offset):
+        """Aplica uma translação no espaço local"""
+        self.translation += self.linear() @ np.asarray(offset, dtype=np.float64)
+        return self
+
+    def rotate(self, quaternion):
+        """Aplica uma rotação (quaternion unitário) no espaço local"""
+        if self._has_uniform_scale():
+            rotation = quaternion_multiply(self.rotation, quaternion)
+            self.rotation = rotation / np.linalg.norm(rotation)
+        else:
+            self._compose_linear(quaternion_to_matrix(quaternion))
+        return self
+
+    def compose(self, matrix):
+        """Aplica uma matriz afim 4x4 qualquer no espaço local"""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        self.translate(matrix[:3, 3])
+        self._compose_linear(matrix[:3, :3])
+        return self
+
+    def _compose_linear(self, linear):
+        """Faz R · K ← R · K · A, mantendo K triangular superior"""
+        product = self.shear_scale @ linear
+        if not (product[1, 0] or product[2, 0] or product[2, 1]):
+            self.shear_scale = product
+            return
+
+        rotation, self.shear_scale = _decompose_linear(product)
+        rotation = quaternion_to_matrix(self.rotation) @ rotation
+        self.rotation = quaternion_from_matrix(rotation)
+
+    def rotation_matrix(self):
+        """Matriz de rotação 3x3 do quaternion"""
+        return quaternion_to_matrix(self.rotation)
+
+    def linear(self):
+        """Parte linear 3x3 (R · K)"""
+        return quaternion_to_matrix(self.rotation) @ self.shear_scale
+
+    def to_matrix(self):
+        """Compõe a matriz 4x4 (float64)"""
+        matrix = np.eye(4, dtype=np.float64)
+        matrix[:3, :3] = self.linear()
+        matrix[:3, 3] = self.translation
+        return matrix
+
+    def inverse_matrix(self):
+        """
+        Matriz 4x4 inversa, sem inversão numérica genérica:
+        M⁻¹ = K⁻¹ · Rᵀ · T(-t)
+        Raises:
+            SingularMatrixException: Se a escala for ~0 em algum eixo
+        """
+        linear = _invert_upper_triangular(self.shear_scale) @ quaternion_to_matrix(self.rotation).T
+        matrix = np.eye(4, dtype=np.float64)
+        matrix[:3, :3] = linear
+        matrix[:3, 3] = -linear @ self.translation
+        return matrix
+
+    def normal_matrix(self):
+        """
+        Matriz normal 3x3 (inversa transposta da parte linear): R · K⁻ᵀ
+        Raises:
+            SingularMatrixException: Se a escala for ~0 em algum eixo
+        """
+        return quaternion_to_matrix(self.rotation) @ _invert_upper_triangular(self.shear_scale).T
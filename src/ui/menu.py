@@ -362,6 +362,18 @@ class Menu:
 
         self.buttons['levelselect_back'].draw(surface)
 
+    def view_state(self):
+        """
+        Resumo de tudo o que muda a aparência do menu
+        Returns:
+            Tupla comparável: se for igual à do último desenho, a tela não mudou
+        """
+        buttons = tuple(
+            (button.is_hovered, button.is_pressed, button.enabled)
+            for button in self.buttons.values()
+        )
+        return (self.state, self.previous_state, self.wait_for_mouse_release, buttons)
+
     def set_state(self, state):
         """Define o estado do menu"""
         self.previous_state = self.state  # Atualiza estado anterior
@@ -268,6 +268,19 @@ class Tutorial:
             return None
         return None
 
+    def view_state(self, mouse_pos):
+        """
+        Resumo de tudo o que muda a aparência do tutorial
+        Args:
+            mouse_pos: Posição do mouse (x, y)
+        Returns:
+            Tupla comparável: página atual e quais botões/links estão sob o mouse
+        """
+        rects = (self.back_button_rect, self.prev_button_rect, self.next_page_rect,
+                 self.training_mode_button, self.start_game_button, self.video_link_rect)
+        hovered = tuple(bool(rect and rect.collidepoint(mouse_pos)) for rect in rects)
+        return (self.current_page, hovered)
+
     def draw(self, surface):
         """
         Desenha a tela de tutorial
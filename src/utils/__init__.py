@@ -24,7 +24,7 @@ __all__ = [
     'darken_color', 'lighten_color',
 
     # Time utils
-    'format_time', 'get_timestamp', 'Timer',
+    'format_time', 'get_timestamp', 'Timer', 'FixedTimestep',
 
     # Validators
     'validate_color', 'validate_vector3', 'validate_matrix',
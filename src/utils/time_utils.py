@@ -178,3 +178,58 @@ class FPSCounter:
         """Reseta o contador"""
         self.frame_times.clear()
         self.last_time = time.time()
+
+
+class FixedTimestep:
+    """
+    Acumulador para simulação com passo fixo
+
+    O tempo real de cada frame é somado ao acumulador e consumido em passos
+    de duração fixa, então a simulação avança igual a 30, 60 ou 144 FPS.
+    O que sobra no acumulador vira o fator de interpolação (alpha) entre o
+    último passo simulado e o próximo.
+    """
+
+    def __init__(self, rate: float = 60.0, max_steps: int = 5):
+        """
+        Inicializa o acumulador
+
+        Args:
+            rate: Passos de simulação por segundo
+            max_steps: Máximo de passos por frame; o excesso de tempo é
+                       descartado (evita a "espiral da morte" após travamentos)
+        """
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps_taken = 0
+
+    def advance(self, frame_time: float) -> int:
+        """
+        Acumula o tempo de um frame
+
+        Args:
+            frame_time: Tempo real decorrido desde o frame anterior (segundos)
+
+        Returns:
+            Número de passos fixos a simular neste frame
+        """
+        self.accumulator += max(frame_time, 0.0)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # Descarta o atraso que não cabe em max_steps, mantendo a fração do passo atual
+            self.accumulator = self.accumulator % self.step + self.max_steps * self.step
+            steps = self.max_steps
+        self.accumulator -= steps * self.step
+        self.steps_taken += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fração (0.0-1.0) do próximo passo já decorrida, para interpolar o desenho"""
+        return min(max(self.accumulator / self.step, 0.0), 1.0)
+
+    def reset(self) -> None:
+        """Zera o acumulador"""
+        self.accumulator = 0.0
+        self.steps_taken = 0
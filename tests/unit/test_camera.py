@@ -0,0 +1,94 @@
+"""
+Testes para o cache de matrizes da câmera
+"""
+
+import pytest
+import numpy as np
+from src.rendering.camera import Camera
+
+
+@pytest.fixture
+def camera():
+    """Câmera na posição padrão do jogo"""
+    return Camera(position=[5, 2, 5], target=[0, 0, 0], fov=90, aspect=16/9)
+
+
+class TestCameraCache:
+    """Matrizes recalculadas apenas quando invalidadas"""
+
+    def test_view_projection_is_cached(self, camera):
+        """Chamadas repetidas devolvem a mesma matriz"""
+        vp = camera.get_view_projection_matrix()
+        assert camera.get_view_projection_matrix() is vp
+
+        expected = camera.projection_matrix.data @ camera.view_matrix.data
+        assert np.allclose(vp.data, expected)
+
+    def test_orbit_keeps_projection(self, camera):
+        """Orbitar invalida só a view"""
+        projection = camera.projection_matrix
+        vp = camera.get_view_projection_matrix()
+        version = camera.version
+
+        camera.orbit(0.1, 0.0)
+
+        assert camera.projection_matrix is projection
+        assert camera.get_view_projection_matrix() is not vp
+        assert camera.version == version + 1
+
+    def test_aspect_change_updates_projection(self, camera):
+        """Mudar o aspect (ex.: tela cheia) recalcula a projeção"""
+        view = camera.view_matrix
+        camera.aspect = 4 / 3
+
+        assert camera.view_matrix is view
+        assert np.isclose(camera.projection_matrix.data[0, 0],
+                          camera.projection_matrix.data[1, 1] / (4 / 3))
+
+    def test_inverse_view_projection(self, camera):
+        """A inversa em cache desfaz view * projection"""
+        vp = camera.get_view_projection_matrix().data
+        inverse = camera.get_inverse_view_projection_matrix()
+
+        assert camera.get_inverse_view_projection_matrix() is inverse
+        assert np.allclose(inverse.data @ vp, np.eye(4), atol=1e-4)
+
+    def test_position_is_read_only(self, camera):
+        """Mudanças in-place não passam despercebidas pelo cache"""
+        with pytest.raises(ValueError):
+            camera.position[0] = 10.0
+
+        version = camera.version
+        camera.move(1, 0, 0)
+        assert camera.version > version
+        assert np.allclose(camera.position, [6, 2, 5])
+
+
+class TestFrustum:
+    """Planos do frustum e testes de visibilidade"""
+
+    def test_planes_point_inward(self, camera):
+        """O alvo está dentro de todos os planos"""
+        planes = camera.get_frustum_planes()
+        assert planes.shape == (6, 4)
+        assert np.all(planes[:, :3] @ camera.target + planes[:, 3] > 0)
+        assert camera.get_frustum_planes() is planes
+
+    def test_sphere_culling(self, camera):
+        """Esferas atrás da câmera ou longe do eixo são rejeitadas"""
+        assert camera.is_sphere_visible((0, 0, 0), 1.0)
+        assert not camera.is_sphere_visible((20, 8, 20), 1.0)
+        assert not camera.is_sphere_visible((0, 0, 200), 1.0)
+        # Parcialmente dentro continua visível
+        assert camera.is_sphere_visible((0, 0, 200), 400.0)
+
+    def test_box_culling(self, camera):
+        """AABBs inteiramente fora de um plano são rejeitadas"""
+        assert camera.is_box_visible(np.array([-1, -1, -1]), np.array([1, 1, 1]))
+        assert not camera.is_box_visible(np.array([19, 7, 19]), np.array([21, 9, 21]))
+
+    def test_planes_follow_camera(self, camera):
+        """Orbitar invalida os planos em cache"""
+        planes = camera.get_frustum_planes()
+        camera.orbit(1.0, 0.0)
+        assert camera.get_frustum_planes() is not planes
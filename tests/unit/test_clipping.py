@@ -0,0 +1,75 @@
+"""
+Testes para o recorte de triângulos no espaço homogêneo
+"""
+
+import numpy as np
+from src.rendering.clipping import clip_triangles, interpolate_attributes
+
+
+def _clip_coords(points):
+    """Vértices (x, y, z, w) como array float32"""
+    return np.array(points, dtype=np.float32)
+
+
+class TestClipTriangles:
+    """Sutherland-Hodgman contra o plano próximo e a guard band"""
+
+    def test_inside_triangle_is_kept(self):
+        """Triângulo dentro da tela passa sem novos vértices"""
+        clip = _clip_coords([[0, 0, 0, 1], [0.5, 0, 0, 1], [0, 0.5, 0, 1]])
+        result = clip_triangles(clip, [[0, 1, 2]])
+
+        assert result.triangles.tolist() == [[0, 1, 2]]
+        assert result.source.tolist() == [0]
+        assert len(result.new_vertex_weights) == 0
+
+    def test_rejected_triangles(self):
+        """Triângulos atrás do plano próximo ou fora da tela são descartados"""
+        clip = _clip_coords([
+            [0, 0, -2, 1], [0.5, 0, -2, 1], [0, 0.5, -2, 1],
+            [2, 0, 0, 1], [3, 0, 0, 1], [2, 1, 0, 1]
+        ])
+        result = clip_triangles(clip, [[0, 1, 2], [3, 4, 5]])
+        assert len(result.triangles) == 0
+
+    def test_near_plane_crossing(self):
+        """Um vértice atrás do plano próximo gera um quadrilátero (dois triângulos)"""
+        clip = _clip_coords([[0, 0, 0, 1], [0.5, 0, 0, 1], [0, 0.5, -3, 1]])
+        result = clip_triangles(clip, [[0, 1, 2]])
+
+        assert len(result.triangles) == 2
+        assert (result.source == 0).all()
+
+        extended = interpolate_attributes(clip, [[0, 1, 2]], result)
+        used = extended[np.unique(result.triangles)]
+        assert np.all(used[:, 2] + used[:, 3] >= -1e-6)
+        # Os vértices novos sobre as arestas cortadas ficam exatamente no plano
+        assert np.isclose(used[:, 2] + used[:, 3], 0, atol=1e-6).sum() == 2
+
+    def test_guard_band_crossing(self):
+        """Vértices muito além da borda são trazidos para dentro da guard band"""
+        clip = _clip_coords([[0, 0, 0, 1], [100, 0, 0, 1], [0, 0.5, 0, 1]])
+        result = clip_triangles(clip, [[0, 1, 2]], guard_band=4.0)
+
+        extended = interpolate_attributes(clip, [[0, 1, 2]], result)
+        used = extended[np.unique(result.triangles)]
+        assert np.all(np.abs(used[:, 0]) <= 4.0 * used[:, 3] + 1e-5)
+
+    def test_order_is_preserved(self):
+        """Triângulos recortados ficam na posição do triângulo de origem"""
+        clip = _clip_coords([
+            [0, 0, 0, 1], [0.5, 0, 0, 1], [0, 0.5, 0, 1],
+            [0, 0, 0, 1], [0.5, 0, 0, 1], [0, 0.5, -3, 1]
+        ])
+        result = clip_triangles(clip, [[0, 1, 2], [3, 4, 5], [0, 2, 1]])
+        assert result.source.tolist() == [0, 1, 1, 2]
+
+    def test_interpolated_attributes(self):
+        """Atributos dos novos vértices seguem os pesos baricêntricos"""
+        clip = _clip_coords([[0, 0, 0, 1], [0.5, 0, 0, 1], [0, 0.5, -3, 1]])
+        colors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+        result = clip_triangles(clip, [[0, 1, 2]])
+
+        extended = interpolate_attributes(colors, [[0, 1, 2]], result)
+        assert extended.shape == (3 + len(result.new_vertex_weights), 3)
+        assert np.allclose(extended.sum(axis=1), 1.0)
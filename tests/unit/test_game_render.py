@@ -0,0 +1,61 @@
+"""
+Testes para o desenho da cena 3D do jogo (interpolação e nível de detalhe)
+"""
+
+import os
+import pytest
+from src.game import Game
+from src.rendering.camera import Camera
+from src.rendering.render_thread import RenderThread
+
+
+@pytest.fixture
+def game():
+    """Jogo no modo treino com a esfera vista de longe e auto-rotação interpolada"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    game = Game()
+    game.start_training()
+    game.set_shape(2)
+    game.camera = Camera(position=[0, 0, 40], target=[0, 0, 0], fov=60,
+                         aspect=game.window_width / game.window_height)
+    game.timestep.accumulator = game.timestep.step * 0.5  # alpha = 0.5
+    yield game
+    if game.render_thread is not None:
+        game.render_thread.stop()
+
+
+class TestInterpolatedLevelOfDetail:
+    """O LOD é escolhido nos objetos do jogo, não nas cópias interpoladas"""
+
+    def test_original_keeps_level(self, game):
+        """Entre frames interpolados a esfera original escolhe e mantém o nível"""
+        sphere = game.training_shapes[2]
+        assert game.interpolated_shapes([sphere])[0] is not sphere
+
+        game.draw_training()
+        level = sphere.lod_level
+        assert level > 0
+
+        for _ in range(3):
+            game.fixed_update(game.timestep.step)
+            game.draw_training()
+            assert sphere.lod_level == level
+        assert sphere.mesh is sphere.lod_meshes[level]
+        assert game.interpolated_shapes([sphere])[0].mesh is sphere.mesh
+
+    def test_threaded_original_keeps_level(self, game):
+        """Com a thread de renderização, o snapshot leva cópias com a malha do original"""
+        game.render_thread = RenderThread(game.renderer)
+        sphere = game.training_shapes[2]
+
+        game.draw_training()
+        assert game.render_thread.wait_idle(timeout=5)
+        level = sphere.lod_level
+        assert level > 0
+
+        for _ in range(3):
+            game.fixed_update(game.timestep.step)
+            game.draw_training()
+            assert game.render_thread.wait_idle(timeout=5)
+            assert sphere.lod_level == level
+        assert game.render_thread.frames_rendered == 4
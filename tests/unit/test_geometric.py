@@ -0,0 +1,113 @@
+"""
+Testes para o histórico de GeometricTransformations
+"""
+
+import numpy as np
+from src.transformations.geometric import GeometricTransformations
+from src.transformations.matrix import Matrix4x4
+
+
+class TestTransformationHistory:
+    """Histórico limitado e compactação das transformações de animação"""
+
+    def test_player_steps_are_exact(self):
+        """Ações do jogador ficam uma por entrada, sem fusão"""
+        transform = GeometricTransformations()
+        transform.rotate_y(10)
+        transform.rotate_y(10)
+        assert transform.get_history() == [('rotate_y', 10), ('rotate_y', 10)]
+        assert transform.get_animation_history() == []
+
+    def test_animation_is_coalesced(self):
+        """Rotações no mesmo eixo, translações e escalas uniformes são fundidas"""
+        transform = GeometricTransformations()
+        for _ in range(600):
+            transform.rotate_y(0.5, animated=True)
+        transform.translate(1, 0, 0, animated=True)
+        transform.translate(0, 2, 0, animated=True)
+        transform.scale_uniform(2, animated=True)
+        transform.scale_uniform(1.5, animated=True)
+        transform.rotate_x(5, animated=True)
+
+        assert transform.get_animation_history() == [
+            ('rotate_y', 300.0), ('translate', 1, 2, 0), ('scale', 3.0, 3.0, 3.0), ('rotate_x', 5)
+        ]
+        assert transform.get_history() == []
+
+    def test_coalesced_matrix_matches_steps(self):
+        """A matriz acumulada não depende da compactação do histórico"""
+        animated = GeometricTransformations()
+        replayed = GeometricTransformations()
+        for _ in range(100):
+            animated.rotate_y(0.5, animated=True)
+        for name, *args in animated.get_animation_history():
+            getattr(replayed, name)(*args)
+
+        assert np.allclose(animated.matrix.data, replayed.matrix.data, atol=1e-4)
+
+    def test_history_is_bounded(self):
+        """O histórico é um buffer circular com limite configurável"""
+        transform = GeometricTransformations(history_limit=3)
+        for step in range(5):
+            transform.translate(step, 0, 0)
+
+        assert [entry[1] for entry in transform.get_history()] == [2, 3, 4]
+        assert transform.copy().get_history() == transform.get_history()
+
+
+class TestMatrixTransform:
+    """Representação padrão: a matriz acumulada continua editável"""
+
+    def test_default_is_matrix(self):
+        """A representação TRS é opcional"""
+        assert not GeometricTransformations().decomposed
+
+    def test_matrix_can_be_mutated(self):
+        """Quem escreve em transform.matrix.data (inclusive com out=) continua funcionando"""
+        transform = GeometricTransformations().translate(1, 2, 3)
+        Matrix4x4.rotation_y(0.5, out=transform.matrix)
+        assert np.allclose(transform.matrix.data, Matrix4x4.rotation_y(0.5).data)
+
+        transform.matrix.data[0, 3] = 4.0
+        transform.translate(1, 0, 0)
+        assert np.isclose(transform.matrix.data[0, 3], 4.0 + np.cos(0.5))
+
+
+class TestDecomposedTransform:
+    """Representação TRS (translação, quaternion, escala/distorção)"""
+
+    def _apply_all(self, transform):
+        """Sequência com translação, rotações, escala não uniforme e distorção"""
+        transform.translate(1, -2, 3).rotate_y(30).scale(2, 1, 0.5)
+        transform.rotate_x(45).shear_xy(0.3, 0.2).reflect_z().rotate(10, 20, 30)
+        return transform
+
+    def test_matches_matrix_representation(self):
+        """A matriz composta sob demanda é a mesma do produto de matrizes"""
+        decomposed = self._apply_all(GeometricTransformations(decomposed=True))
+        dense = self._apply_all(GeometricTransformations(decomposed=False))
+        assert np.allclose(decomposed.matrix.data, dense.matrix.data, atol=1e-5)
+        assert np.allclose(decomposed.get_normal_matrix(), dense.get_normal_matrix(), atol=1e-4)
+
+    def test_analytic_inverse(self):
+        """Inversa analítica desfaz a transformação"""
+        transform = self._apply_all(GeometricTransformations(decomposed=True))
+        product = transform.get_inverse_matrix().data @ transform.matrix.data
+        assert np.allclose(product, np.eye(4), atol=1e-5)
+
+    def test_rotation_does_not_drift(self):
+        """Milhares de rotações pequenas mantêm a parte 3x3 ortonormal"""
+        transform = GeometricTransformations(decomposed=True)
+        for _ in range(5000):
+            transform.rotate_y(0.5, animated=True)
+
+        rotation = transform.matrix.data[:3, :3].astype(np.float64)
+        assert np.abs(rotation @ rotation.T - np.eye(3)).max() < 1e-6
+        assert np.isclose(np.linalg.norm(transform._trs.rotation), 1.0)
+
+    def test_set_matrix_round_trip(self):
+        """set_matrix decompõe a matriz e a recompõe igual"""
+        source = self._apply_all(GeometricTransformations(decomposed=False))
+        transform = GeometricTransformations(decomposed=True).set_matrix(source.matrix)
+        assert np.allclose(transform.matrix.data, source.matrix.data, atol=1e-5)
+        assert np.allclose(np.tril(transform._trs.shear_scale, -1), 0)
@@ -0,0 +1,75 @@
+"""
+Testes para os modelos de iluminação
+"""
+
+import pytest
+import numpy as np
+from src.rendering.lighting import Light, LambertianShading, PhongShading, GouraudShading
+
+
+@pytest.fixture
+def shading_inputs():
+    """Pontos e normais aleatórios (reprodutíveis) para comparar as versões"""
+    rng = np.random.default_rng(42)
+    points = rng.uniform(-2, 2, size=(50, 3)).astype(np.float32)
+    normals = rng.normal(size=(50, 3)).astype(np.float32)
+    light = Light([0, 10, -10])
+    return points, normals, light
+
+
+class TestBatchShading:
+    """A versão vetorizada deve reproduzir a versão ponto a ponto"""
+
+    @pytest.mark.parametrize('model', [LambertianShading(), PhongShading(), GouraudShading()])
+    def test_calculate_colors_matches_calculate_color(self, model, shading_inputs):
+        """calculate_colors == calculate_color aplicado a cada ponto"""
+        points, normals, light = shading_inputs
+        material = (1.0, 0.5, 0.2)
+        camera_pos = (5, 2, 5)
+
+        batch = model.calculate_colors(points, normals, light, material, camera_pos)
+        single = [
+            model.calculate_color(point, normal, light, material, camera_pos)
+            for point, normal in zip(points, normals)
+        ]
+
+        assert batch.dtype == np.uint8
+        assert batch.shape == (50, 3)
+        assert np.abs(batch.astype(int) - np.array(single)).max() <= 1
+
+    def test_per_point_material(self, shading_inputs):
+        """Cor do material pode variar por ponto"""
+        points, normals, light = shading_inputs
+        materials = np.zeros((50, 3), dtype=np.float32)
+        shading = PhongShading(specular=0.0)
+        colors = shading.calculate_colors(points, normals, light, materials, (0, 0, 5))
+        assert (colors == 0).all()
+
+
+class TestLightTerms:
+    """Termos de luz usados pelo Phong por pixel"""
+
+    def test_light_terms_recompose_color(self, shading_inputs):
+        """material * difusa + especular reproduz calculate_colors"""
+        points, normals, light = shading_inputs
+        model = PhongShading(per_pixel=True)
+        material = np.array([1.0, 0.5, 0.2], dtype=np.float32)
+
+        diffuse, specular = model.calculate_light_terms(points, normals, light, (5, 2, 5))
+        colors = (np.clip(material * diffuse + specular, 0.0, 1.0) * 255).astype(np.uint8)
+
+        expected = model.calculate_colors(points, normals, light, material, (5, 2, 5))
+        assert np.abs(colors.astype(int) - expected).max() <= 1
+
+    def test_light_terms_accept_image_shape(self, shading_inputs):
+        """Os termos podem ser calculados sobre um buffer (W, H, 3)"""
+        points, normals, light = shading_inputs
+        model = PhongShading()
+
+        diffuse, specular = model.calculate_light_terms(
+            points.reshape(5, 10, 3), normals.reshape(5, 10, 3), light, (5, 2, 5)
+        )
+        flat_diffuse, _ = model.calculate_light_terms(points, normals, light, (5, 2, 5))
+
+        assert diffuse.shape == (5, 10, 3)
+        assert np.allclose(diffuse.reshape(-1, 3), flat_diffuse)
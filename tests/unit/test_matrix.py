@@ -0,0 +1,78 @@
+"""
+Testes para as operações em lote de Matrix4x4 e Matrix4x4Stack
+"""
+
+import pytest
+import numpy as np
+from core.exceptions import SingularMatrixException
+from src.transformations.matrix import Matrix4x4
+from src.transformations.matrix_stack import Matrix4x4Stack
+
+
+class TestMatrixOut:
+    """Variantes out= sem alocação"""
+
+    def test_rotation_matches_composition(self):
+        """A forma fechada é igual a Rz · Ry · Rx, também escrita em out"""
+        expected = np.linalg.multi_dot([
+            Matrix4x4.rotation_z(0.7).data, Matrix4x4.rotation_y(-0.4).data,
+            Matrix4x4.rotation_x(1.1).data
+        ])
+        out = Matrix4x4.scale(3, 3, 3)
+        result = Matrix4x4.rotation(1.1, -0.4, 0.7, out=out)
+        assert result is out
+        assert np.allclose(out.data, expected, atol=1e-6)
+
+    def test_multiply_in_place(self):
+        """multiply pode escrever o produto sobre um dos operandos"""
+        a = Matrix4x4.translation(1, 2, 3)
+        b = Matrix4x4.rotation_y(0.5)
+        expected = a.data @ b.data
+        a.multiply(b, out=a)
+        assert np.allclose(a.data, expected)
+
+
+class TestTransformPoints:
+    """Transformação de vários pontos com um produto matricial"""
+
+    def test_matches_transform_point(self):
+        """Mesmo resultado de transform_point, também com divisão perspectiva"""
+        points = np.random.default_rng(0).uniform(-1, 1, (20, 3))
+        for matrix in (Matrix4x4.rotation(0.3, 0.2, 0.1).multiply(Matrix4x4.translation(1, 0, 2)),
+                       Matrix4x4.perspective(60, 1.5, 0.1, 100)):
+            expected = [matrix.transform_point(point) for point in points]
+            assert np.allclose(matrix.transform_points(points), expected, atol=1e-5)
+
+    def test_stack_matches_single_matrices(self):
+        """Cada matriz da pilha transforma os pontos como a Matrix4x4 equivalente"""
+        angles = np.linspace(0, np.pi, 5)
+        stack = Matrix4x4Stack.rotation(angles, -angles, 0.5).compose(
+            Matrix4x4Stack.translation(np.outer(angles, (1, 2, 3)))
+        )
+        points = np.random.default_rng(1).uniform(-1, 1, (7, 3)).astype(np.float32)
+        result = stack.transform_points(points)
+        assert result.shape == (5, 7, 3)
+        for index, angle in enumerate(angles):
+            matrix = Matrix4x4.rotation(angle, -angle, 0.5).multiply(
+                Matrix4x4.translation(angle, 2 * angle, 3 * angle)
+            )
+            assert np.allclose(stack[index].data, matrix.data, atol=1e-6)
+            assert np.allclose(result[index], matrix.transform_points(points), atol=1e-5)
+
+
+class TestMatrixStack:
+    """Inversão em lote"""
+
+    def test_inverse(self):
+        """Pilha · inversa = identidade"""
+        stack = Matrix4x4Stack.scale([(1, 2, 3), (0.5, 0.5, 4)]).compose(
+            Matrix4x4Stack.rotation_y([0.3, 1.2])
+        )
+        product = stack.compose(stack.inverse())
+        assert np.allclose(product.data, np.eye(4), atol=1e-5)
+
+    def test_singular_matrix_raises(self):
+        """Uma matriz singular na pilha levanta SingularMatrixException"""
+        stack = Matrix4x4Stack.scale([(1, 1, 1), (0, 1, 1)])
+        with pytest.raises(SingularMatrixException):
+            stack.inverse()
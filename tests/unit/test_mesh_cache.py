@@ -0,0 +1,57 @@
+"""
+Testes para o cache de malhas das primitivas
+"""
+
+import pytest
+import numpy as np
+from src.objects import mesh_cache
+from src.objects.mesh_cache import cached_mesh, clear_mesh_cache
+from src.objects.primitives import Sphere, Torus
+
+
+def _grid(size):
+    """Gerador simples: uma faixa de quadriláteros"""
+    vertices = [(x, y, 0) for x in range(size + 1) for y in range(2)]
+    faces = [[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] for i in range(size)]
+    return vertices, faces
+
+
+class TestMeshCache:
+    """Memoização em memória e persistência em .npz"""
+
+    def test_instances_share_mesh(self):
+        """Primitivas com os mesmos parâmetros compartilham os arrays"""
+        first = Sphere(radius=1.0, subdivisions=2)
+        second = Sphere(radius=1.0, subdivisions=2, color=(0, 0, 1))
+        assert first.original_vertices is second.original_vertices
+        assert first.packed is second.packed
+        assert not first.original_vertices.flags.writeable
+        assert Torus().original_vertices is not first.original_vertices
+
+    def test_shared_mesh_keeps_faces(self):
+        """A lista de faces é reconstruída a partir das faces compactadas"""
+        sphere = Sphere(subdivisions=1)
+        assert len(sphere.faces) == 80
+        assert all(len(face) == 3 for face in sphere.faces)
+
+    def test_disk_round_trip(self, tmp_path):
+        """A malha gravada em disco é lida sem chamar o gerador de novo"""
+        clear_mesh_cache()
+        generated = cached_mesh('grid', (3,), _grid, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob('grid_*.npz'))) == 1
+
+        clear_mesh_cache()
+        loaded = cached_mesh('grid', (3,), pytest.fail, cache_dir=tmp_path)
+        assert np.array_equal(loaded.vertices, generated.vertices)
+        for expected, actual in zip(generated.packed, loaded.packed):
+            assert np.array_equal(expected, actual)
+
+    def test_corrupt_file_is_regenerated(self, tmp_path):
+        """Um arquivo inválido é descartado e a malha é gerada de novo"""
+        clear_mesh_cache()
+        path = mesh_cache._cache_path(tmp_path, ('grid', 2))
+        path.write_bytes(b'not a zip')
+
+        mesh = cached_mesh('grid', (2,), _grid, cache_dir=tmp_path)
+        assert mesh.vertices.shape == (6, 3)
+        assert len(mesh.packed.face_sizes) == 2
@@ -0,0 +1,92 @@
+"""
+Testes para os geradores vetorizados das primitivas
+"""
+
+import numpy as np
+from src.objects.primitives import Sphere, Cylinder, Torus
+
+
+def _subdivide_reference(vertices, faces, radius):
+    """Subdivisão incremental com cache de arestas em dicionário (referência)"""
+    vertices = [tuple(v) for v in vertices]
+    new_faces = []
+    edge_cache = {}
+
+    def middle(i, j):
+        key = (min(i, j), max(i, j))
+        if key not in edge_cache:
+            point = (np.array(vertices[i]) + np.array(vertices[j])) / 2.0
+            vertices.append(tuple(point / np.linalg.norm(point) * radius))
+            edge_cache[key] = len(vertices) - 1
+        return edge_cache[key]
+
+    for v1, v2, v3 in faces:
+        a, b, c = middle(v1, v2), middle(v2, v3), middle(v3, v1)
+        new_faces += [[v1, a, c], [v2, b, a], [v3, c, b], [a, b, c]]
+    return np.array(vertices), np.array(new_faces)
+
+
+class TestPrimitiveGenerators:
+    """Topologia das primitivas geradas com NumPy"""
+
+    def test_sphere_subdivision_matches_incremental(self):
+        """A deduplicação vetorizada numera os pontos médios como a versão incremental"""
+        sphere = Sphere(radius=1.5, subdivisions=0)
+        vertices, faces = sphere.original_vertices.astype(np.float64), np.array(sphere.faces)
+        for _ in range(3):
+            vertices, faces = _subdivide_reference(vertices, faces, 1.5)
+
+        subdivided = Sphere(radius=1.5, subdivisions=3)
+        assert np.array_equal(np.array(subdivided.faces), faces)
+        assert np.allclose(subdivided.original_vertices, vertices, atol=1e-6)
+
+    def test_sphere_is_closed_surface(self):
+        """Característica de Euler V - E + F = 2"""
+        sphere = Sphere(subdivisions=4)
+        face_count = len(sphere.faces)
+        assert len(sphere.original_vertices) - face_count * 3 // 2 + face_count == 2
+
+    def test_cylinder_layout(self):
+        """Anéis intercalados, centros das tampas no fim; laterais, tampa inferior e superior"""
+        cylinder = Cylinder(radius=0.5, height=2.0, segments=4)
+        assert len(cylinder.original_vertices) == 10
+        assert cylinder.faces[0] == (0, 2, 3, 1)
+        assert cylinder.faces[4] == (8, 2, 0)
+        assert cylinder.faces[8] == (9, 1, 3)
+        assert np.allclose(cylinder.original_vertices[8:], [[0, -1, 0], [0, 1, 0]])
+
+    def test_torus_high_resolution(self):
+        """Torus com dezenas de milhares de triângulos em uma grade de quadriláteros"""
+        torus = Torus(major_segments=200, minor_segments=100)
+        assert len(torus.triangles) == 40000
+        assert torus.faces[1] == (1, 101, 102, 2)
+        distance = np.linalg.norm(torus.original_vertices[:, [0, 2]], axis=1)
+        height = torus.original_vertices[:, 1]
+        assert np.allclose(np.abs(distance - 1.0) ** 2 + height ** 2, 0.09, atol=1e-5)
+
+
+class TestLevelOfDetail:
+    """Cadeias de LOD das primitivas curvas"""
+
+    def test_chains_get_coarser(self):
+        """Cada nível tem menos triângulos que o anterior"""
+        for shape in (Sphere(subdivisions=2), Cylinder(segments=16), Torus()):
+            counts = [len(mesh.triangles) for mesh in shape.lod_meshes]
+            assert len(counts) > 1
+            assert counts == sorted(counts, reverse=True)
+
+    def test_hysteresis(self):
+        """O nível só muda quando o raio passa o limiar com margem"""
+        sphere = Sphere(subdivisions=2)
+        thresholds = (100, 10)
+
+        assert not sphere.select_lod(90, thresholds, 0.2)
+        assert sphere.select_lod(70, thresholds, 0.2)
+        assert sphere.lod_level == 1
+        assert len(sphere.triangles) == 80
+
+        assert not sphere.select_lod(110, thresholds, 0.2)
+        assert sphere.select_lod(125, thresholds, 0.2)
+        assert sphere.lod_level == 0
+        assert sphere.select_lod(1, thresholds, 0.2)
+        assert sphere.lod_level == 2
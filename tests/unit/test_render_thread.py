@@ -0,0 +1,102 @@
+"""
+Testes para a renderização da cena 3D em thread separada
+"""
+
+import numpy as np
+import pygame
+from src.rendering.camera import Camera
+from src.rendering.lighting import Light, LambertianShading
+from src.rendering.renderer import Renderer
+from src.rendering.render_thread import RenderThread, take_snapshot
+from src.objects.primitives import Cube
+
+
+def _scene():
+    """Cubo girado, câmera e luz"""
+    camera = Camera(position=[3, 2, 4], target=[0, 0, 0], fov=60, aspect=1.0)
+    cube = Cube(size=2.0)
+    cube.rotate_y(30)
+    return [cube], camera, Light([0, 5, 5])
+
+
+class TestSnapshot:
+    """Snapshots não mudam quando a cena continua sendo atualizada"""
+
+    def test_snapshot_is_frozen(self):
+        """Transformar objetos e mover a câmera não altera o snapshot"""
+        shapes, camera, light = _scene()
+        snapshot = take_snapshot(shapes, camera, light, LambertianShading(), (0, 0, 0))
+        model = snapshot.shapes[0].model_matrix.copy()
+        view_projection = snapshot.camera.get_view_projection_matrix().data.copy()
+
+        shapes[0].rotate_y(45).translate(1, 0, 0)
+        camera.orbit(0.5, 0.1)
+
+        assert np.array_equal(snapshot.shapes[0].model_matrix, model)
+        assert np.array_equal(snapshot.camera.get_view_projection_matrix().data, view_projection)
+        assert not np.array_equal(shapes[0].model_matrix, model)
+
+    def test_hidden_shapes_are_skipped(self):
+        """Só objetos visíveis entram no snapshot"""
+        shapes, camera, light = _scene()
+        shapes[0].visible = False
+        snapshot = take_snapshot(shapes, camera, light, LambertianShading(), (0, 0, 0))
+        assert snapshot.shapes == ()
+
+
+class TestRenderThread:
+    """Frames desenhados pela thread"""
+
+    def test_matches_direct_rendering(self):
+        """O frame da thread é igual ao desenhado diretamente pelo Renderer"""
+        shapes, camera, light = _scene()
+        shading = LambertianShading()
+
+        direct = Renderer(64, 64)
+        direct.set_surface(pygame.Surface((64, 64)))
+        direct.clear((10, 20, 30))
+        direct.draw_scene(shapes, camera, shading, light)
+        direct.present()
+
+        thread = RenderThread(Renderer(64, 64))
+        try:
+            screen = pygame.Surface((64, 64))
+            thread.blit_latest(screen, (10, 20, 30))
+            assert tuple(screen.get_at((0, 0)))[:3] == (10, 20, 30)
+
+            thread.submit(take_snapshot(shapes, camera, light, shading, (10, 20, 30)))
+            assert thread.wait_idle(timeout=5)
+            thread.blit_latest(screen, (10, 20, 30))
+        finally:
+            thread.stop()
+
+        assert thread.frames_rendered == 1
+        assert np.array_equal(pygame.surfarray.array3d(screen),
+                              pygame.surfarray.array3d(direct.surface))
+
+    def test_level_of_detail_on_original(self):
+        """O LOD é escolhido nos objetos originais, não só nas cópias do snapshot"""
+        from src.objects.primitives import Sphere
+
+        sphere = Sphere(radius=1.0, subdivisions=2)
+        light = Light([0, 0, 10])
+        shading = LambertianShading()
+        renderer = Renderer(256, 256)
+        black = (0, 0, 0)
+
+        thread = RenderThread(renderer)
+        try:
+            far = Camera(position=[0, 0, 40], target=[0, 0, 0], fov=90, aspect=1.0)
+            for _ in range(3):
+                snapshot = take_snapshot([sphere], far, light, shading, black, renderer=renderer)
+                thread.submit(snapshot)
+                assert thread.wait_idle(timeout=5)
+            assert sphere.lod_level == 2
+            assert snapshot.shapes[0].mesh is sphere.mesh
+
+            near = Camera(position=[0, 0, 3], target=[0, 0, 0], fov=90, aspect=1.0)
+            thread.submit(take_snapshot([sphere], near, light, shading, black, renderer=renderer))
+            assert thread.wait_idle(timeout=5)
+            assert sphere.lod_level == 0
+        finally:
+            thread.stop()
@@ -0,0 +1,179 @@
+"""
+Testes para a fila de desenho da cena no Renderer
+"""
+
+import pytest
+import numpy as np
+import pygame
+from src.rendering.renderer import Renderer
+from src.rendering.camera import Camera
+from src.rendering.lighting import Light, LambertianShading
+from src.objects.primitives import Cube
+
+
+@pytest.fixture
+def scene():
+    """Cubo pequeno na frente de um cubo grande, listado antes dele"""
+    camera = Camera(position=[0, 0, 5], target=[0, 0, 0], fov=90, aspect=1.0)
+    near = Cube(size=0.5, color=(1.0, 0.0, 0.0))
+    near.translate(0, 0, 2)
+    far = Cube(size=2.0, color=(0.0, 0.0, 1.0))
+    return camera, [near, far]
+
+
+def _render(backend, draw):
+    """Renderiza em uma superfície 64x64 e devolve o pixel central"""
+    renderer = Renderer(64, 64, backend)
+    renderer.set_surface(pygame.Surface((64, 64)))
+    renderer.clear((0, 0, 0))
+    draw(renderer)
+    renderer.present()
+    return renderer.surface.get_at((32, 32))[:3]
+
+
+class TestDrawScene:
+    """Ordenação global entre objetos"""
+
+    @pytest.mark.parametrize('backend', ['painter', 'zbuffer'])
+    def test_nearest_object_wins(self, backend, scene):
+        """O objeto mais próximo aparece na frente, independente da ordem da lista"""
+        camera, shapes = scene
+        light = Light([0, 0, 10])
+        color = _render(backend, lambda r: r.draw_scene(shapes, camera, LambertianShading(), light))
+
+        assert color[0] > 0
+        assert color[2] == 0
+
+    def test_culled_shapes_are_counted(self, scene):
+        """Objetos fora do frustum entram nas estatísticas"""
+        camera, shapes = scene
+        shapes[1].translate(0, 0, 50)
+
+        renderer = Renderer(64, 64)
+        renderer.set_surface(pygame.Surface((64, 64)))
+        renderer.clear((0, 0, 0))
+        renderer.draw_scene(shapes, camera, LambertianShading(), Light([0, 0, 10]))
+
+        assert renderer.culled_shapes == 1
+        assert renderer.culled_triangles == len(shapes[1].triangles)
+
+
+class TestModelMatrix:
+    """A matriz de modelo entra na MVP sem materializar os vértices"""
+
+    @pytest.mark.parametrize('backend', ['painter', 'zbuffer'])
+    def test_matches_world_space_vertices(self, backend, scene):
+        """Desenhar o objeto é igual a desenhar seus vértices no mundo"""
+        camera, _ = scene
+        cube = Cube(size=2.0)
+        cube.rotate_y(35).rotate_x(20)
+        light = Light([0, 0, 10])
+
+        def draw_world(renderer):
+            renderer.draw_mesh(cube.vertices, cube.get_faces(), cube.face_normals,
+                               camera, LambertianShading(), light, cube.get_color())
+
+        world = _render(backend, draw_world)
+        cube._invalidate()
+        lazy = _render(backend, lambda r: r.draw_shape(cube, camera, LambertianShading(), light))
+        assert cube._vertices is None
+        assert np.abs(np.array(world, dtype=int) - np.array(lazy, dtype=int)).max() <= 1
+
+
+class TestLevelOfDetail:
+    """Escolha do nível de detalhe pelo tamanho na tela"""
+
+    def test_distance_selects_level(self):
+        """Objetos distantes usam malhas mais simples; de perto, a mais detalhada"""
+        from src.objects.primitives import Sphere
+
+        renderer = Renderer(256, 256)
+        renderer.set_surface(pygame.Surface((256, 256)))
+        sphere = Sphere(radius=1.0, subdivisions=2)
+        light = Light([0, 0, 10])
+
+        far = Camera(position=[0, 0, 40], target=[0, 0, 0], fov=90, aspect=1.0)
+        renderer.draw_shape(sphere, far, LambertianShading(), light)
+        assert sphere.lod_level == 2
+
+        near = Camera(position=[0, 0, 3], target=[0, 0, 0], fov=90, aspect=1.0)
+        renderer.draw_shape(sphere, near, LambertianShading(), light)
+        assert sphere.lod_level == 0
+        assert np.isclose(renderer.projected_radius((0, 0, 0), 1.0, near), 128 / np.sqrt(8))
+
+
+class TestInstancing:
+    """Várias cópias de uma malha desenhadas em um único lote"""
+
+    @pytest.mark.parametrize('backend', ['painter', 'zbuffer'])
+    def test_matches_individual_shapes(self, backend):
+        """Desenhar as instâncias é igual a desenhar as cópias uma a uma"""
+        from src.rendering.lighting import GouraudShading
+
+        camera = Camera(position=[0, 2, 8], target=[0, 0, 0], fov=60, aspect=1.0)
+        light = Light([3, 5, 5])
+        base = Cube(size=1.0)
+        shapes = []
+        for index, x in enumerate((-2.0, 0.0, 2.0)):
+            shape = base.copy()
+            shape.color = (0.3 * index, 0.5, 1.0 - 0.3 * index)
+            shapes.append(shape.translate(x, 0, 0).rotate_y(20 * index))
+
+        for shading in (LambertianShading(), GouraudShading()):
+            images = []
+            for draw in (
+                lambda r: r.draw_scene(shapes, camera, shading, light),
+                lambda r: r.draw_instances(base, [s.transform.matrix for s in shapes],
+                                           [s.color for s in shapes], camera, shading, light)
+            ):
+                renderer = Renderer(64, 64, backend)
+                renderer.set_surface(pygame.Surface((64, 64)))
+                renderer.clear((0, 0, 0))
+                draw(renderer)
+                renderer.present()
+                images.append(pygame.surfarray.array3d(renderer.surface).astype(int))
+            assert np.abs(images[0] - images[1]).max() <= 1
+
+    def test_culls_instances_outside_frustum(self):
+        """Instâncias fora do frustum são descartadas antes da transformação"""
+        camera = Camera(position=[0, 0, 5], target=[0, 0, 0], fov=60, aspect=1.0)
+        matrices = np.tile(np.eye(4, dtype=np.float32), (2, 1, 1))
+        matrices[1, :3, 3] = (0, 0, 50)  # Atrás da câmera
+
+        renderer = Renderer(64, 64)
+        renderer.set_surface(pygame.Surface((64, 64)))
+        drawn = renderer.draw_instances(Cube().mesh, matrices, (1.0, 0.0, 0.0),
+                                        camera, LambertianShading(), Light([0, 0, 10]))
+        assert drawn == 1
+        assert renderer.culled_shapes == 1
+
+
+class TestStaticFrameReuse:
+    """Reaproveitamento da imagem quando a cena não muda"""
+
+    @pytest.mark.parametrize('backend', ['painter', 'zbuffer'])
+    def test_reuses_until_scene_changes(self, backend, scene):
+        """Só renderiza de novo quando objeto, câmera ou luz mudam"""
+        camera, shapes = scene
+        light = Light([0, 5, 5])
+        shading = LambertianShading()
+        renderer = Renderer(64, 64, backend)
+        renderer.set_surface(pygame.Surface((64, 64)))
+
+        def frame():
+            return renderer.render_frame(shapes, camera, shading, light, (0, 0, 0))
+
+        assert frame()
+        image = pygame.surfarray.array3d(renderer.surface)
+        renderer.surface.fill((255, 255, 255))  # HUD do frame anterior
+        assert not frame()
+        assert np.array_equal(pygame.surfarray.array3d(renderer.surface), image)
+
+        shapes[1].rotate_y(30)
+        assert frame()
+        assert not frame()
+        camera.orbit(0.1, 0.0)
+        assert frame()
+        light.intensity = 0.5
+        assert frame()
+        assert frame() is False
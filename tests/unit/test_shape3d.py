@@ -0,0 +1,248 @@
+"""
+Testes para a classe Shape3D e sua representação compactada
+"""
+
+import pytest
+import numpy as np
+from src.objects.mesh import pack_faces
+from src.objects.shape3d import Shape3D
+from src.objects.primitives import Cube, Pyramid
+
+
+class TestPackFaces:
+    """Testes para a pré-compilação das faces"""
+
+    def test_triangulates_quads_in_fan(self):
+        """Quadriláteros viram dois triângulos em leque"""
+        packed = pack_faces([[0, 1, 2, 3]])
+        assert packed.triangles.dtype == np.int32
+        assert packed.triangles.tolist() == [[0, 1, 2], [0, 2, 3]]
+        assert packed.triangle_faces.tolist() == [0, 0]
+
+    def test_keeps_face_order_with_mixed_sizes(self):
+        """Triângulos seguem a ordem das faces mesmo com tamanhos diferentes"""
+        packed = pack_faces([[0, 1, 2, 3], [0, 1, 4], [1, 2], [2, 3, 4]])
+        assert packed.triangle_faces.tolist() == [0, 0, 1, 3]
+        assert packed.face_sizes.tolist() == [4, 3, 2, 3]
+
+    def test_shape_packed_arrays(self, sample_vertices, sample_faces):
+        """Shape3D constrói os arrays compactados na construção"""
+        shape = Shape3D(sample_vertices, sample_faces)
+        assert shape.triangles.shape == (2, 3)
+        assert shape.face_normals.shape == (2, 3)
+
+
+class TestShapeNormals:
+    """Testes para as normais por face"""
+
+    def test_cube_normals_are_unit(self):
+        """Normais do cubo são unitárias e alinhadas aos eixos"""
+        cube = Cube(size=2.0)
+        norms = np.linalg.norm(cube.face_normals, axis=1)
+        assert np.allclose(norms, 1.0)
+        assert np.allclose(np.abs(cube.face_normals).max(axis=1), 1.0)
+
+    def test_normals_follow_rotation(self):
+        """Normais transformadas acompanham a rotação"""
+        pyramid = Pyramid()
+        pyramid.rotate_y(90)
+        expected = pyramid.original_normals @ np.array(
+            [[0, 0, -1], [0, 1, 0], [1, 0, 0]], dtype=np.float32
+        )
+        assert np.allclose(pyramid.face_normals, expected, atol=1e-5)
+
+
+class TestVertexNormals:
+    """Testes para as normais suaves por vértice (Gouraud)"""
+
+    def test_sphere_vertex_normals_are_radial(self):
+        """Na esfera, a normal suave de cada vértice aponta para fora do centro"""
+        from src.objects.primitives import Sphere
+        sphere = Sphere(radius=2.0, subdivisions=2)
+        radial = sphere.vertices / np.linalg.norm(sphere.vertices, axis=1, keepdims=True)
+        alignment = np.einsum('ij,ij->i', sphere.get_vertex_normals(), radial)
+        assert (alignment > 0.99).all()
+
+    def test_cache_invalidated_by_transform(self):
+        """O cache é descartado quando a transformação muda"""
+        cube = Cube()
+        before = cube.get_vertex_normals()
+        assert cube.get_vertex_normals() is before
+
+        cube.rotate_x(90)
+        after = cube.get_vertex_normals()
+        assert after is not before
+        assert np.allclose(np.linalg.norm(after, axis=1), 1.0)
+
+
+class TestBounds:
+    """AABB e esfera envolvente atualizadas com as transformações"""
+
+    def test_bounds_follow_transformations(self):
+        """Translação e escala movem a AABB e a esfera"""
+        cube = Cube(size=2.0)
+        assert np.allclose(cube.bounding_min, [-1, -1, -1])
+        assert np.allclose(cube.bounding_radius, np.sqrt(3))
+
+        cube.translate(5, 0, 0)
+        cube.scale_uniform(2.0)
+
+        assert np.allclose(cube.bounding_center, cube.vertices.mean(axis=0), atol=1e-5)
+        assert np.allclose(cube.bounding_min, cube.vertices.min(axis=0))
+        assert np.allclose(cube.bounding_radius, 2 * np.sqrt(3))
+
+    def test_sphere_contains_vertices(self):
+        """A esfera envolve todos os vértices mesmo com distorção"""
+        pyramid = Pyramid()
+        pyramid.shear_xy(0.5, 0.3)
+        pyramid.rotate_y(37)
+
+        distances = np.linalg.norm(pyramid.vertices - pyramid.bounding_center, axis=1)
+        assert np.all(distances <= pyramid.bounding_radius + 1e-5)
+
+    def test_reset_restores_bounds(self):
+        """reset_transformations volta aos limites originais"""
+        cube = Cube(size=2.0)
+        cube.translate(3, 3, 3)
+        cube.reset_transformations()
+        assert np.allclose(cube.bounding_center, [0, 0, 0])
+
+    def test_bounding_box_is_exact(self):
+        """get_bounding_box é o min/max dos vértices; a caixa de culling só os contém"""
+        cube = Cube(size=2.0)
+        cube.rotate_y(45)
+        cube.translate(1, 0, 0)
+
+        low, high = cube.get_bounding_box()
+        assert np.allclose(low, cube.vertices.min(axis=0), atol=1e-6)
+        assert np.allclose(high, cube.vertices.max(axis=0), atol=1e-6)
+
+        culling_low, culling_high = cube.get_culling_box()
+        assert np.all(np.array(culling_low) <= np.array(low) + 1e-5)
+        assert np.all(np.array(culling_high) >= np.array(high) - 1e-5)
+
+        cube.rotate_y(45)
+        assert np.allclose(cube.get_bounding_box()[1], cube.vertices.max(axis=0), atol=1e-6)
+
+
+class TestLazyTransform:
+    """Vértices e normais no espaço do mundo calculados sob demanda"""
+
+    def test_transform_does_not_rewrite_vertices(self):
+        """Transformar só marca o objeto como sujo; o acesso materializa"""
+        cube = Cube()
+        cube.rotate_y(30).scale(2, 1, 1).translate(1, 0, 0)
+        assert cube._vertices is None
+
+        matrix = cube.model_matrix
+        expected = cube.original_vertices @ matrix[:3, :3].T + matrix[:3, 3]
+        assert np.allclose(cube.vertices, expected, atol=1e-5)
+        assert cube.vertices is cube.vertices
+
+    def test_face_normals_follow_transform(self):
+        """As normais por face vêm da matriz normal sobre as originais"""
+        cube = Cube()
+        cube.shear_xy(0.5, 0.0).rotate_x(40)
+        assert np.allclose(cube.face_normals, cube._calculate_normals(cube.vertices), atol=1e-5)
+
+    def test_version_counts_changes(self):
+        """Cada transformação aumenta a versão; ler os dados não"""
+        cube = Cube()
+        version = cube.version
+        cube.model_matrix
+        assert cube.version == version
+        cube.translate(1, 0, 0)
+        assert cube.version == version + 1
+
+
+class TestArrayAccessors:
+    """Acesso sem cópia aos arrays do objeto"""
+
+    def test_arrays_are_read_only_views(self):
+        """Os acessores devolvem os próprios arrays em cache, somente leitura"""
+        cube = Cube()
+        cube.rotate_y(20)
+        vertices = cube.get_vertex_array()
+        assert vertices is cube.get_vertex_array()
+        assert vertices.dtype == np.float32
+        assert not vertices.flags.writeable
+        assert not cube.get_normal_array().flags.writeable
+        assert not cube.get_index_buffer().flags.writeable
+        with pytest.raises(ValueError):
+            vertices[0, 0] = 1.0
+
+    def test_pack_faces_accepts_array(self):
+        """Faces uniformes em array produzem o mesmo empacotamento das listas"""
+        faces = [[0, 1, 2, 3], [4, 5, 6, 7]]
+        from_list = pack_faces(faces)
+        from_array = pack_faces(np.array(faces))
+        for expected, actual in zip(from_list, from_array):
+            assert np.array_equal(expected, actual)
+
+
+class TestSharedMesh:
+    """Mesh imutável compartilhado e cópia copy-on-write"""
+
+    def test_mesh_is_immutable(self):
+        """Os arrays do Mesh são somente leitura"""
+        from src.objects.mesh import Mesh
+        mesh = Mesh([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [[0, 1, 2]])
+        assert not mesh.vertices.flags.writeable
+        assert not mesh.normals.flags.writeable
+        assert all(not array.flags.writeable for array in mesh.packed)
+        assert np.allclose(mesh.normals, [[0, 0, 1]])
+
+    def test_faces_are_immutable(self):
+        """As faces compartilhadas são tuplas; malha vazia não tem faces"""
+        from src.objects.mesh import Mesh
+        cube = Cube()
+        assert isinstance(cube.get_faces(), tuple)
+        assert all(isinstance(face, tuple) for face in cube.get_faces())
+        assert cube.copy().get_faces() is cube.get_faces()
+        assert Mesh(np.empty((0, 3)), []).faces == ()
+
+    def test_instances_share_mesh(self):
+        """Objetos criados a partir do mesmo Mesh só têm transformação e cor próprias"""
+        cube = Cube()
+        shapes = [Shape3D(cube.mesh, color=(i / 10, 0, 0)) for i in range(10)]
+        assert all(shape.mesh is cube.mesh for shape in shapes)
+        assert all(shape.original_normals is cube.original_normals for shape in shapes)
+
+    def test_copy_on_write(self):
+        """A cópia compartilha tudo até a primeira transformação de um dos dois"""
+        cube = Cube()
+        cube.translate(1, 0, 0)
+        clone = cube.copy()
+        assert isinstance(clone, Cube)
+        assert clone.mesh is cube.mesh
+        assert clone.transform is cube.transform
+
+        clone.rotate_y(90)
+        assert clone.transform is not cube.transform
+        assert np.allclose(cube.bounding_center, [1, 0, 0])
+        assert np.allclose(clone.bounding_center, [1, 0, 0], atol=1e-6)
+        assert not np.allclose(clone.model_matrix, cube.model_matrix)
+
+        cube.translate(0, 1, 0)
+        assert np.allclose(cube.bounding_center, [1, 1, 0])
+        assert np.allclose(clone.bounding_center, [1, 0, 0], atol=1e-6)
+
+    def test_snapshot_keeps_original_transform(self):
+        """snapshot() não obriga o original a copiar a transformação (nem o histórico)"""
+        cube = Cube()
+        for _ in range(100):
+            cube.rotate_y(1, animated=True)
+        transform = cube.transform
+        vertices = cube.vertices
+
+        frozen = cube.snapshot()
+        assert frozen.mesh is cube.mesh
+        assert frozen.vertices is vertices
+        assert frozen.transform.get_animation_history() == []
+
+        cube.rotate_y(1, animated=True)
+        assert cube.transform is transform
+        assert not np.allclose(frozen.model_matrix, cube.model_matrix)
+
+        frozen.rotate_y(5)
+        assert cube.transform.get_history() == []
@@ -0,0 +1,30 @@
+"""
+Testes para o acumulador de passo fixo
+"""
+
+import pytest
+from src.utils.time_utils import FixedTimestep
+
+
+class TestFixedTimestep:
+    """Simulação independente do FPS"""
+
+    @pytest.mark.parametrize('fps', [30, 60, 144])
+    def test_same_simulation_at_any_frame_rate(self, fps):
+        """Um segundo de frames produz 60 passos, qualquer que seja o FPS"""
+        timestep = FixedTimestep(rate=60)
+        for _ in range(fps):
+            timestep.advance(1.0 / fps)
+        assert timestep.steps_taken + timestep.alpha == pytest.approx(60.0)
+
+    def test_alpha_is_remaining_fraction(self):
+        """O que sobra no acumulador vira o fator de interpolação"""
+        timestep = FixedTimestep(rate=10)
+        assert timestep.advance(0.25) == 2
+        assert timestep.alpha == pytest.approx(0.5)
+
+    def test_long_frames_are_clamped(self):
+        """Depois de um travamento, no máximo max_steps passos são simulados"""
+        timestep = FixedTimestep(rate=60, max_steps=5)
+        assert timestep.advance(2.0) == 5
+        assert timestep.advance(1.0 / 60) == 1
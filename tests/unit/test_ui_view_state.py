@@ -0,0 +1,50 @@
+"""
+Testes para o resumo da aparência do menu e do tutorial (redesenho sob demanda)
+"""
+
+import pygame
+from src.ui.menu import Menu, MenuState
+from src.ui.tutorial import Tutorial
+
+pygame.font.init()
+
+
+class TestMenuViewState:
+    """A aparência do menu só muda com hover, clique ou troca de tela"""
+
+    def test_same_mouse_same_view(self):
+        """Atualizar com o mouse parado não muda a aparência"""
+        menu = Menu(1280, 720)
+        menu.update((0, 0), (False, False, False))
+        view = menu.view_state()
+        menu.update((0, 0), (False, False, False))
+        assert menu.view_state() == view
+
+    def test_hover_changes_view(self):
+        """Passar o mouse sobre um botão muda a aparência"""
+        menu = Menu(1280, 720)
+        menu.update((0, 0), (False, False, False))
+        view = menu.view_state()
+        menu.update(menu.buttons['main_play'].rect.center, (False, False, False))
+        assert menu.view_state() != view
+
+    def test_state_changes_view(self):
+        """Trocar de tela muda a aparência"""
+        menu = Menu(1280, 720)
+        view = menu.view_state()
+        menu.set_state(MenuState.PAUSE)
+        assert menu.view_state() != view
+
+
+class TestTutorialViewState:
+    """A aparência do tutorial muda com a página e com o hover dos botões"""
+
+    def test_page_and_hover(self):
+        """Página e botão sob o mouse entram no resumo"""
+        tutorial = Tutorial(1280, 720)
+        view = tutorial.view_state((0, 0))
+        assert tutorial.view_state((0, 0)) == view
+        assert tutorial.view_state(tutorial.back_button_rect.center) != view
+
+        tutorial.current_page = 1
+        assert tutorial.view_state((0, 0)) != view